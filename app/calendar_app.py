@@ -1,14 +1,23 @@
 import tkinter as tk
 from tkinter import ttk
+from tkinter import font as tkfont
 from tkinter import messagebox
 
-import calendar
 import datetime
-from typing import List
+import os
+import threading
+import time
+from typing import Callable, List, Optional
 
-from utils import is_sunday, is_today
-
-from holiday_store import HolidayStore
+from core import HolidayStore, theme
+from core.month_view import CELL_EMPTY, MonthViewCache
+from core.notes import open_notes
+from core import instrumentation
+from core.instrumentation import hot_path
+from core.regions import RegionHolidays, RegionOverlay
+from core.timing import PhaseTimer
+from week_view import WeekScrollView
+from year_view import YearView
 
 class Calendar:
     """    
@@ -21,70 +30,205 @@ class Calendar:
         current_month (int): Currently displayed month (1-12)
         current_year (int): Currently displayed year
         holiday_store (HolidayStore): Holiday data management instance
+        month_cache (MonthViewCache): Cache of classified month grids
+        view_mode (str): "month" for the month grid, "year" for the year overview,
+                         "weeks" for the endless list of weeks
+        region_holidays (RegionHolidays): Holidays of additional regions, if any
+        notes (Optional[NoteStore]): Notes of the days, None if notes are disabled
+        startup_timer (PhaseTimer): Timings of the startup phases
         day_names (List[str]): Slovenian day names for calendar headers
         month_names (List[str]): Slovenian month names for navigation
     """
     
-    # Color palette
-    COLOR_PRIMARY = "#6366F1"        # Modern indigo
-    COLOR_PRIMARY_LIGHT = "#8B5CF6"  # Light purple
-    COLOR_SECONDARY = "#06B6D4"      # Cyan
-    COLOR_BACKGROUND = "#F8FAFC"     # Light gray background
-    COLOR_SURFACE = "#FFFFFF"        # White surface
-    COLOR_SURFACE_VARIANT = "#F1F5F9" # Light gray variant
-    COLOR_ON_SURFACE = "#1E293B"     # Dark text
-    COLOR_ON_SURFACE_VARIANT = "#64748B" # Gray text
-    COLOR_SUNDAY_BG = "#FEF3C7"      # Soft yellow
-    COLOR_HOLIDAY_BG = "#FEE2E2"     # Soft red
-    COLOR_TODAY_BG = "#DBEAFE"       # Soft blue
-    COLOR_HOVER = "#E2E8F0"          # Light hover
-    COLOR_SHADOW = "#E2E8F0"         # Shadow color
+    # Color palette, shared with the offscreen renderer (see core.theme)
+    COLOR_PRIMARY = theme.COLOR_PRIMARY
+    COLOR_PRIMARY_LIGHT = theme.COLOR_PRIMARY_LIGHT
+    COLOR_SECONDARY = theme.COLOR_SECONDARY
+    COLOR_BACKGROUND = theme.COLOR_BACKGROUND
+    COLOR_SURFACE = theme.COLOR_SURFACE
+    COLOR_SURFACE_VARIANT = theme.COLOR_SURFACE_VARIANT
+    COLOR_ON_SURFACE = theme.COLOR_ON_SURFACE
+    COLOR_ON_SURFACE_VARIANT = theme.COLOR_ON_SURFACE_VARIANT
+    COLOR_SUNDAY_BG = theme.COLOR_SUNDAY_BG
+    COLOR_HOLIDAY_BG = theme.COLOR_HOLIDAY_BG
+    COLOR_TODAY_BG = theme.COLOR_TODAY_BG
+    COLOR_HOVER = theme.COLOR_HOVER
+    COLOR_SHADOW = theme.COLOR_SHADOW
+    
+    # How often the holidays file is checked for changes
+    HOLIDAY_POLL_MS = 2000
+    
+    # One holidays file per region, shown as selectable overlays
+    REGIONS_DIR = "./assets/regions"
+    
+    # While navigation input keeps arriving faster than this (e.g. a held
+    # key), only the title follows it and the grid is painted once it settles
+    NAV_SETTLE_MS = 80
+    
+    # How often the main thread checks whether background loading finished
+    LOAD_POLL_MS = 15
+    
+    # Refresh interval of the F12 debug overlay
+    DEBUG_REFRESH_MS = 500
     
-    def __init__(self):
+    # Weeks scrolled per mouse-wheel step in the week list
+    WHEEL_WEEKS = 2
+    
+    # Characters of the first note shown in a day cell
+    NOTE_PREVIEW_CHARS = 10
+    
+    def __init__(self, startup_timer: Optional[PhaseTimer] = None,
+                 on_ready: Optional[Callable[["Calendar"], None]] = None,
+                 notes_file: Optional[str] = None):
         """
         Initialize the Calendar application.
         
-        Sets up the main window, initializes date variables, loads holiday data,
-        defines localized day/month names, creates the UI widgets, and displays
-        the current month's calendar.
+        The window shell is built and painted first: the month grid is shown
+        with Sundays and today marked, while the holidays (and regions) are
+        loaded on a background thread. Holiday highlighting is applied as
+        soon as loading completes.
+        
+        Args:
+            startup_timer (Optional[PhaseTimer]): Receives the startup phase timings
+            on_ready (Optional[Callable]): Called with the application once the
+                                           holidays are loaded and displayed
+            notes_file (Optional[str]): SQLite file with the notes of the days,
+                                        None disables notes
         """
-        self.root = tk.Tk()
-        self.setup_window()
+        self.startup_timer = startup_timer or PhaseTimer()
+        self.on_ready = on_ready
+        timer = self.startup_timer
+        
+        with timer.phase("window"):
+            self.root = tk.Tk()
+            self.setup_window()
+        with timer.phase("styles"):
+            self.setup_styles()
         
         self.current_month = datetime.datetime.now().month
         self.current_year = datetime.datetime.now().year
+        self.view_mode = "month"
+        self._update_pending = None
+        self._last_step = 0.0
+        self.debug_overlay = None
+        self._window_title = None
+        
+        # Empty until the background load completes
+        self.holiday_store = HolidayStore(holidays_file="./assets/holidays.txt",
+                                          use_snapshot=True, load=False)
+        self.month_cache = MonthViewCache(self.holiday_store)
+        self.region_holidays = None
+        # Only the shown month's notes are read, edits are written in the background
+        self.notes, self._notes_error = open_notes(notes_file)
         
-        self.holiday_store = HolidayStore(holidays_file="./assets/holidays.txt")
+        self.day_names:List[str] = list(theme.DAY_NAMES)
         
-        self.day_names:List[str] = ["Pon", "Tor", "Sre", "Čet", "Pet", "Sob", "Ned"]
+        self.month_names = list(theme.MONTH_NAMES)
         
-        self.month_names = [
-            "Januar", "Februar", "Marec", "April", "Maj", "Junij",
-            "Julij", "Avgust", "September", "Oktober", "November", "December"
-        ]
+        self._loader = threading.Thread(target=self.load_data, name="holiday-loader",
+                                        daemon=True)
+        self._loader.start()
         
-        self.create_widgets()
+        with timer.phase("widgets"):
+            self.create_widgets()
+            self.bind_navigation()
+            self.root.bind('<F12>', self.toggle_debug_overlay)
+        with timer.phase("first_render"):
+            self.update_calendar()
+        self.root.after_idle(timer.mark, "first_paint")
+        self.schedule_midnight_rollover()
+        
+        self.root.after(self.LOAD_POLL_MS, self.check_data_loaded)
+        
+    def load_data(self):
+        """
+        Load holidays and region files; runs on the background loader thread.
+        
+        Touches no Tk objects, the main thread picks up the result in
+        check_data_loaded().
+        """
+        with self.startup_timer.phase("load_holidays"):
+            self.holiday_store.load_holidays()
+        if os.path.isdir(self.REGIONS_DIR):
+            with self.startup_timer.phase("load_regions"):
+                self.region_holidays = RegionHolidays.from_directory(self.REGIONS_DIR)
+                
+    def check_data_loaded(self):
+        """
+        Apply the loaded holidays once the background loader is done.
+        
+        Reschedules itself every LOAD_POLL_MS milliseconds until then, and
+        afterwards starts watching the holidays file for changes.
+        """
+        if self._loader.is_alive():
+            self.root.after(self.LOAD_POLL_MS, self.check_data_loaded)
+            return
+        
+        with self.startup_timer.phase("apply_holidays"):
+            if self.region_holidays is not None and self.region_holidays.regions:
+                self.create_region_menu(self.month_year_frame)
+            self.update_calendar()
+        self.root.after_idle(self.startup_complete)
+        self.show_holiday_errors()
+        self.show_region_errors()
+        if self._notes_error is not None:
+            messagebox.showerror("Napaka", self._notes_error)
+        
+        self.root.after(self.HOLIDAY_POLL_MS, self.poll_holidays)
+        
+    def schedule_midnight_rollover(self):
+        """
+        Schedule a redraw right after the next midnight.
+        
+        The "today" highlight moves to the new day without polling the clock.
+        """
+        now = datetime.datetime.now()
+        midnight = datetime.datetime.combine(now.date() + datetime.timedelta(days=1),
+                                             datetime.time.min)
+        delay_ms = int((midnight - now).total_seconds() * 1000) + 50
+        self.root.after(delay_ms, self.on_midnight)
+        
+    def on_midnight(self):
+        """
+        Redraw with the new date and schedule the next rollover.
+        """
         self.update_calendar()
+        self.schedule_midnight_rollover()
+        
+    def startup_complete(self):
+        """
+        Record the end of startup and notify on_ready.
+        """
+        self.startup_timer.mark("ready")
+        if self.on_ready is not None:
+            self.on_ready(self)
         
     def setup_window(self):
         """
-        Configure the main application window and ttk styles.
+        Configure the main application window.
         
-        Sets up window properties (title, size, position), configures ttk themes
-        and styles for various UI components including buttons, labels, entries,
-        and comboboxes. Also defines hover effects and state-based styling.
+        Sets up window properties (title, size, position). The position is
+        computed from the screen size, so no idle tasks have to run first.
         """
         self.root.title("Koledar")
-        self.root.geometry("800x600")
         self.root.resizable(True, True)
         self.root.configure(bg=self.COLOR_BACKGROUND)
         
         # Center the window
-        self.root.update_idletasks()
         x = (self.root.winfo_screenwidth() // 2) - (800 // 2)
         y = (self.root.winfo_screenheight() // 2) - (600 // 2)
         self.root.geometry(f"800x600+{x}+{y}")
         
+        # Set minimum window size
+        self.root.minsize(800, 600)
+        
+    def setup_styles(self):
+        """
+        Configure ttk themes and styles.
+        
+        Configures styles for various UI components including buttons, labels,
+        entries, and comboboxes. Also defines hover effects and state-based styling.
+        """
         # Configure style
         style = ttk.Style()
         style.theme_use('clam')
@@ -163,9 +307,6 @@ class Calendar:
                             ('active', self.COLOR_PRIMARY),
                             ('focus', self.COLOR_PRIMARY)])
         
-        # Set minimum window size
-        self.root.minsize(800, 600)
-        
     def create_widgets(self):
         """
         Create and configure all UI widgets for the calendar application.
@@ -200,6 +341,7 @@ class Calendar:
         # Month and Year controls (left side)
         month_year_frame = ttk.Frame(controls_frame, style='Nav.TFrame')
         month_year_frame.grid(row=0, column=0, sticky=tk.W)
+        self.month_year_frame = month_year_frame
         
         # Month selection
         ttk.Label(month_year_frame, text="Mesec:", style='Nav.TLabel').grid(row=0, column=0, padx=(0, 8), pady=(0, 2))
@@ -249,6 +391,12 @@ class Calendar:
                                 style='NavTitle.TLabel')
         title_label.grid(row=0, column=1, padx=10)
         
+        self.view_button = ttk.Button(title_section, text="Leto", command=self.toggle_view,
+                                      style='Modern.TButton', cursor='hand2')
+        self.view_button.grid(row=0, column=2, padx=(10, 0))
+        self.weeks_button = ttk.Button(title_section, text="Tedni", command=self.toggle_weeks,
+                                       style='Modern.TButton', cursor='hand2')
+        self.weeks_button.grid(row=0, column=3, padx=(6, 0))
         
         # Calendar container
         calendar_container = ttk.Frame(main_frame, style='Modern.TFrame')
@@ -263,6 +411,10 @@ class Calendar:
         self.calendar_frame = tk.Frame(calendar_container, bg=self.COLOR_SURFACE, 
                                         relief='flat', borderwidth=0)
         self.calendar_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.calendar_container = calendar_container
+        # Created on first use of the year overview and the week list
+        self.year_view = None
+        self.week_view = None
         
         # Configure calendar grid
         for i in range(7):
@@ -272,6 +424,303 @@ class Calendar:
     
         self.create_calendar_grid()
         
+    def show_holiday_errors(self):
+        """
+        Report problems found while loading the holidays file.
+        
+        The core HolidayStore only collects errors, displaying them is up
+        to the view. All problems are shown in a single summary dialog.
+        """
+        report = self.holiday_store.report
+        if not report.ok:
+            messagebox.showerror("Napaka", report.summary())
+            
+    def show_region_errors(self):
+        """
+        Report problems found while loading the region files.
+        
+        Region files are loaded once at startup, so this is called once,
+        after show_holiday_errors().
+        """
+        if self.region_holidays is not None and self.region_holidays.errors:
+            messagebox.showerror("Napaka", self.region_holidays.summary())
+            
+    def create_region_menu(self, parent):
+        """
+        Create the menu for overlaying holidays of additional regions.
+        
+        Every region gets a checkbox; the match mode decides whether a day
+        is marked when any or only when all selected regions have a holiday.
+        
+        Args:
+            parent: Frame the menu button is placed in
+        """
+        self.region_vars = {}
+        self.region_match_var = tk.StringVar(value="any")
+        
+        region_button = ttk.Menubutton(parent, text="Regije")
+        region_button.grid(row=0, column=4, padx=(20, 0), pady=(0, 2))
+        region_menu = tk.Menu(region_button, tearoff=False)
+        region_button['menu'] = region_menu
+        
+        region_menu.add_radiobutton(label="Katera koli izbrana regija", value="any",
+                                    variable=self.region_match_var,
+                                    command=self.on_regions_changed)
+        region_menu.add_radiobutton(label="Vse izbrane regije", value="all",
+                                    variable=self.region_match_var,
+                                    command=self.on_regions_changed)
+        region_menu.add_separator()
+        
+        for name in self.region_holidays.regions:
+            var = tk.BooleanVar(value=False)
+            region_menu.add_checkbutton(label=name, variable=var,
+                                        command=self.on_regions_changed)
+            self.region_vars[name] = var
+            
+    def on_regions_changed(self):
+        """
+        Overlay holidays of the selected regions on the calendar.
+        """
+        selected = [name for name, var in self.region_vars.items() if var.get()]
+        if selected:
+            source = RegionOverlay(self.holiday_store, self.region_holidays,
+                                   selected, self.region_match_var.get())
+        else:
+            source = self.holiday_store
+        self.month_cache.set_holiday_store(source)
+        self.update_calendar()
+        
+    def poll_holidays(self):
+        """
+        Pick up changes to the holidays file while the application is running.
+        
+        The store re-parses only the changed lines. The calendar is redrawn
+        only if the change touches the displayed month. Notes that failed to
+        be written are reported here too. Reschedules itself every
+        HOLIDAY_POLL_MS milliseconds.
+        """
+        change = self.holiday_store.check_for_changes()
+        if change is not None:
+            self.show_holiday_errors()
+            if self.view_mode == "year":
+                shown = [(self.current_year, month) for month in range(1, 13)]
+            elif self.view_mode == "weeks":
+                shown = self.week_view.visible_months()
+            else:
+                shown = [(self.current_year, self.current_month)]
+            if any(change.affects(year, month) for year, month in shown):
+                self.update_calendar()
+        
+        if self.notes is not None:
+            errors = self.notes.take_errors()
+            if errors:
+                messagebox.showerror("Napaka", "\n".join(errors))
+        
+        self.root.after(self.HOLIDAY_POLL_MS, self.poll_holidays)
+        
+    def edit_notes(self, row: int, col: int):
+        """
+        Open the note editor for a day cell of the month grid.
+        
+        Every line of the editor is one note; saving returns at once, the
+        notes are written to disk in the background.
+        
+        Args:
+            row (int): Week row of the cell (0-5)
+            col (int): Day column of the cell (0-6)
+        """
+        if self.notes is None:
+            return
+        year, month = self.current_year, self.current_month
+        day = self.month_cache.get(year, month).cells[row][col][0]
+        if not day:
+            return
+        
+        dialog = tk.Toplevel(self.root)
+        dialog.title(f"Zapiski {day:02d}.{month:02d}.{year}")
+        dialog.configure(bg=self.COLOR_SURFACE)
+        dialog.transient(self.root)
+        ttk.Label(dialog, text="Vsaka vrstica je en zapisek ali dogodek:",
+                  style='Modern.TLabel').grid(row=0, column=0, columnspan=2, sticky=tk.W,
+                                              padx=12, pady=(12, 6))
+        text = tk.Text(dialog, width=40, height=8, font=('Segoe UI', 11), wrap='word',
+                       relief='flat', borderwidth=1, highlightthickness=1,
+                       highlightbackground=self.COLOR_SHADOW)
+        text.grid(row=1, column=0, columnspan=2, padx=12, sticky=(tk.W, tk.E, tk.N, tk.S))
+        text.insert("1.0", "\n".join(self.notes.day_notes(year, month, day)))
+        
+        def save():
+            self.notes.set_day(year, month, day, text.get("1.0", "end").splitlines())
+            dialog.destroy()
+            self.update_calendar()
+        
+        ttk.Button(dialog, text="Shrani", command=save, style='Primary.TButton',
+                   cursor='hand2').grid(row=2, column=0, sticky=tk.E, padx=(12, 6), pady=12)
+        ttk.Button(dialog, text="Prekliči", command=dialog.destroy, style='Modern.TButton',
+                   cursor='hand2').grid(row=2, column=1, sticky=tk.W, padx=(6, 12), pady=12)
+        dialog.bind('<Escape>', lambda e: dialog.destroy())
+        dialog.grab_set()
+        text.focus_set()
+        
+    def cell_text(self, day: int, notes: tuple) -> str:
+        """
+        Get the text of a day cell: the day number and a preview of its notes.
+        
+        Args:
+            day (int): Day of the month, 0 for an empty cell
+            notes (tuple): Notes of the day, empty if there are none
+        
+        Returns:
+            str: Text of the cell
+        """
+        if not day:
+            return ""
+        if not notes:
+            return str(day)
+        preview = notes[0]
+        if len(preview) > self.NOTE_PREVIEW_CHARS:
+            preview = preview[:self.NOTE_PREVIEW_CHARS - 1].rstrip() + "…"
+        if len(notes) > 1:
+            preview += f" +{len(notes) - 1}"
+        return f"{day}\n{preview}"
+        
+    def bind_navigation(self):
+        """
+        Bind keyboard and mouse-wheel month stepping.
+        
+        PageUp/PageDown and Left/Right step by one month (one year in the
+        year overview), Up/Down step by one year, the mouse wheel steps by
+        one month (scrolls a few weeks in the week list). Keys typed into
+        entry fields are left to the fields.
+        """
+        for sequence, months in (('<Prior>', -1), ('<Next>', 1),
+                                 ('<Left>', -1), ('<Right>', 1)):
+            self.root.bind(sequence, lambda e, m=months: self.on_navigation_key(e, m))
+        for sequence, months in (('<Up>', -12), ('<Down>', 12)):
+            self.root.bind(sequence, lambda e, m=months: self.on_navigation_key(e, m, True))
+        
+        # Windows and macOS report the wheel as <MouseWheel>, X11 as buttons 4 and 5
+        self.root.bind('<MouseWheel>', self.on_mouse_wheel)
+        self.root.bind('<Button-4>', lambda e: self.on_navigation_key(e, -1, wheel=True))
+        self.root.bind('<Button-5>', lambda e: self.on_navigation_key(e, 1, wheel=True))
+        
+    def toggle_debug_overlay(self, event=None):
+        """
+        Show or hide the overlay with call counters and timings.
+        
+        The counters are only collected when the application was started
+        with --profile, otherwise the overlay says so.
+        
+        Args:
+            event: tkinter event object (optional, defaults to None)
+        """
+        if self.debug_overlay is not None:
+            self.root.after_cancel(self._debug_refresh)
+            self.debug_overlay.destroy()
+            self.debug_overlay = None
+            return
+        self.debug_overlay = tk.Label(self.root, justify='left', anchor='nw',
+                                      font=('Courier New', 9), bg=self.COLOR_ON_SURFACE,
+                                      fg=self.COLOR_SURFACE, padx=8, pady=6)
+        self.debug_overlay.place(relx=1.0, rely=0.0, anchor='ne')
+        self.refresh_debug_overlay()
+        
+    def refresh_debug_overlay(self):
+        """
+        Update the debug overlay, reschedules itself while it is shown.
+        """
+        if instrumentation.is_enabled():
+            text = instrumentation.report()
+        else:
+            text = "Merjenje ni vklopljeno (zaženi z --profile)"
+        self.debug_overlay.configure(text=f"{text}\n\nrazličica praznikov: "
+                                          f"{self.holiday_store.version}")
+        self._debug_refresh = self.root.after(self.DEBUG_REFRESH_MS,
+                                              self.refresh_debug_overlay)
+        
+    @hot_path()
+    def on_navigation_key(self, event, months: int, whole_years: bool = False,
+                          wheel: bool = False):
+        """
+        Handle a navigation key or wheel step.
+        
+        Args:
+            event: tkinter event object
+            months (int): Months to move
+            whole_years (bool): True if the step is already in whole years
+            wheel (bool): True if the step comes from the mouse wheel
+        """
+        if isinstance(event.widget, (tk.Entry, ttk.Entry)):
+            return
+        if self.view_mode == "weeks":
+            if wheel:
+                self.week_view.scroll_by(months * self.WHEEL_WEEKS)
+            else:
+                self.week_view.scroll_months(months)
+            return "break"
+        if self.view_mode == "year" and not whole_years:
+            months *= 12
+        self.step_month(months)
+        return "break"
+        
+    @hot_path()
+    def on_mouse_wheel(self, event):
+        """
+        Handle a mouse-wheel event reported with a delta.
+        
+        Args:
+            event: tkinter event object
+        """
+        if event.delta:
+            return self.on_navigation_key(event, -1 if event.delta > 0 else 1, wheel=True)
+        
+    @hot_path()
+    def step_month(self, months: int):
+        """
+        Move the displayed month and schedule a redraw.
+        
+        The title follows every step right away; the grid is redrawn through
+        schedule_update(), so a burst of steps paints only its final month.
+        
+        Args:
+            months (int): Months to move, negative to go back
+        """
+        index = self.current_year * 12 + self.current_month - 1 + months
+        year, month = divmod(index, 12)
+        if not datetime.MINYEAR <= year <= datetime.MAXYEAR:
+            return
+        self.current_year = year
+        self.current_month = month + 1
+        self._last_step = time.monotonic()
+        self.update_title()
+        self.schedule_update()
+        
+    def schedule_update(self):
+        """
+        Redraw the calendar once the event queue is idle.
+        
+        Any number of calls before the redraw result in a single
+        update_calendar() for the latest month.
+        """
+        if self._update_pending is None:
+            self._update_pending = self.root.after_idle(self._flush_update)
+            
+    def _flush_update(self):
+        """
+        Run a scheduled redraw, or postpone it while steps keep coming.
+        """
+        elapsed_ms = (time.monotonic() - self._last_step) * 1000
+        if elapsed_ms < self.NAV_SETTLE_MS:
+            self._update_pending = self.root.after(int(self.NAV_SETTLE_MS - elapsed_ms) + 1,
+                                                   self._flush_update)
+            return
+        self._update_pending = None
+        try:
+            self.update_calendar()
+        except Exception as e:
+            # Raised from an after() callback, nothing above would report it
+            messagebox.showerror("Napaka", f"Napaka pri prikazu koledarja: {e}")
+        
     def clear_placeholder(self, event):
         """
         Clear placeholder text when entry widget receives focus.
@@ -292,6 +741,7 @@ class Calendar:
         if not event.widget.get():
             event.widget.insert(0, "DD.MM.YYYY")
         
+    @hot_path()
     def on_month_changed(self, event=None):
         """
         Handle month selection change from the combobox.
@@ -306,10 +756,11 @@ class Calendar:
             month_name = self.month_var.get()
             if month_name in self.month_names:
                 self.current_month = self.month_names.index(month_name) + 1
-                self.update_calendar()
+                self.schedule_update()
         except Exception as e:
             messagebox.showerror("Napaka", f"Napaka pri spremembi meseca: {e}")
             
+    @hot_path()
     def on_year_changed(self, event=None):
         """
         Handle year input change from the entry widget.
@@ -322,12 +773,20 @@ class Calendar:
         """
         try:
             year = self.year_var.get()
-            if year:
-                self.current_year = year
-                self.update_calendar()
-        except Exception as e:
-            messagebox.showerror("Napaka", f"Napaka pri spremembi leta: {e}")
+        except tk.TclError:
+            messagebox.showerror("Napaka", "Leto mora biti celo število")
+            self.year_var.set(self.current_year)
+            return
+        # The redraw runs later from the event loop, so check the year here
+        if not datetime.MINYEAR <= year <= datetime.MAXYEAR:
+            messagebox.showerror("Napaka", f"Leto mora biti med {datetime.MINYEAR} "
+                                           f"in {datetime.MAXYEAR}")
+            self.year_var.set(self.current_year)
+            return
+        self.current_year = year
+        self.schedule_update()
             
+    @hot_path()
     def jump_to_date(self, event=None):
         """
         Jump to a specific date entered by the user.
@@ -362,7 +821,7 @@ class Calendar:
             # Set new month and year
             self.current_month = month
             self.current_year = year
-            self.update_calendar()
+            self.schedule_update()
             
             # Clear the jump date field and restore placeholder
             self.jump_date_var.set("DD.MM.YYYY")
@@ -395,24 +854,170 @@ class Calendar:
                         padx=1, pady=(0, 2))
             self.day_headers.append(header)
         
+        # Shared fonts, so cells don't re-resolve font tuples on every redraw
+        self.cell_font = tkfont.Font(root=self.root, family='Segoe UI', size=13)
+        self.cell_font_bold = tkfont.Font(root=self.root, family='Segoe UI', size=13,
+                                          weight='bold')
+        
+        # (bg, fg, font) for each cell classification
+        self.cell_styles = {
+            kind: (bg, fg, self.cell_font_bold if bold else self.cell_font)
+            for kind, (bg, fg, bold) in theme.CELL_COLORS.items()
+        }
+        
         # Create cells for days
         self.day_cells = []
+        # Last applied (text, bg, fg, font) of every cell
+        self.cell_states = []
         # 6 weeks, because day can start on sunday
         for row in range(1, 7):
             week_cells = []
+            week_states = []
             # 7 days in a week
             for col in range(7):
                 cell = tk.Label(self.calendar_frame, text="", 
-                                font=('Segoe UI', 13),
+                                font=self.cell_font,
                                 bg=self.COLOR_SURFACE, fg=self.COLOR_ON_SURFACE,
                                 relief='flat', borderwidth=0, width=8, height=4,
                                 )
                 cell.grid(row=row, column=col, sticky=(tk.W, tk.E, tk.N, tk.S), 
                             padx=1, pady=1)
+                cell.bind('<Double-Button-1>',
+                          lambda e, r=row - 1, c=col: self.edit_notes(r, c))
                 
                 week_cells.append(cell)
+                week_states.append(("",) + self.cell_styles[CELL_EMPTY])
             self.day_cells.append(week_cells)
+            self.cell_states.append(week_states)
+        
+    def set_view_mode(self, mode: str):
+        """
+        Show the month grid, the year overview or the week list.
+        
+        Args:
+            mode (str): "month", "year" or "weeks"
+        """
+        if mode == "year" and self.year_view is None:
+            self.create_year_view()
+        if mode == "weeks" and self.week_view is None:
+            self.create_week_view()
+        
+        views = {"month": self.calendar_frame, "year": self.year_view,
+                 "weeks": self.week_view}
+        views[self.view_mode].grid_remove()
+        self.view_mode = mode
+        if mode == "month":
+            self.calendar_frame.grid()
+        else:
+            views[mode].grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
+        self.view_button.configure(text="Mesec" if mode == "year" else "Leto")
+        self.weeks_button.configure(text="Mesec" if mode == "weeks" else "Tedni")
+        self.update_calendar()
+        
+    def toggle_view(self):
+        """
+        Switch between the month grid and the year overview.
+        """
+        self.set_view_mode("month" if self.view_mode == "year" else "year")
+        
+    def toggle_weeks(self):
+        """
+        Switch between the month grid and the week list.
+        """
+        self.set_view_mode("month" if self.view_mode == "weeks" else "weeks")
+        
+    def create_year_view(self):
+        """
+        Create the canvas with the overview of all twelve months.
+        
+        Uses the same colors as the month grid; clicking a month opens it.
+        """
+        styles = {kind: (bg, fg) for kind, (bg, fg, _) in self.cell_styles.items()}
+        self.year_view = YearView(self.calendar_container, self.month_cache,
+                                  self.month_names, self.day_names, styles,
+                                  background=self.COLOR_SURFACE,
+                                  title_color=self.COLOR_PRIMARY,
+                                  header_color=self.COLOR_ON_SURFACE_VARIANT,
+                                  on_month_click=self.open_month)
+        
+    def create_week_view(self):
+        """
+        Create the endless week list with its pool of row widgets.
+        
+        Uses the same colors and fonts as the month grid.
+        """
+        self.week_view = WeekScrollView(self.calendar_container, self.month_cache,
+                                        self.month_names, self.day_names, self.cell_styles,
+                                        surface=self.COLOR_SURFACE,
+                                        header_bg=self.COLOR_PRIMARY,
+                                        label_color=self.COLOR_PRIMARY,
+                                        label_font=('Segoe UI', 9, 'bold'),
+                                        header_font=('Segoe UI', 12, 'bold'),
+                                        on_scroll=self.on_weeks_scrolled)
+        
+    def on_weeks_scrolled(self, year: int, month: int):
+        """
+        Follow the month at the top of the week list in the controls and title.
+        
+        Args:
+            year (int): Year of the month at the top
+            month (int): Month (1-12) at the top
+        """
+        self.current_year = year
+        self.current_month = month
+        self.update_title()
+        
+    def open_month(self, year: int, month: int):
+        """
+        Show a month clicked in the year overview.
+        
+        Args:
+            year (int): Year of the month
+            month (int): Month (1-12)
+        """
+        self.current_year = year
+        self.current_month = month
+        self.set_view_mode("month")
+        
+    def update_title(self):
+        """
+        Show the current month and year in the controls and the title.
+        """
+        self.month_var.set(self.month_names[self.current_month - 1])
+        self.year_var.set(self.current_year)
+        
+        if self.view_mode == "year":
+            self.title_var.set(str(self.current_year))
+        else:
+            self.title_var.set(f"{self.month_names[self.current_month - 1]} {self.current_year}")
+        
+    def update_window_title(self, today: datetime.date):
+        """
+        Show the next holiday in the window title.
+        
+        The title uses the same holidays as the grid, so selected regions
+        (see on_regions_changed()) count too.
+        
+        Args:
+            today (datetime.date): Current date
+        """
+        source = self.month_cache.holiday_store
+        title = "Koledar"
+        if source.is_holiday(today.day, today.month, today.year):
+            title += " — danes je praznik"
+        else:
+            upcoming = source.next_holiday(today)
+            if upcoming is not None:
+                days = (upcoming - today).days
+                title += (f" — naslednji praznik: {upcoming.strftime('%d.%m.%Y')} "
+                          f"(čez {days} {'dan' if days == 1 else 'dni'})")
+        
+        if title != self._window_title:
+            self.root.title(title)
+            self._window_title = title
+        
+    @hot_path()
     def update_calendar(self):
         """
         Update the calendar display with current month and year data.
@@ -420,8 +1025,10 @@ class Calendar:
         Refreshes the calendar by:
         - Updating month/year controls with current values
         - Updating the title display
-        - Clearing all existing date cells
-        - Populating cells with current month's days
+        - Taking the classified month from the month cache, and its notes
+          (one query per month, cached) if notes are enabled
+        - Populating cells with current month's days, reconfiguring only
+          the cells whose text or styling differs from the last redraw
         - Applying appropriate styling based on date type:
           * Today's date: highlighted in blue
           * Holidays: highlighted in red
@@ -429,48 +1036,38 @@ class Calendar:
           * Regular days: default styling
         """
         
-        self.month_var.set(self.month_names[self.current_month - 1])
-        self.year_var.set(self.current_year)
+        self.update_title()
         
-        # Update title
-        self.title_var.set(f"{self.month_names[self.current_month - 1]} {self.current_year}")
+        # One clock read per render, so all cells agree on the date
+        today = datetime.date.today()
+        self.update_window_title(today)
         
-        # Clear all cells
-        for week in self.day_cells:
-            for cell in week:
-                cell.config(text="", bg=self.COLOR_SURFACE, 
-                            fg=self.COLOR_ON_SURFACE)
+        if self.view_mode == "year":
+            self.year_view.show(self.current_year, today)
+            return
+        if self.view_mode == "weeks":
+            self.week_view.show(self.current_year, self.current_month, today)
+            return
         
-        month_days = calendar.monthcalendar(self.current_year, self.current_month)
+        view = self.month_cache.get(self.current_year, self.current_month, today)
+        notes = (self.notes.month_notes(self.current_year, self.current_month)
+                 if self.notes is not None else {})
         
-        for week_idx, week in enumerate(month_days):
-            if week_idx >= len(self.day_cells):
-                break
-                
-            for day_idx, day in enumerate(week):
-                if day == 0:
-                    continue # Empty day
-                
-                cell = self.day_cells[week_idx][day_idx]
-                cell.config(text=str(day))
-                
+        for week_idx, week in enumerate(view.cells):
+            states = self.cell_states[week_idx]
+            for day_idx, (day, kind) in enumerate(week):
                 # Color cells based on the day
-                if is_today(day, self.current_month, self.current_year):
-                    cell.config(bg=self.COLOR_TODAY_BG, 
-                                fg=self.COLOR_ON_SURFACE, 
-                                font=('Segoe UI', 13, 'bold'))
-                elif self.holiday_store.is_holiday(day, self.current_month, self.current_year):
-                    cell.config(bg=self.COLOR_HOLIDAY_BG, 
-                                fg=self.COLOR_ON_SURFACE,
-                                font=('Segoe UI', 13, 'bold'))
-                elif is_sunday(day, self.current_month, self.current_year):
-                    cell.config(bg=self.COLOR_SUNDAY_BG, 
-                                fg=self.COLOR_ON_SURFACE_VARIANT,
-                                font=('Segoe UI', 13))
-                else:
-                    cell.config(bg=self.COLOR_SURFACE, 
-                                fg=self.COLOR_ON_SURFACE,
-                                font=('Segoe UI', 13))
+                state = (self.cell_text(day, notes.get(day, ())),) + self.cell_styles[kind]
+                
+                # Only cells that actually change get a (single) configure call
+                if state != states[day_idx]:
+                    text, bg, fg, font = state
+                    self.day_cells[week_idx][day_idx].configure(text=text, bg=bg,
+                                                                fg=fg, font=font)
+                    states[day_idx] = state
+        
+        # Neighbouring months are classified in the background
+        self.month_cache.prefetch(self.current_year, self.current_month, today)
                     
     def run(self):
         """
@@ -480,6 +1077,9 @@ class Calendar:
         and keep the application running.
         """
         self.root.mainloop()
+        self.month_cache.shutdown()
+        if self.notes is not None:
+            self.notes.close()
         
 
 def main():
@@ -0,0 +1,13 @@
+"""
+Tk-free core of the calendar: holiday parsing, indexing and day classification.
+
+Nothing in this package imports tkinter, so it can be used from servers,
+batch jobs and worker processes. Keep the imports here light: modules with
+heavier dependencies (month_view, business_days) are imported explicitly.
+"""
+
+from .days import is_sunday, is_today
+from .errors import HolidayError, LoadReport
+from .holiday_store import HolidayStore
+
+__all__ = ["HolidayError", "HolidayStore", "LoadReport", "is_sunday", "is_today"]
@@ -0,0 +1,302 @@
+"""
+High-throughput classification of large numbers of dates.
+
+Input is processed in chunks. Inside a chunk, ISO dates are parsed and
+classified with NumPy in one vectorized pass when NumPy is installed;
+otherwise (and for other date formats) results are memoized per distinct
+date string, which is what dominates real inputs such as ticket dumps.
+Large inputs are fanned out to a process pool chunk by chunk, keeping only
+a bounded number of chunks in flight.
+"""
+
+import datetime
+import json
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO
+
+from .days import is_sunday
+from .holiday_store import HolidayStore
+from .service import QueryError, parse_date
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, chunks fall back to the memoized path
+    np = None
+
+
+FLAG_HOLIDAY = 1
+FLAG_SUNDAY = 2
+FLAG_BUSINESS = 4
+FLAG_TODAY = 8
+
+HEADER = "date\tholiday\tsunday\tbusiness_day\ttoday\n"
+
+# Output columns for every combination of flags
+_COLUMNS = ["\t" + "\t".join("1" if flags & flag else "0"
+                             for flag in (FLAG_HOLIDAY, FLAG_SUNDAY, FLAG_BUSINESS, FLAG_TODAY))
+            + "\n" for flags in range(16)]
+# An invalid date fills every column, so each row has as many columns as the header
+_ERROR_COLUMNS = "\terror" * 4 + "\n"
+
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+# Days since 1970-01-01 of datetime.date.min and datetime.date.max
+_MIN_DAY = datetime.date.min.toordinal() - _EPOCH_ORDINAL
+_MAX_DAY = datetime.date.max.toordinal() - _EPOCH_ORDINAL
+
+
+class DateClassifier:
+    """
+    Classifies dates as holiday, Sunday, business day and today.
+
+    Attributes:
+        holiday_store (HolidayStore): Holiday data
+        today (datetime.date): Date flagged as today, fixed for the whole run
+    """
+
+    def __init__(self, holiday_store: HolidayStore, today: Optional[datetime.date] = None):
+        """
+        Initialize the DateClassifier.
+
+        Args:
+            holiday_store (HolidayStore): Holiday data
+            today (Optional[datetime.date]): Date flagged as today, defaults to the current date
+        """
+        self.holiday_store = holiday_store
+        self.today = today or datetime.date.today()
+        self._memo: Dict[str, int] = {}
+        self._year_days: Dict[int, List[int]] = {}
+
+    def classify(self, value: str) -> int:
+        """
+        Classify one date.
+
+        Args:
+            value (str): Date as "YYYY-MM-DD" or "DD.MM.YYYY"
+
+        Returns:
+            int: Combination of FLAG_* bits
+
+        Raises:
+            QueryError: If the value is not a valid date
+        """
+        flags = self._memo.get(value)
+        if flags is None:
+            date = parse_date(value)
+            flags = 0
+            if self.holiday_store.is_holiday(date.day, date.month, date.year):
+                flags |= FLAG_HOLIDAY
+            if is_sunday(date.day, date.month, date.year):
+                flags |= FLAG_SUNDAY
+            if not flags:
+                flags |= FLAG_BUSINESS
+            if date == self.today:
+                flags |= FLAG_TODAY
+            if len(self._memo) < 1_000_000:
+                self._memo[value] = flags
+        return flags
+
+    def _holiday_days(self, first_year: int, last_year: int):
+        """Get holidays of a span of years as sorted days since 1970-01-01."""
+        days = []
+        for year in range(first_year, last_year + 1):
+            year_days = self._year_days.get(year)
+            if year_days is None:
+                year_days = []
+                for month in range(1, 13):
+                    for day in sorted(self.holiday_store.holidays_in_month(year, month)):
+                        try:
+                            year_days.append(datetime.date(year, month, day).toordinal()
+                                             - _EPOCH_ORDINAL)
+                        except ValueError:
+                            continue  # e.g. 29.02 in a non-leap year
+                self._year_days[year] = year_days
+            days.extend(year_days)
+        return np.asarray(days, dtype='int64')
+
+    def _classify_days(self, days):
+        """Classify a non-empty array of days since 1970-01-01, all within datetime's range."""
+        first = datetime.date.fromordinal(int(days.min()) + _EPOCH_ORDINAL).year
+        last = datetime.date.fromordinal(int(days.max()) + _EPOCH_ORDINAL).year
+        holiday = np.isin(days, self._holiday_days(first, last))
+        # 1970-01-01 was a Thursday, so Sunday is (days + 3) % 7 == 6
+        sunday = (days + 3) % 7 == 6
+        return (holiday * FLAG_HOLIDAY + sunday * FLAG_SUNDAY
+                + (~holiday & ~sunday) * FLAG_BUSINESS
+                + (days == self.today.toordinal() - _EPOCH_ORDINAL) * FLAG_TODAY)
+
+    def classify_chunk(self, values: List[str]) -> List[Optional[int]]:
+        """
+        Classify a chunk of dates.
+
+        Args:
+            values (List[str]): Date strings
+
+        Returns:
+            List[Optional[int]]: FLAG_* combination per date, None for invalid dates
+        """
+        # NumPy also accepts partial dates such as "2024-05", only take full ISO dates
+        if np is not None and values and min(map(len, values)) == max(map(len, values)) == 10:
+            try:
+                days = np.array(values, dtype='datetime64[D]').astype('int64')
+            except ValueError:
+                pass  # Not all ISO dates, use the per-value path
+            else:
+                # NumPy also accepts years datetime cannot represent, such as
+                # "0000-01-01" or "-001-01-01": those are reported as invalid
+                valid = (days >= _MIN_DAY) & (days <= _MAX_DAY)
+                if valid.all():
+                    return self._classify_days(days).tolist()
+                masked: List[Optional[int]] = [None] * len(values)
+                if valid.any():
+                    for index, flags in zip(np.flatnonzero(valid).tolist(),
+                                            self._classify_days(days[valid]).tolist()):
+                        masked[index] = flags
+                return masked
+
+        results: List[Optional[int]] = []
+        for value in values:
+            try:
+                results.append(self.classify(value))
+            except QueryError:
+                results.append(None)
+        return results
+
+    def format_chunk(self, values: List[str]) -> str:
+        """
+        Classify a chunk of dates and format it as tab-separated lines.
+
+        Args:
+            values (List[str]): Date strings
+
+        Returns:
+            str: One "date<TAB>holiday<TAB>sunday<TAB>business_day<TAB>today" line per
+                 date, with "error" columns for invalid dates
+        """
+        return "".join(value + (_COLUMNS[flags] if flags is not None else _ERROR_COLUMNS)
+                       for value, flags in zip(values, self.classify_chunk(values)))
+
+
+def iter_dates(lines: Iterable[str], field: Optional[str] = None) -> Iterator[str]:
+    """
+    Extract date strings from input lines.
+
+    Args:
+        lines (Iterable[str]): Input lines
+        field (Optional[str]): For JSONL input, the key holding the date;
+                               None treats every line as a plain date
+
+    Yields:
+        str: Date strings (empty lines are skipped)
+    """
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if field is None:
+            yield line
+            continue
+        try:
+            value = json.loads(line).get(field)
+        except (ValueError, AttributeError):
+            value = None
+        yield value if isinstance(value, str) else "<" + field + "?>"
+
+
+# Per-process classifier of pool workers
+_worker_classifier: Optional[DateClassifier] = None
+
+
+def _init_worker(holidays_file: str, today: datetime.date):
+    global _worker_classifier
+    _worker_classifier = DateClassifier(HolidayStore(holidays_file, use_snapshot=True), today)
+
+
+def _format_in_worker(values: List[str]) -> str:
+    return _worker_classifier.format_chunk(values)
+
+
+def _chunks(values: Iterator[str], size: int) -> Iterator[List[str]]:
+    while True:
+        chunk = list(islice(values, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_classify(source: TextIO, output: TextIO, holidays_file: str,
+                 field: Optional[str] = None, workers: int = 1,
+                 chunk_size: int = 65536) -> int:
+    """
+    Classify every date read from source and write the results to output.
+
+    Args:
+        source (TextIO): Input with one date (or JSON object) per line
+        output (TextIO): Receives a header and one tab-separated line per date
+        holidays_file (str): Holidays file
+        field (Optional[str]): JSON key of the date for JSONL input
+        workers (int): Worker processes, 1 classifies in this process
+        chunk_size (int): Dates per chunk
+
+    Returns:
+        int: Number of classified dates
+    """
+    today = datetime.date.today()
+    chunks = _chunks(iter_dates(source, field), chunk_size)
+    output.write(HEADER)
+    count = 0
+
+    if workers <= 1:
+        classifier = DateClassifier(HolidayStore(holidays_file, use_snapshot=True), today)
+        for chunk in chunks:
+            output.write(classifier.format_chunk(chunk))
+            count += len(chunk)
+        return count
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(holidays_file, today)) as executor:
+        # Keep a bounded number of chunks in flight, written in input order
+        pending = deque()
+        for chunk in chunks:
+            pending.append((len(chunk), executor.submit(_format_in_worker, chunk)))
+            if len(pending) >= workers * 2:
+                size, future = pending.popleft()
+                output.write(future.result())
+                count += size
+        while pending:
+            size, future = pending.popleft()
+            output.write(future.result())
+            count += size
+    return count
+
+
+def main_classify(path: str, holidays_file: str, field: Optional[str], workers: int,
+                  chunk_size: int) -> int:
+    """
+    Command line entry point used by main.py --classify.
+
+    Args:
+        path (str): Input file, "-" for stdin; ".jsonl" files default to the "date" field
+        holidays_file (str): Holidays file
+        field (Optional[str]): JSON key of the date
+        workers (int): Worker processes
+        chunk_size (int): Dates per chunk
+
+    Returns:
+        int: Process exit code
+    """
+    if field is None and path.endswith(".jsonl"):
+        field = "date"
+    try:
+        source = sys.stdin if path == "-" else open(path, 'r', encoding='utf-8')
+    except OSError as e:
+        print(f"Napaka: {e}", file=sys.stderr)
+        return 1
+    try:
+        run_classify(source, sys.stdout, holidays_file, field, workers, chunk_size)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    return 0
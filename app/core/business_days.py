@@ -0,0 +1,326 @@
+import datetime
+from bisect import bisect_left
+from typing import Dict, Iterable, List, NamedTuple, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, batch functions fall back to plain Python
+    np = None
+
+
+# date.toordinal() of the NumPy datetime64 epoch (1970-01-01)
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+# Extra years precomputed around every requested range, so that walking
+# forward or backward through dates rarely needs to rebuild the tables
+_YEAR_MARGIN = 5
+
+
+class _HolidayTable(NamedTuple):
+    """
+    Sorted ordinals of holidays on working weekdays for a span of years.
+
+    A table is never modified: covering more years or newer holiday data
+    builds a new one, which replaces the old with one assignment.
+    """
+    version: int
+    first_year: int
+    last_year: int
+    # Ordinal range [first_ordinal, end_ordinal) covered by the table
+    first_ordinal: int
+    end_ordinal: int
+    ordinals: List[int]
+
+
+class BusinessCalendar:
+    """
+    Business-day arithmetic on top of a HolidayStore.
+
+    A business day is any day that is neither a weekend day nor a holiday.
+    Instead of walking day by day, the calendar keeps a sorted table of
+    holidays that fall on working weekdays for a contiguous span of years and
+    counts working weekdays with plain arithmetic, so counting is O(log n)
+    and adding business days is O(log^2 n) regardless of the span.
+
+    Attributes:
+        holiday_store (HolidayStore): Source of holiday data
+        weekend (tuple): Weekday numbers (Monday=0, Sunday=6) that are never business days
+    """
+
+    def __init__(self, holiday_store, weekend: Iterable[int] = (6,)):
+        """
+        Initialize the BusinessCalendar.
+
+        Args:
+            holiday_store (HolidayStore): Holiday data used to exclude holidays
+            weekend (Iterable[int]): Non-working weekdays, Monday=0 ... Sunday=6.
+                                     Defaults to Sunday only, matching the calendar view.
+
+        Raises:
+            ValueError: If every weekday is marked as weekend
+        """
+        self.holiday_store = holiday_store
+        self.weekend = tuple(sorted(set(weekend)))
+
+        self._workdays = [wd not in self.weekend for wd in range(7)]
+        self._workdays_per_week = sum(self._workdays)
+        if self._workdays_per_week == 0:
+            raise ValueError("Vsaj en dan v tednu mora biti delovni dan")
+
+        # _partial[wd][n] = working days among n consecutive days starting on weekday wd
+        self._partial = []
+        for wd in range(7):
+            counts = [0]
+            for i in range(7):
+                counts.append(counts[-1] + self._workdays[(wd + i) % 7])
+            self._partial.append(counts)
+
+        self._reset()
+
+    def _reset(self):
+        """Drop all precomputed tables."""
+        # (holiday data version, {year: table of that year}), replaced as a whole
+        self._year_tables = (self.holiday_store.version, {})
+        # Covers nothing and matches no version, so the first use builds a table
+        self._table = _HolidayTable(-1, 0, -1, 0, 0, [])
+
+    def _year_table(self, year: int, tables: Dict[int, List[int]]) -> List[int]:
+        """
+        Get sorted ordinals of holidays in the given year that fall on working weekdays.
+
+        Holidays on weekend days are left out, because weekday arithmetic
+        already excludes those days.
+        """
+        table = tables.get(year)
+        if table is None:
+            table = []
+            for month in range(1, 13):
+                for day in sorted(self.holiday_store.holidays_in_month(year, month)):
+                    try:
+                        ordinal = datetime.date(year, month, day).toordinal()
+                    except ValueError:
+                        continue  # e.g. 29.02 in a non-leap year
+                    if self._workdays[(ordinal + 6) % 7]:
+                        table.append(ordinal)
+            tables[year] = table
+        return table
+
+    def _ensure_years(self, first_year: int, last_year: int) -> _HolidayTable:
+        """
+        Get a holiday table that covers the given years.
+
+        The table is rebuilt whenever the holiday data changes or a year
+        outside the covered span is requested. Callers keep the returned
+        table for the whole computation, so threads sharing the calendar
+        (e.g. the server's workers) each see one consistent table.
+        """
+        version = self.holiday_store.version
+        table = self._table
+        if table.version == version:
+            if table.first_year <= first_year and last_year <= table.last_year:
+                return table
+            first_year = min(first_year, table.first_year)
+            last_year = max(last_year, table.last_year)
+        first_year = max(datetime.MINYEAR, first_year - _YEAR_MARGIN)
+        last_year = min(datetime.MAXYEAR, last_year + _YEAR_MARGIN)
+
+        tables_version, tables = self._year_tables
+        if tables_version != version:
+            tables = {}
+            self._year_tables = (version, tables)
+        ordinals = []
+        for year in range(first_year, last_year + 1):
+            ordinals.extend(self._year_table(year, tables))
+
+        table = _HolidayTable(version, first_year, last_year,
+                              datetime.date(first_year, 1, 1).toordinal(),
+                              datetime.date(last_year, 12, 31).toordinal() + 1, ordinals)
+        self._table = table
+        return table
+
+    def _count_workdays(self, start: int, end: int) -> int:
+        """Count working weekdays in the ordinal range [start, end)."""
+        full_weeks, rest = divmod(end - start, 7)
+        return full_weeks * self._workdays_per_week + self._partial[(start + 6) % 7][rest]
+
+    def _count_ordinals(self, start: int, end: int) -> int:
+        """Count business days in the ordinal range [start, end), start <= end."""
+        version, _, _, first_ordinal, end_ordinal, ordinals = self._table
+        if (version != self.holiday_store.version
+                or start < first_ordinal or end > end_ordinal):
+            ordinals = self._ensure_years(datetime.date.fromordinal(start).year,
+                                          datetime.date.fromordinal(max(start, end - 1)).year
+                                          ).ordinals
+        holidays = bisect_left(ordinals, end) - bisect_left(ordinals, start)
+        return self._count_workdays(start, end) - holidays
+
+    def is_business_day(self, date: datetime.date) -> bool:
+        """
+        Check if the given date is a business day.
+
+        Args:
+            date (datetime.date): Date to check
+
+        Returns:
+            bool: True if the date is neither a weekend day nor a holiday
+        """
+        if not self._workdays[date.weekday()]:
+            return False
+        return not self.holiday_store.is_holiday(date.day, date.month, date.year)
+
+    def count_business_days(self, start: datetime.date, end: datetime.date) -> int:
+        """
+        Count business days in the half-open range [start, end).
+
+        Args:
+            start (datetime.date): First day of the range (inclusive)
+            end (datetime.date): Last day of the range (exclusive)
+
+        Returns:
+            int: Number of business days, negative if end is before start
+        """
+        start_ordinal = start.toordinal()
+        end_ordinal = end.toordinal()
+        if end_ordinal < start_ordinal:
+            return -self._count_ordinals(end_ordinal, start_ordinal)
+        return self._count_ordinals(start_ordinal, end_ordinal)
+
+    def add_business_days(self, date: datetime.date, n: int) -> datetime.date:
+        """
+        Move the given number of business days forward or backward.
+
+        Args:
+            date (datetime.date): Starting date (does not need to be a business day)
+            n (int): Number of business days to move, negative moves backward
+
+        Returns:
+            datetime.date: The n-th business day after (or before) the date,
+                           or the date itself if n is 0
+        """
+        if n == 0:
+            return date
+
+        origin = date.toordinal()
+        # Rough distance in calendar days for n business days
+        step = abs(n) * 7 // self._workdays_per_week + 7
+
+        if n > 0:
+            # Smallest x with n business days in (origin, x]
+            lo, hi = origin + 1, origin + step
+            while self._count_ordinals(origin + 1, hi + 1) < n:
+                lo, hi = hi + 1, hi + step
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if self._count_ordinals(origin + 1, mid + 1) >= n:
+                    hi = mid
+                else:
+                    lo = mid + 1
+        else:
+            # Largest x with -n business days in [x, origin)
+            n = -n
+            lo, hi = origin - step, origin - 1
+            while self._count_ordinals(lo, origin) < n:
+                lo, hi = lo - step, lo - 1
+            while lo < hi:
+                mid = (lo + hi + 1) // 2
+                if self._count_ordinals(mid, origin) >= n:
+                    lo = mid
+                else:
+                    hi = mid - 1
+
+        return datetime.date.fromordinal(lo)
+
+    def next_business_day(self, date: datetime.date) -> datetime.date:
+        """
+        Get the first business day strictly after the given date.
+
+        Args:
+            date (datetime.date): Starting date
+
+        Returns:
+            datetime.date: Next business day
+        """
+        return self.add_business_days(date, 1)
+
+    def _numpy_args(self, *date_arrays):
+        """
+        Prepare date arrays, weekmask and holidays for NumPy busday functions.
+
+        Returns:
+            tuple: (converted date arrays, weekmask, holidays)
+        """
+        arrays = [np.asarray(dates, dtype='datetime64[D]') for dates in date_arrays]
+        non_empty = [a for a in arrays if a.size]
+        table = self._table
+        if non_empty:
+            first = min(a.min() for a in non_empty).astype(datetime.date)
+            last = max(a.max() for a in non_empty).astype(datetime.date)
+            table = self._ensure_years(first.year, last.year)
+        holidays = (np.asarray(table.ordinals, dtype='int64')
+                    - _EPOCH_ORDINAL).astype('datetime64[D]')
+        weekmask = [int(is_workday) for is_workday in self._workdays]
+        return arrays, weekmask, holidays
+
+    def is_business_day_batch(self, dates: Sequence) -> Sequence:
+        """
+        Vectorized is_business_day().
+
+        Args:
+            dates (Sequence): datetime.date objects, or a NumPy datetime64 array
+
+        Returns:
+            Sequence: NumPy bool array for NumPy input, otherwise a list of bools
+        """
+        if np is not None and isinstance(dates, np.ndarray):
+            (dates,), weekmask, holidays = self._numpy_args(dates)
+            return np.is_busday(dates, weekmask=weekmask, holidays=holidays)
+        return [self.is_business_day(date) for date in dates]
+
+    def count_business_days_batch(self, starts: Sequence, ends: Sequence) -> Sequence:
+        """
+        Vectorized count_business_days().
+
+        Args:
+            starts (Sequence): Range starts (inclusive)
+            ends (Sequence): Range ends (exclusive)
+
+        Returns:
+            Sequence: NumPy int array for NumPy input, otherwise a list of ints
+        """
+        if np is not None and isinstance(starts, np.ndarray):
+            (starts, ends), weekmask, holidays = self._numpy_args(starts, ends)
+            # NumPy counts (end, start] for reversed ranges, keep count(a, b) == -count(b, a)
+            counts = np.busday_count(np.minimum(starts, ends), np.maximum(starts, ends),
+                                     weekmask=weekmask, holidays=holidays)
+            return np.where(ends < starts, -counts, counts)
+        return [self.count_business_days(start, end) for start, end in zip(starts, ends)]
+
+    def add_business_days_batch(self, dates: Sequence, n) -> Sequence:
+        """
+        Vectorized add_business_days().
+
+        Args:
+            dates (Sequence): Starting dates
+            n: Number of business days to move, a single int or one per date
+
+        Returns:
+            Sequence: NumPy datetime64 array for NumPy input, otherwise a list of dates
+        """
+        if np is not None and isinstance(dates, np.ndarray):
+            dates = np.asarray(dates, dtype='datetime64[D]')
+            offsets = np.broadcast_to(np.asarray(n, dtype='int64'), dates.shape)
+            # The holiday table has to cover every date the offsets can reach
+            reach = np.timedelta64(
+                int(np.abs(offsets).max(initial=0)) * 7 // self._workdays_per_week + 7, 'D')
+            (dates, _, _), weekmask, holidays = self._numpy_args(
+                dates, dates - reach, dates + reach)
+            # Rolling to the nearest business day on the far side of the move
+            # keeps the meaning "n-th business day after/before the date"
+            forward = np.busday_offset(dates, offsets, roll='backward',
+                                       weekmask=weekmask, holidays=holidays)
+            backward = np.busday_offset(dates, offsets, roll='forward',
+                                        weekmask=weekmask, holidays=holidays)
+            return np.where(offsets > 0, forward, np.where(offsets < 0, backward, dates))
+        if isinstance(n, int):
+            return [self.add_business_days(date, n) for date in dates]
+        return [self.add_business_days(date, offset) for date, offset in zip(dates, n)]
@@ -0,0 +1,87 @@
+from typing import List, NamedTuple, Optional
+
+
+class HolidayError(NamedTuple):
+    """
+    A problem found while loading holiday data.
+
+    Attributes:
+        message (str): Description of the problem
+        line_num (Optional[int]): Line number in the holidays file, None for file-level errors
+        line (str): Text of the offending line, empty for file-level errors
+    """
+    message: str
+    line_num: Optional[int] = None
+    line: str = ""
+
+    def __str__(self) -> str:
+        if self.line_num is None:
+            return f"Napaka pri branju datoteke s prazniki: {self.message}"
+        return f"Napaka v vrstici {self.line_num}: {self.line} - {self.message}"
+
+
+class LoadReport:
+    """
+    Diagnostics collected while loading a holidays file.
+
+    Every problem is counted, but only the first max_errors are kept, so
+    a file with millions of bad lines still loads in bounded memory.
+
+    Attributes:
+        source (str): Path of the loaded file
+        max_errors (int): Maximum number of errors kept in the errors list
+        errors (List[HolidayError]): The first max_errors problems
+        error_count (int): Total number of problems
+        lines_read (int): Number of lines read from the file
+        entries (int): Number of holiday entries parsed
+    """
+
+    def __init__(self, source: str = "", max_errors: int = 100):
+        """
+        Initialize an empty LoadReport.
+
+        Args:
+            source (str): Path of the loaded file
+            max_errors (int): Maximum number of errors kept in the errors list
+        """
+        self.source = source
+        self.max_errors = max_errors
+        self.errors: List[HolidayError] = []
+        self.error_count = 0
+        self.lines_read = 0
+        self.entries = 0
+
+    @property
+    def ok(self) -> bool:
+        """bool: True if no problems were found."""
+        return self.error_count == 0
+
+    def add_error(self, error: HolidayError):
+        """
+        Record a problem.
+
+        Args:
+            error (HolidayError): The problem found
+        """
+        self.error_count += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append(error)
+
+    def summary(self, limit: int = 10) -> str:
+        """
+        Describe all problems in a single message.
+
+        Args:
+            limit (int): Maximum number of individual errors listed
+
+        Returns:
+            str: Multi-line summary suitable for one dialog
+        """
+        if self.ok:
+            return "Prazniki so naloženi brez napak."
+
+        lines = [f"Pri nalaganju praznikov je bilo najdenih {self.error_count} napak:"]
+        lines.extend(str(error) for error in self.errors[:limit])
+        if self.error_count > limit:
+            lines.append(f"... in še {self.error_count - limit} drugih.")
+        return "\n".join(lines)
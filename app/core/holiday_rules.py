@@ -0,0 +1,210 @@
+import datetime
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+
+
+# Weekday abbreviations accepted in rules (Monday=0 ... Sunday=6)
+WEEKDAYS = {
+    "PON": 0, "TOR": 1, "SRE": 2, "ČET": 3, "CET": 3, "PET": 4, "SOB": 5, "NED": 6,
+    "MON": 0, "TUE": 1, "WED": 2, "THU": 3, "FRI": 4, "SAT": 5, "SUN": 6,
+}
+_WEEKDAY_NAMES = ("MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN")
+
+
+class HolidayRule(NamedTuple):
+    """
+    A computed holiday whose date changes from year to year.
+
+    Attributes:
+        kind (str): "easter" or "weekday"
+        offset (int): Days relative to Easter Sunday (easter rules only)
+        n (int): Occurrence of the weekday in the month, 1-5 or -1..-5 counted from the end
+        weekday (int): Weekday, Monday=0 ... Sunday=6 (weekday rules only)
+        month (int): Month (weekday rules only)
+    """
+    kind: str
+    offset: int = 0
+    n: int = 0
+    weekday: int = 0
+    month: int = 0
+
+
+def parse_rule(text: str) -> HolidayRule:
+    """
+    Parse the date part of a rule line.
+
+    Supported formats:
+        - "EASTER", "EASTER+1", "EASTER-2": offset in days from Easter Sunday
+        - "N.WD.MM": N-th weekday WD in month MM, e.g. "2.NED.05" for the
+          second Sunday in May. N may be negative to count from the end of
+          the month, and "L" is short for -1 (e.g. "L.PON.05")
+
+    Args:
+        text (str): Date part of the line, without the repeat flag
+
+    Returns:
+        HolidayRule: The parsed rule
+
+    Raises:
+        ValueError: If the text is not a valid rule
+    """
+    text = text.strip().upper()
+
+    if text.startswith("EASTER"):
+        offset = text[len("EASTER"):].strip()
+        return HolidayRule("easter", offset=int(offset) if offset else 0)
+
+    parts = text.split('.')
+    if len(parts) != 3:
+        raise ValueError(f"neznano pravilo '{text}'")
+
+    n = -1 if parts[0] == "L" else int(parts[0])
+    if n == 0 or not -5 <= n <= 5:
+        raise ValueError(f"neveljavna ponovitev dneva '{parts[0]}'")
+    if parts[1] not in WEEKDAYS:
+        raise ValueError(f"neznan dan v tednu '{parts[1]}'")
+    month = int(parts[2])
+    if not 1 <= month <= 12:
+        raise ValueError(f"neveljaven mesec '{parts[2]}'")
+
+    return HolidayRule("weekday", n=n, weekday=WEEKDAYS[parts[1]], month=month)
+
+
+def format_rule(rule: HolidayRule) -> str:
+    """
+    Format a rule back into the holidays file syntax.
+
+    Args:
+        rule (HolidayRule): Rule to format
+
+    Returns:
+        str: Date part accepted by parse_rule(), e.g. "EASTER+1" or "-1.MON.05"
+    """
+    if rule.kind == "easter":
+        return f"EASTER{rule.offset:+d}"
+    return f"{rule.n}.{_WEEKDAY_NAMES[rule.weekday]}.{rule.month:02d}"
+
+
+def easter_sunday(year: int) -> datetime.date:
+    """
+    Calculate the date of (Western) Easter Sunday.
+
+    Uses the anonymous Gregorian algorithm (Meeus/Jones/Butcher).
+
+    Args:
+        year (int): Year (e.g., 2024)
+
+    Returns:
+        datetime.date: Easter Sunday of that year
+    """
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return datetime.date(year, month, day + 1)
+
+
+def nth_weekday(year: int, month: int, weekday: int, n: int) -> Optional[int]:
+    """
+    Find the day of the N-th given weekday in a month.
+
+    Args:
+        year (int): Year (e.g., 2024)
+        month (int): Month (1-12)
+        weekday (int): Weekday, Monday=0 ... Sunday=6
+        n (int): Occurrence, 1-5 from the start or -1..-5 from the end of the month
+
+    Returns:
+        Optional[int]: Day of the month, or None if the month has no such occurrence
+    """
+    first = datetime.date(year, month, 1)
+    if month == 12:
+        length = 31
+    else:
+        length = (datetime.date(year, month + 1, 1) - first).days
+
+    if n > 0:
+        day = 1 + (weekday - first.weekday()) % 7 + (n - 1) * 7
+    else:
+        last_weekday = (first.weekday() + length - 1) % 7
+        day = length - (last_weekday - weekday) % 7 + (n + 1) * 7
+
+    if 1 <= day <= length:
+        return day
+    return None
+
+
+def expand_rule(rule: HolidayRule, year: int) -> Optional[Tuple[int, int]]:
+    """
+    Calculate the date of a rule in the given year.
+
+    Args:
+        rule (HolidayRule): Rule to expand
+        year (int): Year (e.g., 2024)
+
+    Returns:
+        Optional[Tuple[int, int]]: (month, day), or None if the rule has no date that year
+    """
+    if rule.kind == "easter":
+        try:
+            date = easter_sunday(year) + datetime.timedelta(days=rule.offset)
+        except OverflowError:
+            return None
+        if date.year != year:
+            return None
+        return date.month, date.day
+
+    day = nth_weekday(year, rule.month, rule.weekday, rule.n)
+    if day is None:
+        return None
+    return rule.month, day
+
+
+class RuleSet:
+    """
+    A group of holiday rules with memoized per-year expansion.
+
+    Years are expanded lazily on first use and kept in an LRU cache, so
+    repeated lookups in the same year cost a single cache hit and no year
+    is ever materialized up front.
+
+    Attributes:
+        rules (Tuple[HolidayRule, ...]): Rules in this set
+    """
+
+    def __init__(self, rules=(), cache_size: int = 1024):
+        """
+        Initialize the RuleSet.
+
+        Args:
+            rules (Iterable[HolidayRule]): Rules to include
+            cache_size (int): Number of expanded years kept in the cache
+        """
+        self.rules = tuple(rules)
+        self.dates = lru_cache(maxsize=cache_size)(self._expand)
+
+    def __bool__(self) -> bool:
+        return bool(self.rules)
+
+    def _expand(self, year: int) -> frozenset:
+        """
+        Calculate the dates of all rules in the given year.
+
+        Args:
+            year (int): Year (e.g., 2024)
+
+        Returns:
+            frozenset: (month, day) tuples of every rule-based holiday in that year
+        """
+        dates = set()
+        for rule in self.rules:
+            date = expand_rule(rule, year)
+            if date is not None:
+                dates.add(date)
+        return frozenset(dates)
@@ -0,0 +1,814 @@
+import datetime
+import itertools
+import os
+import threading
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from .errors import HolidayError, LoadReport
+from .ical import is_ical, iter_csv, iter_ical_lines, iter_ics
+from .holiday_rules import HolidayRule, RuleSet, expand_rule, parse_rule
+from .instrumentation import hot_path, timed
+from .intervals import HolidayRange, IntervalIndex, parse_range
+from .snapshot import file_digest, open_snapshot, snapshot_path, write_snapshot
+from .timeline import HolidayTimeline
+
+
+# A parsed line: (day, month, year, is_yearly) tuple, a computed rule or a date range
+HolidayEntry = Union[Tuple[int, int, int, bool], HolidayRule, HolidayRange]
+
+
+def parse_holiday_entry(line: str) -> HolidayEntry:
+    """
+    Parse a single (non-empty, non-comment) line from the holidays file.
+    
+    Args:
+        line (str): The line to parse
+        
+    Returns:
+        HolidayEntry: (day, month, year, is_yearly) tuple, year is None for
+                      "DD.MM" dates, a HolidayRule for computed holidays or
+                      a HolidayRange for "DD.MM-DD.MM" style ranges
+        
+    Raises:
+        ValueError: If the line is malformed
+    """
+    # Remove comments
+    if '#' in line:
+        line = line[:line.index('#')]
+    
+    parts = line.strip().split('|')
+    if len(parts) != 2:
+        raise ValueError("pričakovan format DD.MM|Y ali DD.MM.YYYY|N")
+    
+    date_part = parts[0].strip()
+    repeat_flag = parts[1].strip().upper()
+    
+    # Computed rule
+    if any(char.isalpha() for char in date_part):
+        if repeat_flag != 'Y':
+            raise ValueError("pravilo mora biti ponavljajoče (Y)")
+        return parse_rule(date_part)
+    
+    # Date range
+    if '-' in date_part:
+        return parse_range(date_part, repeat_flag)
+    
+    # Parse date
+    date_fields = date_part.split('.')
+    if len(date_fields) == 2:  # DD.MM format (repeatable)
+        day, month = map(int, date_fields)
+        year = None
+    elif len(date_fields) == 3:  # DD.MM.YYYY format (specific year)
+        day, month, year = map(int, date_fields)
+    else:
+        raise ValueError(f"neveljaven datum '{date_part}'")
+    
+    # Validate, 2000 is a leap year so 29.02 is accepted for yearly dates
+    datetime.date(year or 2000, month, day)
+    
+    return (day, month, year, repeat_flag == 'Y')
+
+
+def number_lines(lines: Iterable[str], report: LoadReport) -> Iterator[Tuple[int, str]]:
+    """
+    Number the lines of a holidays file, counting them in the report.
+    
+    Args:
+        lines (Iterable[str]): Lines of a holidays file
+        report (LoadReport): Receives the number of lines read
+        
+    Yields:
+        Tuple[int, str]: Line number and line
+    """
+    for line_num, line in enumerate(lines, 1):
+        report.lines_read = line_num
+        yield line_num, line
+
+
+def iter_holiday_entries(lines: Iterable[str],
+                         report: LoadReport) -> Iterator[Tuple[int, str, HolidayEntry]]:
+    """
+    Lazily parse holiday lines.
+    
+    Lines are consumed one at a time, so a file object can be passed
+    directly and is never read into memory as a whole. Malformed lines are
+    recorded in the report and skipped.
+    
+    Args:
+        lines (Iterable[str]): Lines of a holidays file
+        report (LoadReport): Collects errors and line counts
+        
+    Yields:
+        Tuple[int, str, HolidayEntry]: Line number, stripped line and parsed entry
+    """
+    return iter_numbered_entries(number_lines(lines, report), report)
+
+
+def iter_numbered_entries(lines: Iterable[Tuple[int, str]],
+                          report: LoadReport) -> Iterator[Tuple[int, str, HolidayEntry]]:
+    """
+    Lazily parse numbered holiday lines, see iter_holiday_entries().
+    
+    Args:
+        lines (Iterable[Tuple[int, str]]): Line numbers and lines, e.g. from
+                                           number_lines() or ical.iter_ical_lines()
+        report (LoadReport): Collects errors and the number of entries
+        
+    Yields:
+        Tuple[int, str, HolidayEntry]: Line number, stripped line and parsed entry
+    """
+    parse = timed(parse_holiday_entry, "parse_holiday_entry")
+    for line_num, line in lines:
+        line = line.strip()
+        if not line or line.startswith('#'):  # Skip empty lines and comments
+            continue
+        try:
+            entry = parse(line)
+        except Exception as e:
+            report.add_error(HolidayError(str(e), line_num, line))
+            continue
+        report.entries += 1
+        yield line_num, line, entry
+
+
+class HolidayIndex:
+    """
+    Lookup structures built from a set of holidays and rules.
+    
+    Yearly holidays are keyed by (month, day) and one-time holidays by
+    (year, month, day), so is_holiday() is a constant-time lookup no matter
+    how many entries the holidays file contains. Per-month buckets back
+    holidays_in_month(). Rules are expanded lazily per year. Date ranges
+    are answered by an IntervalIndex without expanding them into days.
+    
+    An index is never modified after it is built. HolidayStore replaces it
+    with a single assignment, so readers always see a complete index.
+    
+    Attributes:
+        yearly (set): (month, day) keys of yearly recurring holidays
+        one_time (set): (year, month, day) keys of one-time holidays
+        rules (Tuple[HolidayRule, ...]): Computed holidays
+        intervals (IntervalIndex): Date ranges
+    """
+    
+    def __init__(self, holidays: Iterable[Tuple[int, int, int, bool]] = (),
+                 rules: Iterable[HolidayRule] = (),
+                 ranges: Iterable[HolidayRange] = ()):
+        """
+        Build the index.
+        
+        Args:
+            holidays (Iterable): (day, month, year, is_yearly) tuples
+            rules (Iterable[HolidayRule]): Computed holidays
+            ranges (Iterable[HolidayRange]): Date ranges
+        """
+        self.yearly = set()
+        self.one_time = set()
+        self._yearly_by_month = {}
+        self._one_time_by_month = {}
+        
+        for day, month, year, is_yearly in holidays:
+            if is_yearly:
+                self.yearly.add((month, day))
+                self._yearly_by_month.setdefault(month, set()).add(day)
+            elif year:
+                self.one_time.add((year, month, day))
+                self._one_time_by_month.setdefault((year, month), set()).add(day)
+        
+        self.rules = tuple(rules)
+        self._rule_set = RuleSet(self.rules)
+        self.intervals = IntervalIndex(ranges)
+        
+    def is_holiday(self, day: int, month: int, year: int) -> bool:
+        """Check if the given date is a holiday, see HolidayStore.is_holiday()."""
+        if (month, day) in self.yearly or (year, month, day) in self.one_time:
+            return True
+        if self._rule_set and (month, day) in self._rule_set.dates(year):
+            return True
+        return bool(self.intervals) and self.intervals.is_holiday(day, month, year)
+    
+    def holidays_in_month(self, year: int, month: int) -> set:
+        """Get all holiday days in the given month, see HolidayStore.holidays_in_month()."""
+        days = (self._yearly_by_month.get(month, set())
+                | self._one_time_by_month.get((year, month), set()))
+        if self._rule_set:
+            days |= {r_day for r_month, r_day in self._rule_set.dates(year) if r_month == month}
+        if self.intervals:
+            days |= self.intervals.holidays_in_month(year, month)
+        return days
+
+
+class HolidayChange(NamedTuple):
+    """
+    Entries added and removed by a reload of the holidays file.
+    
+    Attributes:
+        added (frozenset): Entries that are new in the file
+        removed (frozenset): Entries that are no longer in the file
+    """
+    added: frozenset = frozenset()
+    removed: frozenset = frozenset()
+    
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed)
+    
+    def affects(self, year: int, month: int) -> bool:
+        """
+        Check if the change alters any day of the given month.
+        
+        Args:
+            year (int): Year (e.g., 2024)
+            month (int): Month (1-12)
+            
+        Returns:
+            bool: True if an added or removed entry falls into that month
+        """
+        for entry in self.added | self.removed:
+            if isinstance(entry, HolidayRule):
+                date = expand_rule(entry, year)
+                if date is not None and date[0] == month:
+                    return True
+            elif isinstance(entry, HolidayRange):
+                if IntervalIndex([entry]).holidays_in_month(year, month):
+                    return True
+            else:
+                _, e_month, e_year, is_yearly = entry
+                if e_month == month and (is_yearly or e_year == year):
+                    return True
+        return False
+
+
+class HolidayState(NamedTuple):
+    """
+    One published version of the holiday data.
+    
+    A state is never modified. Loading or reloading builds a new state and
+    HolidayStore swaps it in with a single assignment, so a reader that
+    keeps a reference sees one consistent version without taking a lock.
+    
+    Attributes:
+        version (int): Incremented with every published state
+        holidays (frozenset): (day, month, year, is_yearly) tuples
+        rules (frozenset): Computed holidays (HolidayRule)
+        ranges (frozenset): Date ranges (HolidayRange)
+        index: HolidayIndex, or a snapshot.BitmapIndex, answering lookups
+        report (LoadReport): Diagnostics of the load that built the state
+    """
+    version: int
+    holidays: frozenset
+    rules: frozenset
+    ranges: frozenset
+    index: object
+    report: LoadReport
+
+
+class _Draft:
+    """
+    Mutable entry sets the next HolidayState is built from.
+    
+    Only the thread holding HolidayStore's write lock touches a draft.
+    """
+    
+    def __init__(self, report: LoadReport, base: Optional[HolidayState] = None):
+        self.holidays = set(base.holidays) if base else set()
+        self.rules = set(base.rules) if base else set()
+        self.ranges = set(base.ranges) if base else set()
+        self.report = report
+        
+    def add(self, entry: HolidayEntry):
+        if isinstance(entry, HolidayRule):
+            self.rules.add(entry)
+        elif isinstance(entry, HolidayRange):
+            self.ranges.add(entry)
+        else:
+            self.holidays.add(entry)
+            
+    def discard(self, entry: HolidayEntry):
+        self.holidays.discard(entry)
+        self.rules.discard(entry)
+        self.ranges.discard(entry)
+
+
+class HolidayStore:
+    """
+    A class for managing and storing holiday information.
+    
+    This class handles loading holidays from a text file and provides functionality
+    to check if a specific date is a holiday. It supports both yearly recurring
+    holidays and one-time holidays for specific years.
+    
+    The data is published as frozen HolidayState objects. Loads and reloads
+    (serialized by a lock that readers never take) build the next state
+    aside and swap it in with one assignment, so lookups from any thread
+    see either the old or the new data, never a half-loaded file.
+    
+    Attributes:
+        holidays_file (str): Path to the holidays configuration file
+        use_snapshot (bool): Whether a compiled snapshot is used to skip parsing
+        state (HolidayState): The current data, see the properties below
+        holidays (frozenset): Tuples containing holiday information
+                              (empty when the data was loaded from a snapshot)
+        rules (frozenset): Computed holidays (HolidayRule) such as Easter offsets
+        ranges (frozenset): Date ranges (HolidayRange) such as school breaks
+        version (int): Incremented every time a new state is published
+        report (LoadReport): Diagnostics of the last load
+    """
+    
+    def __init__(self, holidays_file: str = "../assets/holidays.txt",
+                 use_snapshot: bool = False, load: bool = True):
+        """
+        Initialize the HolidayStore with a holidays file.
+        
+        Args:
+            holidays_file (str): Path to the file containing holiday definitions.
+                                Defaults to "../assets/holidays.txt"
+            use_snapshot (bool): Load from (and maintain) a compiled snapshot
+                                 next to the holidays file, see core.snapshot.
+                                 Defaults to False
+            load (bool): Load the file right away. With False the store starts
+                         empty until load_holidays() is called, e.g. from a
+                         background thread. Defaults to True
+        """
+        self.holidays_file = holidays_file
+        self.use_snapshot = use_snapshot
+        self._state = HolidayState(0, frozenset(), frozenset(), frozenset(),
+                                   HolidayIndex(), LoadReport(holidays_file))
+        # (index, timeline) pair, rebuilt when the index is replaced
+        self._timeline = None
+        
+        # Everything below belongs to the writer: loads and reloads hold the
+        # lock, build into the draft and publish it with build_indexes()
+        self._write_lock = threading.RLock()
+        self._draft: Optional[_Draft] = None
+        # Bookkeeping for incremental reloads: how many times every valid
+        # line and every parsed entry occurs (None after a start from a
+        # snapshot), and the file's stat signature
+        self._line_counts = Counter()
+        self._entry_counts = Counter()
+        self._signature = None
+        
+        if load:
+            self.load_holidays()
+            
+    @property
+    def state(self) -> HolidayState:
+        """HolidayState: The current data, read it once for several consistent lookups."""
+        return self._state
+        
+    @property
+    def holidays(self) -> frozenset:
+        """frozenset: (day, month, year, is_yearly) tuples of the current state."""
+        return self._state.holidays
+        
+    @property
+    def rules(self) -> frozenset:
+        """frozenset: Computed holidays of the current state."""
+        return self._state.rules
+        
+    @property
+    def ranges(self) -> frozenset:
+        """frozenset: Date ranges of the current state."""
+        return self._state.ranges
+        
+    @property
+    def version(self) -> int:
+        """int: Version of the current state."""
+        return self._state.version
+        
+    @property
+    def report(self) -> LoadReport:
+        """LoadReport: Diagnostics of the load that built the current state."""
+        return self._state.report
+        
+    @hot_path()
+    def load_holidays(self):
+        """
+        Load holidays from the specified file.
+        
+        With use_snapshot, a valid snapshot is memory-mapped instead and no
+        text is parsed at all. A missing or stale snapshot falls back to the
+        text parser and is rewritten afterwards (if the file had no errors).
+        
+        Streams the holidays file through iter_holiday_entries(), so the file
+        is never held in memory as a whole. Problems (unreadable file,
+        malformed lines) are collected in a single LoadReport instead of
+        being raised, so the caller decides how to report them.
+        
+        File format:
+            - Lines starting with '#' are treated as comments
+            - Empty lines are ignored
+            - Valid entries: "DD.MM|Y" (yearly), "DD.MM.YYYY|N" (one-time),
+              a rule such as "EASTER+1|Y" (computed every year) or a range
+              such as "24.12-31.12|Y" or "27.10.2025-31.10.2025|N"
+            - .ics files are read event by event instead, see core.ical
+        """
+        with self._write_lock:
+            if self.use_snapshot and self._load_snapshot():
+                return
+        
+            draft = self._draft = _Draft(LoadReport(self.holidays_file))
+            try:
+                self._parse_file(draft)
+            except Exception as e:
+                draft.report.add_error(HolidayError(str(e)))
+        
+            self.build_indexes()
+        
+            if self.use_snapshot and self.report.ok:
+                self._save_snapshot()
+        
+    def _parse_file(self, draft: _Draft):
+        """Parse the whole file into the draft, recounting its lines and entries."""
+        self._line_counts = Counter()
+        self._entry_counts = Counter()
+        self._signature = self._file_signature()
+        with open(self.holidays_file, 'r', encoding='utf-8') as f:
+            lines = self._numbered_lines(f, draft.report)
+            for _, line, entry in iter_numbered_entries(lines, draft.report):
+                self._line_counts[line] += 1
+                self._entry_counts[entry] += 1
+                draft.add(entry)
+        
+    def _numbered_lines(self, f, report: LoadReport) -> Iterator[Tuple[int, str]]:
+        """Numbered holiday lines of the open file, converted event by event for .ics files."""
+        if is_ical(self.holidays_file):
+            return iter_ical_lines(f, report)
+        return number_lines(f, report)
+        
+    def _load_snapshot(self) -> bool:
+        """
+        Use the snapshot of the holidays file if it is still valid.
+        
+        Returns:
+            bool: True if the snapshot was mapped and is now used for lookups
+        """
+        index = open_snapshot(snapshot_path(self.holidays_file), self.holidays_file)
+        if index is None:
+            return False
+        
+        # Nothing was parsed, so there are no line counts to diff against:
+        # the first reload parses the whole file, see _full_reload()
+        self._line_counts = None
+        self._entry_counts = None
+        self._signature = self._file_signature()
+        self._draft = None
+        self._state = HolidayState(self._state.version + 1, frozenset(),
+                                   frozenset(index.rules), frozenset(index.intervals.ranges),
+                                   index, LoadReport(self.holidays_file))
+        return True
+    
+    def _save_snapshot(self):
+        """Write a snapshot of the parsed data, skipped if the file changed meanwhile."""
+        try:
+            digest = file_digest(self.holidays_file)
+            if self._file_signature() != self._signature:
+                return
+            _, size, mtime_ns = self._signature
+            write_snapshot(snapshot_path(self.holidays_file), size, mtime_ns, digest,
+                           self.holidays, self.rules, self.ranges)
+        except OSError:
+            pass  # A read-only location just means no snapshot
+        
+    def _file_signature(self) -> Tuple[int, int, int]:
+        """Get (inode, size, mtime) of the holidays file, raises OSError if it is missing."""
+        st = os.stat(self.holidays_file)
+        return st.st_ino, st.st_size, st.st_mtime_ns
+    
+    def check_for_changes(self) -> Optional[HolidayChange]:
+        """
+        Reload the holidays file if it changed on disk.
+        
+        Cheap enough to poll: unless the file's inode, size or modification
+        time changed, this is a single stat() call.
+        
+        Returns:
+            Optional[HolidayChange]: The applied change, or None if the file
+                                     was not modified (or could not be read)
+        """
+        try:
+            signature = self._file_signature()
+        except OSError:
+            return None
+        if signature == self._signature:
+            return None
+        with self._write_lock:
+            if signature == self._signature:
+                return None  # Another thread reloaded it meanwhile
+            return self.reload()
+    
+    def reload(self) -> Optional[HolidayChange]:
+        """
+        Incrementally reload the holidays file.
+        
+        Only lines that were added or removed since the last load are
+        parsed; the first reload after a start from a snapshot parses the
+        whole file, because the snapshot has no line counts. The entry sets
+        are copied (copy-on-write) only if something changed, and the new
+        state is swapped in at once; its report covers the current file.
+        
+        Returns:
+            Optional[HolidayChange]: Entries added and removed, or None if
+                                     the file could not be read (the current
+                                     data is kept)
+        """
+        with self._write_lock:
+            return self._reload()
+            
+    def _reload(self) -> Optional[HolidayChange]:
+        """reload() with the write lock held."""
+        if self._line_counts is None:
+            return self._full_reload()
+        report = LoadReport(self.holidays_file)
+        line_counts = Counter()
+        # Line numbers of every occurrence of a line the last load did not have
+        new_lines: Dict[str, List[int]] = {}
+        
+        try:
+            signature = self._file_signature()
+            with open(self.holidays_file, 'r', encoding='utf-8') as f:
+                for line_num, line in self._numbered_lines(f, report):
+                    line = line.strip()
+                    if not line or line.startswith('#'):  # Skip empty lines and comments
+                        continue
+                    line_counts[line] += 1
+                    if line not in self._line_counts:
+                        new_lines.setdefault(line, []).append(line_num)
+        except OSError:
+            return None
+        
+        added = set()
+        removed = set()
+        
+        # Removed lines were valid when they were loaded
+        for line, count in (self._line_counts - line_counts).items():
+            entry = parse_holiday_entry(line)
+            self._entry_counts[entry] -= count
+            if self._entry_counts[entry] <= 0:
+                del self._entry_counts[entry]
+                removed.add(entry)
+        
+        parse = timed(parse_holiday_entry, "parse_holiday_entry")
+        errors = []
+        for line, count in (line_counts - self._line_counts).items():
+            try:
+                entry = parse(line)
+            except Exception as e:
+                # Invalid lines are never counted, so every occurrence is new
+                # and is reported, like a full load does
+                errors.extend(HolidayError(str(e), line_num, line)
+                              for line_num in new_lines.get(line, ()))
+                del line_counts[line]
+                continue
+            if entry not in self._entry_counts:
+                added.add(entry)
+            self._entry_counts[entry] += count
+        for error in sorted(errors, key=lambda error: error.line_num):
+            report.add_error(error)
+        
+        report.entries = sum(line_counts.values())
+        self._line_counts = line_counts
+        self._signature = signature
+        
+        change = HolidayChange(frozenset(added - removed), frozenset(removed - added))
+        if change:
+            draft = self._draft = _Draft(report, self._state)
+            for entry in change.removed:
+                draft.discard(entry)
+            for entry in change.added:
+                draft.add(entry)
+            self.build_indexes()
+        else:
+            self._state = self._state._replace(report=report)
+        return change
+        
+    def _full_reload(self) -> Optional[HolidayChange]:
+        """
+        Reload by parsing the whole file, used after a start from a snapshot.
+        
+        The snapshot holds no per-line bookkeeping (and no holiday tuples),
+        so the change is found by comparing the entries of the file with the
+        ones read back from the snapshot's index.
+        """
+        state = self._state
+        old = set(state.rules) | set(state.ranges)
+        if state.holidays:
+            old |= state.holidays
+        else:
+            old |= {(day, month, None, True) for month, day in state.index.yearly}
+            old |= {(day, month, year, False) for year, month, day in state.index.one_time}
+        
+        draft = _Draft(LoadReport(self.holidays_file))
+        try:
+            self._parse_file(draft)
+        except OSError:
+            # Keep the snapshot's data, the next reload tries again
+            self._line_counts = None
+            self._entry_counts = None
+            return None
+        
+        new = draft.holidays | draft.rules | draft.ranges
+        self._draft = draft
+        self.build_indexes()
+        return HolidayChange(frozenset(new - old), frozenset(old - new))
+        
+    @property
+    def errors(self) -> List[HolidayError]:
+        """List[HolidayError]: Problems kept in the report of the last load."""
+        return self.report.errors
+        
+    def _edit(self) -> _Draft:
+        """Get the draft of the next state, copying the current one on first use."""
+        if self._draft is None:
+            self._draft = _Draft(self._state.report, self._state)
+        return self._draft
+        
+    def add_entry(self, entry: HolidayEntry):
+        """
+        Add a parsed entry to the draft of the next state.
+        
+        Call build_indexes() afterwards to publish it; until then lookups
+        keep using the current state.
+        
+        Args:
+            entry (HolidayEntry): Result of parse_holiday_entry()
+        """
+        with self._write_lock:
+            self._edit().add(entry)
+        
+    def build_indexes(self):
+        """
+        Publish the draft as the next state.
+        
+        The new HolidayIndex is built completely before the state that holds
+        it replaces the current one, so concurrent lookups never see a
+        half-built index.
+        """
+        with self._write_lock:
+            draft = self._edit()
+            self._draft = None
+            self._state = HolidayState(
+                self._state.version + 1,
+                frozenset(draft.holidays), frozenset(draft.rules), frozenset(draft.ranges),
+                HolidayIndex(draft.holidays, draft.rules, draft.ranges), draft.report)
+        
+    @property
+    def yearly_index(self) -> set:
+        """set: (month, day) keys of yearly recurring holidays."""
+        return self._state.index.yearly
+    
+    @property
+    def one_time_index(self) -> set:
+        """set: (year, month, day) keys of one-time holidays."""
+        return self._state.index.one_time
+            
+    def parse_holiday_line(self, line: str, line_num: int):
+        """
+        Parse a single line from the holidays file.
+        
+        Args:
+            line (str): The line to parse
+            line_num (int): Line number for error reporting
+            
+        Expected format:
+            - "DD.MM|Y" for yearly recurring holidays
+            - "DD.MM.YYYY|N" for one-time holidays
+            - "EASTER+N|Y" for a holiday N days after (or before) Easter Sunday
+            - "N.WD.MM|Y" for the N-th weekday in a month, e.g. "L.PON.05|Y"
+              for the last Monday in May (see holiday_rules.parse_rule)
+            - "DD.MM-DD.MM|Y" or "DD.MM.YYYY-DD.MM.YYYY|N" for date ranges
+              (see intervals.parse_range)
+            - Comments after '#' are ignored
+            
+        The parsed holiday is added to the draft of the next state as a tuple:
+        (day, month, year, is_yearly), rules and ranges to their own sets.
+        Errors are recorded in the draft's report.
+        """
+        with self._write_lock:
+            draft = self._edit()
+            try:
+                draft.add(parse_holiday_entry(line))
+            except Exception as e:
+                draft.report.add_error(HolidayError(str(e), line_num, line.strip()))
+            
+    @hot_path()
+    def is_holiday(self, day: int, month: int, year: int) -> bool:
+        """
+        Check if the given date is a holiday.
+        
+        Args:
+            day (int): Day of the month (1-31)
+            month (int): Month (1-12)
+            year (int): Year (e.g., 2024)
+            
+        Returns:
+            bool: True if the date is a holiday, False otherwise
+            
+        The method checks both:
+        - Yearly recurring holidays (matches day and month)
+        - One-time holidays (matches day, month, and year exactly)
+        - Rule-based holidays (expanded once per year and memoized)
+        """
+        return self._state.index.is_holiday(day, month, year)
+    
+    def holidays_in_month(self, year: int, month: int) -> set:
+        """
+        Get all holiday days in the given month.
+        
+        Args:
+            year (int): Year (e.g., 2024)
+            month (int): Month (1-12)
+            
+        Returns:
+            set: Day numbers (1-31) of every holiday in that month
+        """
+        return self._state.index.holidays_in_month(year, month)
+    
+    def timeline(self) -> HolidayTimeline:
+        """
+        Get the sorted view of the current index, building it on first use.
+        
+        Returns:
+            HolidayTimeline: Timeline of the current holidays
+        """
+        index = self._state.index
+        cached = self._timeline
+        if cached is None or cached[0] is not index:
+            cached = (index, HolidayTimeline(index.yearly, index.one_time, index.rules,
+                                             index.intervals))
+            self._timeline = cached
+        return cached[1]
+    
+    def next_holiday(self, date: datetime.date) -> Optional[datetime.date]:
+        """
+        Find the first holiday after the given date.
+        
+        Args:
+            date (datetime.date): Date to search from (not included)
+            
+        Returns:
+            Optional[datetime.date]: The next holiday, None if there is none
+        """
+        return self.timeline().next_holiday(date)
+    
+    def previous_holiday(self, date: datetime.date) -> Optional[datetime.date]:
+        """
+        Find the last holiday before the given date.
+        
+        Args:
+            date (datetime.date): Date to search from (not included)
+            
+        Returns:
+            Optional[datetime.date]: The previous holiday, None if there is none
+        """
+        return self.timeline().previous_holiday(date)
+    
+    def holidays_between(self, start: datetime.date,
+                         end: datetime.date) -> Iterator[datetime.date]:
+        """
+        Iterate over the holidays in [start, end), in date order.
+        
+        Yearly holidays and rules are expanded year by year while iterating,
+        so spans of any length cost only what is actually consumed.
+        
+        Args:
+            start (datetime.date): First day of the range
+            end (datetime.date): Day after the range
+            
+        Returns:
+            Iterator[datetime.date]: Holidays of the range
+        """
+        return self.timeline().holidays_between(start, end)
+    
+    def export(self, fmt: str, first_year: int, last_year: int) -> Iterator[str]:
+        """
+        Export the holidays of a span of years.
+        
+        Holidays are produced by holidays_between() while the output is
+        consumed, so any span is exported in constant memory.
+        
+        Args:
+            fmt (str): "ics" or "csv"
+            first_year (int): First exported year
+            last_year (int): Last exported year, inclusive
+            
+        Returns:
+            Iterator[str]: Lines of the exported file
+            
+        Raises:
+            ValueError: If the format is unknown
+        """
+        start = datetime.date(first_year, 1, 1)
+        if last_year < datetime.MAXYEAR:
+            dates = self.holidays_between(start, datetime.date(last_year + 1, 1, 1))
+        else:
+            last = datetime.date.max
+            dates = itertools.chain(self.holidays_between(start, last),
+                                    [last] if self.is_holiday(last.day, last.month, last.year)
+                                    else [])
+        if fmt == "ics":
+            return iter_ics(dates)
+        if fmt == "csv":
+            from .theme import DAY_NAMES
+            return iter_csv(dates, DAY_NAMES)
+        raise ValueError(f"neznana oblika izvoza '{fmt}'")
@@ -0,0 +1,390 @@
+"""
+iCalendar (.ics) import and export of holidays.
+
+Import works event by event: folded lines are unfolded on the fly, only
+the few properties of the current VEVENT are kept, and every event is
+converted to lines of the holidays file syntax ("01.01|Y",
+"-1.MON.05|Y", "27.10.2025-31.10.2025|N"). The store then parses those
+lines exactly like holidays.txt, so a feed with tens of thousands of events
+is loaded in bounded memory and reloaded incrementally.
+
+Yearly events (RRULE:FREQ=YEARLY) without an end become one yearly entry,
+a yearly date, range or weekday rule, and are never expanded. Yearly
+entries have no first year, so such an event also applies to the years
+before its DTSTART. Only yearly events limited by COUNT or UNTIL are
+expanded to their one-time dates. EXDATE and RDATE are not supported.
+
+Export goes the other way: the holidays of a span of years are written as
+ICS or CSV text by generators, one line at a time.
+"""
+
+import datetime
+import os
+import sys
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from .errors import HolidayError, LoadReport
+from .holiday_rules import HolidayRule, expand_rule, format_rule
+
+ICS_EXTENSIONS = (".ics", ".ical", ".ifb")
+
+# Properties of a VEVENT the importer looks at
+_PROPERTIES = ("DTSTART", "DTEND", "DURATION", "RRULE", "STATUS")
+
+_ICS_WEEKDAYS = {"MO": 0, "TU": 1, "WE": 2, "TH": 3, "FR": 4, "SA": 5, "SU": 6}
+
+# RRULE parts the importer understands, anything else is reported as unsupported
+_RRULE_PARTS = {"FREQ", "INTERVAL", "COUNT", "UNTIL", "BYMONTH", "BYMONTHDAY", "BYDAY",
+                "BYSETPOS", "WKST"}
+
+_ONE_DAY = datetime.timedelta(days=1)
+
+
+def is_ical(path: str) -> bool:
+    """
+    Check whether a holidays file is an iCalendar file, by its extension.
+
+    Args:
+        path (str): Path of the holidays file
+
+    Returns:
+        bool: True for .ics (and .ical, .ifb) files
+    """
+    return os.path.splitext(path)[1].lower() in ICS_EXTENSIONS
+
+
+def _unfold(lines: Iterable[str], report: LoadReport) -> Iterator[Tuple[int, str]]:
+    """Join folded lines (continuations start with a space or tab), counting lines read."""
+    pending = None
+    pending_num = 0
+    for line_num, line in enumerate(lines, 1):
+        report.lines_read = line_num
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and pending is not None:
+            pending += line[1:]
+            continue
+        if pending:
+            yield pending_num, pending
+        pending, pending_num = line, line_num
+    if pending:
+        yield pending_num, pending
+
+
+def _split_property(line: str) -> Tuple[str, str]:
+    """Split a content line into its upper-case name and its value, dropping parameters."""
+    colon = line.find(":")
+    if colon >= 0 and line.find('"', 0, colon) >= 0:
+        # A quoted parameter value may contain ':', find the first one outside quotes
+        in_quotes = False
+        for pos, char in enumerate(line):
+            if char == '"':
+                in_quotes = not in_quotes
+            elif char == ":" and not in_quotes:
+                colon = pos
+                break
+        else:
+            colon = -1
+    if colon < 0:
+        return line.strip().upper(), ""
+    return line[:colon].split(";", 1)[0].strip().upper(), line[colon + 1:].strip()
+
+
+def _parse_date(value: str) -> Tuple[datetime.date, bool]:
+    """
+    Parse a DATE or DATE-TIME value.
+
+    Returns:
+        Tuple[datetime.date, bool]: The date and whether the value had no time
+                                    part or a time of midnight
+    """
+    try:
+        date = datetime.date(int(value[0:4]), int(value[4:6]), int(value[6:8]))
+    except ValueError:
+        raise ValueError(f"neveljaven datum '{value}'") from None
+    time_part = value[9:15]
+    return date, not time_part or time_part == "000000"
+
+
+def _duration_days(value: str) -> int:
+    """Whole days of a DURATION such as "P3D" or "P1W", 0 for shorter durations."""
+    value = value.lstrip("+")
+    if not value.startswith("P"):
+        raise ValueError(f"neveljavno trajanje '{value}'")
+    days = 0
+    number = ""
+    for char in value[1:]:
+        if char.isdigit():
+            number += char
+        elif char == "W":
+            days += 7 * int(number or 0)
+            number = ""
+        elif char == "D":
+            days += int(number or 0)
+            number = ""
+        elif char == "T":
+            break  # Hours and minutes do not add days
+        else:
+            raise ValueError(f"neveljavno trajanje '{value}'")
+    return days
+
+
+def _event_span(event: Dict[str, str]) -> Tuple[datetime.date, int]:
+    """Get the first day of an event and how many days after it the event ends."""
+    start, start_midnight = _parse_date(event["DTSTART"])
+    if "DTEND" in event:
+        end, end_midnight = _parse_date(event["DTEND"])
+        # DTEND is exclusive: an all-day event on 01.01 ends on 02.01
+        if end_midnight and end > start:
+            end -= _ONE_DAY
+    elif "DURATION" in event:
+        days = _duration_days(event["DURATION"])
+        end = start + datetime.timedelta(days=max(days - 1, 0) if start_midnight else days)
+    else:
+        end = start
+    return start, max((end - start).days, 0)
+
+
+def _one_time(start: datetime.date, days: int) -> str:
+    """Format a one-time date or range in the holidays file syntax."""
+    first = f"{start.day:02d}.{start.month:02d}.{start.year}"
+    if not days:
+        return first + "|N"
+    end = start + datetime.timedelta(days=days)
+    return f"{first}-{end.day:02d}.{end.month:02d}.{end.year}|N"
+
+
+def _weekday_rule(byday: str, month: int, bysetpos: Optional[str]) -> HolidayRule:
+    """Convert BYDAY (e.g. "-1MO", or "MO" with BYSETPOS=-1) in one month to a rule."""
+    if "," in byday or (bysetpos and "," in bysetpos):
+        raise ValueError(f"več dni v BYDAY ni podprtih ('{byday}')")
+    weekday = _ICS_WEEKDAYS.get(byday[-2:].upper())
+    if weekday is None:
+        raise ValueError(f"neznan dan v tednu '{byday}'")
+    ordinal = byday[:-2] or bysetpos
+    if not ordinal:
+        raise ValueError(f"BYDAY '{byday}' brez zaporedne številke ni podprt")
+    n = int(ordinal)
+    if n == 0 or not -5 <= n <= 5:
+        raise ValueError(f"neveljavna ponovitev dneva '{byday}'")
+    return HolidayRule("weekday", n=n, weekday=weekday, month=month)
+
+
+def event_lines(event: Dict[str, str]) -> Iterator[str]:
+    """
+    Convert one VEVENT to lines of the holidays file syntax.
+
+    Args:
+        event (Dict[str, str]): Values of the DTSTART, DTEND, DURATION and
+                                RRULE properties present in the event
+
+    Yields:
+        str: Holiday lines, e.g. "01.01|Y", "-1.MON.05|Y" or "24.12.2025|N";
+             yearly events limited by COUNT or UNTIL yield one line per year,
+             open-ended ones a single yearly line that also covers the
+             years before DTSTART
+
+    Raises:
+        ValueError: If the event uses something that cannot be represented
+    """
+    start, days = _event_span(event)
+    if "RRULE" not in event:
+        yield _one_time(start, days)
+        return
+
+    parts = {}
+    for part in event["RRULE"].upper().split(";"):
+        key, _, value = part.partition("=")
+        parts[key.strip()] = value.strip()
+    unsupported = sorted(set(parts) - _RRULE_PARTS)
+    if unsupported:
+        raise ValueError(f"nepodprt del RRULE: {', '.join(unsupported)}")
+    if parts.get("FREQ") != "YEARLY":
+        raise ValueError(f"podprta so samo letna ponavljanja (FREQ={parts.get('FREQ')})")
+
+    month = int(parts.get("BYMONTH", start.month))
+    if "BYMONTHDAY" in parts and (int(parts["BYMONTHDAY"]), month) != (start.day, start.month):
+        raise ValueError(f"BYMONTHDAY={parts['BYMONTHDAY']} se ne ujema z DTSTART")
+    rule = None
+    if "BYDAY" in parts:
+        rule = _weekday_rule(parts["BYDAY"], month, parts.get("BYSETPOS"))
+        if days:
+            raise ValueError("večdnevni dogodki s pravilom BYDAY niso podprti")
+    elif month != start.month:
+        raise ValueError(f"BYMONTH={month} se ne ujema z DTSTART")
+    if days >= 365:
+        raise ValueError("letni dogodek je daljši od enega leta")
+
+    interval = int(parts.get("INTERVAL", 1))
+    if interval < 1:
+        raise ValueError(f"neveljaven INTERVAL={interval}")
+    count = int(parts["COUNT"]) if "COUNT" in parts else None
+    until = _parse_date(parts["UNTIL"])[0] if "UNTIL" in parts else None
+
+    if count is None and until is None:
+        if interval != 1:
+            raise ValueError("INTERVAL brez COUNT ali UNTIL ni podprt")
+        # Open-ended: one yearly entry, the recurring index handles every year.
+        # Yearly entries have no first year, the DTSTART year is dropped
+        if rule is not None:
+            yield format_rule(rule) + "|Y"
+            return
+        first = f"{start.day:02d}.{start.month:02d}"
+        if not days:
+            yield first + "|Y"
+            return
+        end = start + datetime.timedelta(days=days)
+        yield f"{first}-{end.day:02d}.{end.month:02d}|Y"
+        return
+
+    # Limited: expand to one-time dates, a year at a time
+    occurrences = 0
+    for year in range(start.year, datetime.MAXYEAR + 1, interval):
+        if rule is not None:
+            day_month = expand_rule(rule, year)
+            if day_month is None:
+                continue
+            date = datetime.date(year, *day_month)
+        else:
+            try:
+                date = datetime.date(year, start.month, start.day)
+            except ValueError:
+                continue  # 29.02 in a non-leap year is not an occurrence
+        if date < start:
+            continue
+        if until is not None and date > until:
+            return
+        if date.toordinal() + days > datetime.date.max.toordinal():
+            return
+        yield _one_time(date, days)
+        occurrences += 1
+        if count is not None and occurrences >= count:
+            return
+
+
+def iter_ical_lines(lines: Iterable[str], report: LoadReport) -> Iterator[Tuple[int, str]]:
+    """
+    Stream the events of an iCalendar file as holiday lines.
+
+    Only the properties of the current event are held in memory. Events
+    that cannot be converted are recorded in the report and skipped,
+    cancelled events are ignored.
+
+    Args:
+        lines (Iterable[str]): Lines of the .ics file, e.g. an open file
+        report (LoadReport): Collects errors and the number of lines read
+
+    Yields:
+        Tuple[int, str]: Line number of BEGIN:VEVENT and a line in the
+                         holidays file syntax
+    """
+    event: Optional[Dict[str, str]] = None
+    event_num = 0
+    # Components nested in the current event, e.g. VALARM
+    nested = 0
+    for line_num, line in _unfold(lines, report):
+        name, value = _split_property(line)
+        if name == "BEGIN":
+            if event is not None:
+                nested += 1
+            elif value.upper() == "VEVENT":
+                event, event_num, nested = {}, line_num, 0
+            continue
+        if event is None:
+            continue
+        if name == "END":
+            if nested:
+                nested -= 1
+                continue
+            if event.get("STATUS", "").upper() != "CANCELLED":
+                try:
+                    if "DTSTART" not in event:
+                        raise ValueError("dogodek nima DTSTART")
+                    for holiday_line in event_lines(event):
+                        yield event_num, holiday_line
+                except ValueError as e:
+                    report.add_error(HolidayError(str(e), event_num, event.get("RRULE", "VEVENT")))
+            event = None
+        elif not nested and name in _PROPERTIES:
+            event[name] = value
+
+
+def iter_ics(dates: Iterable[datetime.date], summary: str = "Praznik",
+             stamp: Optional[datetime.datetime] = None) -> Iterator[str]:
+    """
+    Write holidays as an iCalendar file.
+
+    Args:
+        dates (Iterable[datetime.date]): Holidays in date order, consumed lazily
+        summary (str): Title of every event
+        stamp (Optional[datetime.datetime]): DTSTAMP of the events (UTC),
+                                             defaults to now
+
+    Yields:
+        str: CRLF-terminated lines of one all-day VEVENT per holiday
+    """
+    stamp = (stamp or datetime.datetime.now(datetime.timezone.utc)).strftime("%Y%m%dT%H%M%SZ")
+    summary = (summary.replace("\\", "\\\\").replace(";", "\\;")
+               .replace(",", "\\,").replace("\n", "\\n"))
+    yield "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//Koledar//SL\r\nCALSCALE:GREGORIAN\r\n"
+    for date in dates:
+        day = f"{date.year:04d}{date.month:02d}{date.day:02d}"
+        yield (f"BEGIN:VEVENT\r\nUID:{day}@koledar\r\nDTSTAMP:{stamp}\r\n"
+               f"DTSTART;VALUE=DATE:{day}\r\nSUMMARY:{summary}\r\n"
+               f"TRANSP:TRANSPARENT\r\nEND:VEVENT\r\n")
+    yield "END:VCALENDAR\r\n"
+
+
+def iter_csv(dates: Iterable[datetime.date], day_names: Iterable[str]) -> Iterator[str]:
+    """
+    Write holidays as CSV.
+
+    Args:
+        dates (Iterable[datetime.date]): Holidays in date order, consumed lazily
+        day_names (Iterable[str]): Names of the weekdays, Monday first
+
+    Yields:
+        str: A "date,weekday" header, then one line per holiday
+    """
+    day_names = list(day_names)
+    yield "date,weekday\n"
+    for date in dates:
+        yield f"{date.isoformat()},{day_names[date.weekday()]}\n"
+
+
+def main_export(path: str, holidays_file: str, years: str) -> int:
+    """
+    Command line entry point used by main.py --export.
+
+    Args:
+        path (str): Output file, ".csv" files are written as CSV and anything
+                    else as ICS; "-" writes ICS to stdout
+        holidays_file (str): Holidays file (.txt or .ics)
+        years (str): "2025" or "2025-2030"
+
+    Returns:
+        int: Process exit code
+    """
+    from .holiday_store import HolidayStore
+    from .service import QueryError, parse_years
+
+    try:
+        year_range = parse_years(years)
+    except QueryError as e:
+        print(f"Napaka: {e}", file=sys.stderr)
+        return 2
+    store = HolidayStore(holidays_file, use_snapshot=True)
+    if not store.report.ok:
+        print(store.report.summary(), file=sys.stderr)
+
+    fmt = "csv" if path.lower().endswith(".csv") else "ics"
+    lines = store.export(fmt, year_range.start, year_range.stop - 1)
+    if path == "-":
+        sys.stdout.writelines(lines)
+        return 0
+    try:
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            f.writelines(lines)
+    except OSError as e:
+        print(f"Napaka: {e}", file=sys.stderr)
+        return 1
+    return 0
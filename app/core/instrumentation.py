@@ -0,0 +1,211 @@
+"""
+Opt-in call counters and timing histograms for hot paths.
+
+Methods are marked with @hot_path. While instrumentation is disabled (the
+default) the marker leaves the plain function in the class, so a marked
+method costs exactly as much as an unmarked one. enable() replaces every
+marked method with a timing wrapper; call it before objects whose bound
+methods are kept elsewhere (e.g. Tk callbacks) are created.
+"""
+
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Tuple
+
+# Histogram buckets: calls that took < 1 µs, < 2 µs, < 4 µs, ... < 2^(BUCKETS-1) µs
+BUCKETS = 24
+
+
+class CallStats:
+    """
+    Call count, total time and a log2 histogram of durations.
+
+    Attributes:
+        count (int): Number of calls
+        total (float): Total time in seconds
+        histogram (List[int]): Calls per duration bucket, see BUCKETS
+    """
+
+    __slots__ = ("count", "total", "histogram")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.histogram = [0] * BUCKETS
+
+    def record(self, duration: float):
+        """
+        Record one call.
+
+        Args:
+            duration (float): Duration of the call in seconds
+        """
+        self.count += 1
+        self.total += duration
+        bucket = min(int(duration * 1_000_000).bit_length(), BUCKETS - 1)
+        self.histogram[bucket] += 1
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Estimate a percentile from the histogram.
+
+        Args:
+            fraction (float): e.g. 0.5 for the median
+
+        Returns:
+            float: Upper bound of the bucket holding the percentile, in µs
+        """
+        target = fraction * self.count
+        seen = 0
+        for bucket, calls in enumerate(self.histogram):
+            seen += calls
+            if calls and seen >= target:
+                return float(1 << bucket)
+        return 0.0
+
+
+_enabled = False
+_stats: Dict[str, CallStats] = {}
+_lock = threading.Lock()
+# (owner class, attribute name, original function, stats name) of every @hot_path
+_registry: List[Tuple[type, str, Callable, str]] = []
+
+
+def is_enabled() -> bool:
+    """bool: True once enable() was called."""
+    return _enabled
+
+
+def stats_for(name: str) -> CallStats:
+    """
+    Get (or create) the statistics of a name.
+
+    Args:
+        name (str): Name of the instrumented call
+
+    Returns:
+        CallStats: Its statistics
+    """
+    stats = _stats.get(name)
+    if stats is None:
+        with _lock:
+            stats = _stats.setdefault(name, CallStats())
+    return stats
+
+
+def _timed(func: Callable, name: str) -> Callable:
+    """Wrap a function so every call is recorded under name."""
+    stats = stats_for(name)
+    perf_counter = time.perf_counter
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stats.record(perf_counter() - start)
+
+    return wrapper
+
+
+class hot_path:
+    """
+    Mark a method for instrumentation.
+
+    Used as a decorator in a class body. When the class is created the
+    marker puts the undecorated function back, so nothing changes until
+    enable() is called.
+
+    Args:
+        name (str): Name in the report, defaults to "Class.method"
+    """
+
+    def __init__(self, name: str = None):
+        self.name = name
+        self.func = None
+
+    def __call__(self, func: Callable) -> "hot_path":
+        self.func = func
+        return self
+
+    def __set_name__(self, owner: type, attr: str):
+        name = self.name or f"{owner.__name__}.{attr}"
+        _registry.append((owner, attr, self.func, name))
+        setattr(owner, attr, _timed(self.func, name) if _enabled else self.func)
+
+
+def enable():
+    """Replace every @hot_path method with its timing wrapper."""
+    global _enabled
+    if _enabled:
+        return
+    _enabled = True
+    for owner, attr, func, name in _registry:
+        setattr(owner, attr, _timed(func, name))
+
+
+def timed(func: Callable, name: str) -> Callable:
+    """
+    Get a function to call in a loop, timed if instrumentation is enabled.
+
+    For module-level functions, which @hot_path cannot mark: look the
+    function up once before the loop, so a disabled run calls it directly.
+
+    Args:
+        func (Callable): Function to call
+        name (str): Name in the report
+
+    Returns:
+        Callable: func itself, or its timing wrapper
+    """
+    return _timed(func, name) if _enabled else func
+
+
+@contextmanager
+def measure(name: str):
+    """
+    Time the enclosed block under name, if instrumentation is enabled.
+
+    Args:
+        name (str): Name in the report
+    """
+    if not _enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats_for(name).record(time.perf_counter() - start)
+
+
+def snapshot() -> Dict[str, CallStats]:
+    """
+    Get the statistics recorded so far.
+
+    Returns:
+        Dict[str, CallStats]: Statistics by name
+    """
+    with _lock:
+        return dict(_stats)
+
+
+def report() -> str:
+    """
+    Format the recorded statistics as a table.
+
+    Returns:
+        str: One line per instrumented call, slowest total first
+    """
+    lines = [f"{'klic':<34} {'število':>9} {'skupaj ms':>10} {'povpr. µs':>10} "
+             f"{'p50 µs':>8} {'p99 µs':>8}"]
+    for name, stats in sorted(snapshot().items(), key=lambda item: -item[1].total):
+        if not stats.count:
+            continue
+        lines.append(f"{name:<34} {stats.count:>9} {stats.total * 1000:>10.1f} "
+                     f"{stats.total / stats.count * 1_000_000:>10.1f} "
+                     f"{stats.percentile(0.5):>8.0f} {stats.percentile(0.99):>8.0f}")
+    return "\n".join(lines)
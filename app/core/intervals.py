@@ -0,0 +1,283 @@
+"""
+Holiday date ranges (school breaks, company shutdowns) stored as intervals.
+
+A range is one entry no matter how many days it spans. Ranges are merged
+into sorted, disjoint intervals, so a lookup is one bisection and a month
+query only touches the intervals that overlap the month; the days of a
+range are never materialized.
+
+Syntax in the holidays file:
+    24.12-31.12|Y               every year; a range like 24.12-02.01 wraps
+                                over the new year
+    27.10.2025-31.10.2025|N     once, may span several years
+"""
+
+import datetime
+from bisect import bisect_right
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .positions import MONTH_STARTS, day_position, month_positions
+
+# Positions in a leap year, 29.02 is position 59
+_LAST_POSITION = 365
+_FEB_29 = day_position(2, 29)
+
+
+class HolidayRange(NamedTuple):
+    """
+    A holiday spanning consecutive days.
+
+    Attributes:
+        start_day (int): First day (1-31)
+        start_month (int): Month of the first day
+        end_day (int): Last day, included
+        end_month (int): Month of the last day
+        start_year (Optional[int]): Year of the first day, None for yearly ranges
+        end_year (Optional[int]): Year of the last day, None for yearly ranges
+    """
+    start_day: int
+    start_month: int
+    end_day: int
+    end_month: int
+    start_year: Optional[int] = None
+    end_year: Optional[int] = None
+
+    @property
+    def yearly(self) -> bool:
+        """bool: True if the range repeats every year."""
+        return self.start_year is None
+
+
+def _is_leap(year: int) -> bool:
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def _parse_day(text: str) -> Tuple[int, int, Optional[int]]:
+    """Parse "DD.MM" or "DD.MM.YYYY" into (day, month, year)."""
+    fields = text.strip().split('.')
+    if len(fields) == 2:
+        day, month = map(int, fields)
+        year = None
+    elif len(fields) == 3:
+        day, month, year = map(int, fields)
+    else:
+        raise ValueError(f"neveljaven datum '{text.strip()}'")
+    # 2000 is a leap year so 29.02 is accepted for yearly ranges
+    datetime.date(year or 2000, month, day)
+    return day, month, year
+
+
+def parse_range(date_part: str, repeat_flag: str) -> HolidayRange:
+    """
+    Parse the date part of a range entry.
+
+    Args:
+        date_part (str): "DD.MM-DD.MM" or "DD.MM.YYYY-DD.MM.YYYY"
+        repeat_flag (str): "Y" for yearly, "N" for one-time ranges
+
+    Returns:
+        HolidayRange: The parsed range
+
+    Raises:
+        ValueError: If the range is malformed
+    """
+    bounds = date_part.split('-')
+    if len(bounds) != 2:
+        raise ValueError(f"neveljavno obdobje '{date_part}'")
+    start_day, start_month, start_year = _parse_day(bounds[0])
+    end_day, end_month, end_year = _parse_day(bounds[1])
+
+    if (start_year is None) != (end_year is None):
+        raise ValueError("obe meji obdobja morata imeti leto ali pa nobena")
+    if start_year is None:
+        if repeat_flag != 'Y':
+            raise ValueError("obdobje brez let mora biti ponavljajoče (Y)")
+        return HolidayRange(start_day, start_month, end_day, end_month)
+
+    if repeat_flag != 'N':
+        raise ValueError("obdobje z leti mora biti enkratno (N)")
+    if (start_year, start_month, start_day) > (end_year, end_month, end_day):
+        raise ValueError("konec obdobja je pred začetkom")
+    return HolidayRange(start_day, start_month, end_day, end_month, start_year, end_year)
+
+
+def format_range(holiday_range: HolidayRange) -> str:
+    """
+    Format a range as an entry of the holidays file.
+
+    Args:
+        holiday_range (HolidayRange): The range
+
+    Returns:
+        str: e.g. "24.12-31.12|Y" or "27.10.2025-31.10.2025|N"
+    """
+    r = holiday_range
+    if r.yearly:
+        return f"{r.start_day:02d}.{r.start_month:02d}-{r.end_day:02d}.{r.end_month:02d}|Y"
+    return (f"{r.start_day:02d}.{r.start_month:02d}.{r.start_year}-"
+            f"{r.end_day:02d}.{r.end_month:02d}.{r.end_year}|N")
+
+
+def range_intervals(holiday_range: HolidayRange) -> List[Tuple[int, int]]:
+    """
+    Get the closed intervals a range covers.
+
+    Args:
+        holiday_range (HolidayRange): The range
+
+    Returns:
+        List[Tuple[int, int]]: Day positions (see positions.day_position) for
+                               yearly ranges, split in two if the range wraps
+                               over the new year; date ordinals otherwise
+    """
+    r = holiday_range
+    if r.yearly:
+        start = day_position(r.start_month, r.start_day)
+        end = day_position(r.end_month, r.end_day)
+        if start <= end:
+            return [(start, end)]
+        return [(start, _LAST_POSITION), (0, end)]
+    return [(datetime.date(r.start_year, r.start_month, r.start_day).toordinal(),
+             datetime.date(r.end_year, r.end_month, r.end_day).toordinal())]
+
+
+def _merge(intervals: Iterable[Tuple[int, int]]) -> Tuple[List[int], List[int]]:
+    """Merge closed intervals into sorted, disjoint (starts, ends) lists."""
+    starts: List[int] = []
+    ends: List[int] = []
+    for start, end in sorted(intervals):
+        if ends and start <= ends[-1] + 1:
+            ends[-1] = max(ends[-1], end)
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+def _covered(starts: List[int], ends: List[int], value: int) -> bool:
+    index = bisect_right(starts, value) - 1
+    return index >= 0 and value <= ends[index]
+
+
+def _overlapping(starts: List[int], ends: List[int], low: int,
+                 high: int) -> Iterator[Tuple[int, int]]:
+    """Yield the parts of the intervals inside the closed span [low, high]."""
+    index = max(bisect_right(starts, low) - 1, 0)
+    while index < len(starts) and starts[index] <= high:
+        start, end = max(starts[index], low), min(ends[index], high)
+        if start <= end:
+            yield start, end
+        index += 1
+
+
+class IntervalIndex:
+    """
+    Lookups over a set of HolidayRange entries.
+
+    Yearly ranges are kept as intervals of day positions, one-time ranges
+    as intervals of date ordinals. Both are merged into disjoint sorted
+    lists, so every query is a bisection plus the overlapping intervals.
+
+    Attributes:
+        ranges (Tuple[HolidayRange, ...]): The indexed ranges
+    """
+
+    def __init__(self, ranges: Iterable[HolidayRange] = ()):
+        """
+        Build the index.
+
+        Args:
+            ranges (Iterable[HolidayRange]): Ranges to index
+        """
+        self.ranges = tuple(ranges)
+        yearly, one_time = [], []
+        for holiday_range in self.ranges:
+            (yearly if holiday_range.yearly else one_time).extend(range_intervals(holiday_range))
+        self._yearly_starts, self._yearly_ends = _merge(yearly)
+        self._starts, self._ends = _merge(one_time)
+
+    def __bool__(self) -> bool:
+        return bool(self.ranges)
+
+    @property
+    def has_yearly(self) -> bool:
+        """bool: True if some ranges repeat every year."""
+        return bool(self._yearly_starts)
+
+    def is_holiday(self, day: int, month: int, year: int) -> bool:
+        """Check if a date falls into a range."""
+        if self._yearly_starts and _covered(self._yearly_starts, self._yearly_ends,
+                                            day_position(month, day)):
+            return True
+        return bool(self._starts) and _covered(self._starts, self._ends,
+                                               datetime.date(year, month, day).toordinal())
+
+    def holidays_in_month(self, year: int, month: int) -> set:
+        """Get the day numbers of a month that fall into a range."""
+        days = set()
+        length = MONTH_STARTS[month] - MONTH_STARTS[month - 1]
+        if month == 2 and not _is_leap(year):
+            length -= 1
+        if self._yearly_starts:
+            positions = month_positions(month)
+            for start, end in _overlapping(self._yearly_starts, self._yearly_ends,
+                                           positions.start, positions.start + length - 1):
+                days.update(range(start - positions.start + 1, end - positions.start + 2))
+        if self._starts:
+            first = datetime.date(year, month, 1).toordinal()
+            for start, end in _overlapping(self._starts, self._ends, first, first + length - 1):
+                days.update(range(start - first + 1, end - first + 2))
+        return days
+
+    def yearly_ordinals(self, year: int) -> List[int]:
+        """
+        Get the dates of a year covered by yearly ranges.
+
+        Args:
+            year (int): Year (e.g., 2024)
+
+        Returns:
+            List[int]: Sorted date ordinals
+        """
+        base = datetime.date(year, 1, 1).toordinal()
+        leap = _is_leap(year)
+        ordinals = []
+        for start, end in zip(self._yearly_starts, self._yearly_ends):
+            for position in range(start, end + 1):
+                if position == _FEB_29 and not leap:
+                    continue
+                # Positions after 29.02 are one day further than in a common year
+                ordinals.append(base + position - (1 if position > _FEB_29 and not leap else 0))
+        return ordinals
+
+    def one_time_ordinals(self, first: int, end: int) -> Iterator[int]:
+        """
+        Iterate over the dates in [first, end) covered by one-time ranges.
+
+        Args:
+            first (int): Ordinal of the first day
+            end (int): Ordinal of the day after the span
+
+        Yields:
+            int: Date ordinals in order
+        """
+        for start, stop in _overlapping(self._starts, self._ends, first, end - 1):
+            yield from range(start, stop + 1)
+
+    def next_one_time(self, ordinal: int) -> Optional[int]:
+        """Get the first date after ordinal covered by a one-time range."""
+        target = ordinal + 1
+        index = bisect_right(self._starts, target) - 1
+        if index >= 0 and target <= self._ends[index]:
+            return target
+        if index + 1 < len(self._starts):
+            return self._starts[index + 1]
+        return None
+
+    def previous_one_time(self, ordinal: int) -> Optional[int]:
+        """Get the last date before ordinal covered by a one-time range."""
+        target = ordinal - 1
+        index = bisect_right(self._starts, target) - 1
+        if index < 0:
+            return None
+        return min(self._ends[index], target)
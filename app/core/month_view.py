@@ -0,0 +1,278 @@
+import datetime
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple, Optional, Tuple
+
+
+# Cell classifications, in order of display priority
+CELL_EMPTY = "empty"
+CELL_TODAY = "today"
+CELL_HOLIDAY = "holiday"
+CELL_SUNDAY = "sunday"
+CELL_NORMAL = "normal"
+
+# The grid always has 6 weeks, because a month can start on Sunday
+WEEKS = 6
+
+# Bit flags of one day, see month_flags()
+DAY_TODAY = 1
+DAY_SUNDAY = 2
+DAY_SATURDAY = 4
+DAY_HOLIDAY = 8
+
+# Month offsets of Sakamoto's day-of-week method
+_SAKAMOTO = (0, 3, 2, 5, 0, 3, 5, 1, 4, 6, 2, 4)
+_MONTH_LENGTHS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+_MAX_ORDINAL = datetime.date.max.toordinal()
+
+# Cell classification for every combination of day flags, by display priority
+_KINDS = tuple(CELL_TODAY if flags & DAY_TODAY else
+               CELL_HOLIDAY if flags & DAY_HOLIDAY else
+               CELL_SUNDAY if flags & DAY_SUNDAY else
+               CELL_NORMAL for flags in range(16))
+
+
+class MonthView(NamedTuple):
+    """
+    Precomputed contents of the calendar grid for one month.
+
+    Attributes:
+        year (int): Year of the month
+        month (int): Month (1-12)
+        today (Optional[datetime.date]): Date the classification was computed for
+        cells (tuple): 6 rows of 7 (day, kind) tuples, day is 0 for empty cells
+        flags (bytes): DAY_* bit flags of every day of the month, index 0 is day 1
+    """
+    year: int
+    month: int
+    today: Optional[datetime.date]
+    cells: Tuple[Tuple[Tuple[int, str], ...], ...]
+    flags: bytes = b""
+
+
+def month_shape(year: int, month: int) -> Tuple[int, int]:
+    """
+    Get the weekday of the first day and the length of a month.
+
+    Args:
+        year (int): Year (e.g., 2024)
+        month (int): Month (1-12)
+
+    Returns:
+        Tuple[int, int]: (weekday of day 1 with Monday=0, number of days)
+    """
+    leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    length = 29 if month == 2 and leap else _MONTH_LENGTHS[month - 1]
+    y = year - (month < 3)
+    # Sakamoto counts from Sunday=0, shift to Monday=0
+    sunday_based = (y + y // 4 - y // 100 + y // 400 + _SAKAMOTO[month - 1] + 1) % 7
+    return (sunday_based + 6) % 7, length
+
+
+def month_flags(first_weekday: int, length: int, holidays, today_day: int = 0) -> bytearray:
+    """
+    Classify every day of a month with bit flags, without building dates.
+
+    Args:
+        first_weekday (int): Weekday of day 1, Monday=0
+        length (int): Number of days in the month
+        holidays: Holiday day numbers of the month (1-31)
+        today_day (int): Day number of today, 0 if today is in another month
+
+    Returns:
+        bytearray: DAY_* flags of every day, index 0 is day 1
+    """
+    flags = bytearray(length)
+    for index in range((5 - first_weekday) % 7, length, 7):
+        flags[index] = DAY_SATURDAY
+    for index in range((6 - first_weekday) % 7, length, 7):
+        flags[index] = DAY_SUNDAY
+    for day in holidays:
+        if 1 <= day <= length:
+            flags[day - 1] |= DAY_HOLIDAY
+    if today_day:
+        flags[today_day - 1] |= DAY_TODAY
+    return flags
+
+
+def build_month_view(year: int, month: int, holiday_store,
+                     today: Optional[datetime.date]) -> MonthView:
+    """
+    Classify every cell of the calendar grid for the given month.
+
+    The month is classified by month_flags() from its first weekday and
+    length; the clock is not read, today is passed in by the caller.
+
+    Args:
+        year (int): Year (e.g., 2024)
+        month (int): Month (1-12)
+        holiday_store (HolidayStore): Holiday data
+        today (Optional[datetime.date]): Date highlighted as today, None for none
+
+    Returns:
+        MonthView: Day number and classification of all 42 cells
+    """
+    first_weekday, length = month_shape(year, month)
+    today_day = (today.day if today is not None and (today.year, today.month) == (year, month)
+                 else 0)
+    flags = month_flags(first_weekday, length,
+                        holiday_store.holidays_in_month(year, month), today_day)
+
+    cells = [(0, CELL_EMPTY)] * first_weekday
+    cells.extend((day, _KINDS[day_flags]) for day, day_flags in enumerate(flags, 1))
+    cells.extend([(0, CELL_EMPTY)] * (WEEKS * 7 - len(cells)))
+    rows = tuple(tuple(cells[start:start + 7]) for start in range(0, WEEKS * 7, 7))
+
+    return MonthView(year, month, today, rows, bytes(flags))
+
+
+class MonthViewCache:
+    """
+    Bounded LRU cache of MonthView objects keyed by (year, month).
+
+    The cache is cleared automatically when the holiday data changes and
+    can prefetch neighbouring months on a background thread, so stepping
+    through months only has to paint widgets.
+
+    Attributes:
+        holiday_store (HolidayStore): Holiday data used for classification
+        maxsize (int): Maximum number of months kept in the cache
+    """
+
+    def __init__(self, holiday_store, maxsize: int = 24):
+        """
+        Initialize the MonthViewCache.
+
+        Args:
+            holiday_store (HolidayStore): Holiday data used for classification
+            maxsize (int): Maximum number of months kept in the cache
+        """
+        self.holiday_store = holiday_store
+        self.maxsize = maxsize
+
+        self._views = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = holiday_store.version
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def set_holiday_store(self, holiday_store):
+        """
+        Classify months with different holiday data and drop cached months.
+
+        Args:
+            holiday_store: Anything with the HolidayStore lookup interface
+                           (holidays_in_month and version), e.g. a RegionOverlay
+        """
+        with self._lock:
+            self.holiday_store = holiday_store
+        self.invalidate()
+
+    def invalidate(self):
+        """Drop all cached months."""
+        with self._lock:
+            self._views.clear()
+            self._version = self.holiday_store.version
+
+    def _lookup(self, key, today: datetime.date) -> Optional[MonthView]:
+        """Return a cached view that is still valid, or None."""
+        with self._lock:
+            if self._version != self.holiday_store.version:
+                self._views.clear()
+                self._version = self.holiday_store.version
+                return None
+            view = self._views.get(key)
+            if view is None or view.today != today:
+                return None
+            self._views.move_to_end(key)
+            return view
+
+    def _store(self, view: MonthView, version: int):
+        """Add a view to the cache unless the holiday data changed meanwhile."""
+        with self._lock:
+            if version != self._version:
+                return
+            self._views[(view.year, view.month)] = view
+            self._views.move_to_end((view.year, view.month))
+            while len(self._views) > self.maxsize:
+                self._views.popitem(last=False)
+
+    def get(self, year: int, month: int,
+            today: Optional[datetime.date] = None) -> MonthView:
+        """
+        Get the view for a month, building it if it is not cached.
+
+        Args:
+            year (int): Year (e.g., 2024)
+            month (int): Month (1-12)
+            today (datetime.date): Date highlighted as today, defaults to the current date
+
+        Returns:
+            MonthView: Classified cells of the month
+        """
+        if today is None:
+            today = datetime.date.today()
+
+        view = self._lookup((year, month), today)
+        if view is None:
+            version = self.holiday_store.version
+            view = build_month_view(year, month, self.holiday_store, today)
+            self._store(view, version)
+        return view
+
+    def week(self, first_ordinal: int,
+             today: Optional[datetime.date] = None) -> Tuple[Tuple[int, int, int, str], ...]:
+        """
+        Classify the seven days of a week, which may span two months.
+
+        Args:
+            first_ordinal (int): Date ordinal of the Monday of the week
+            today (datetime.date): Date highlighted as today, defaults to the current date
+
+        Returns:
+            tuple: (year, month, day, kind) of each day; days after
+                   datetime.date.max are (0, 0, 0, CELL_EMPTY)
+        """
+        if today is None:
+            today = datetime.date.today()
+        days = []
+        view = None
+        for ordinal in range(first_ordinal, first_ordinal + 7):
+            if ordinal > _MAX_ORDINAL:
+                days.append((0, 0, 0, CELL_EMPTY))
+                continue
+            date = datetime.date.fromordinal(ordinal)
+            if view is None or view.month != date.month:
+                view = self.get(date.year, date.month, today)
+            days.append((date.year, date.month, date.day, _KINDS[view.flags[date.day - 1]]))
+        return tuple(days)
+
+    def prefetch(self, year: int, month: int,
+                 today: Optional[datetime.date] = None):
+        """
+        Build the previous and next month on a background thread.
+
+        Args:
+            year (int): Year of the currently displayed month
+            month (int): Currently displayed month (1-12)
+            today (datetime.date): Date highlighted as today, defaults to the current date
+        """
+        if today is None:
+            today = datetime.date.today()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+
+        for offset in (-1, 1):
+            n_year, n_month = divmod(year * 12 + month - 1 + offset, 12)
+            n_month += 1
+            if not datetime.MINYEAR <= n_year <= datetime.MAXYEAR:
+                continue
+            if self._lookup((n_year, n_month), today) is None:
+                self._executor.submit(self.get, n_year, n_month, today)
+
+    def shutdown(self):
+        """Stop the prefetch thread."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -0,0 +1,250 @@
+"""
+Notes and events attached to calendar days, stored in a local SQLite file.
+
+Nothing is loaded up front: a month's notes are read with one query on the
+(year, month, day) index the first time the month is shown and kept in a
+small LRU cache. Edits are applied to the cache at once and written to disk
+by a single background writer thread, so the caller never waits on disk.
+Until a write is committed, its day is served from the pending edits, so
+reads always see the latest edit.
+
+The file can be shared: other connections' commits are noticed through
+PRAGMA data_version and drop the cached months.
+"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from .instrumentation import hot_path
+
+try:
+    import sqlite3
+except ImportError:  # Some Python builds lack sqlite3, notes are then unavailable
+    sqlite3 = None
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS notes (
+    id INTEGER PRIMARY KEY,
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS notes_day ON notes (year, month, day);
+"""
+
+# Notes of a month: day -> note texts in the order they were written
+MonthNotes = Dict[int, Tuple[str, ...]]
+
+
+class NoteStore:
+    """
+    Per-day notes in SQLite with lazy month loading and asynchronous writes.
+
+    All reads must come from the thread that created the store (the UI
+    thread); writes are queued to the writer thread.
+
+    Attributes:
+        path (str): Path of the SQLite file
+        maxsize (int): Maximum number of months kept in the cache
+    """
+
+    def __init__(self, path: str, maxsize: int = 24):
+        """
+        Open (and if needed create) the notes file.
+
+        Args:
+            path (str): Path of the SQLite file
+            maxsize (int): Maximum number of months kept in the cache
+
+        Raises:
+            RuntimeError: If sqlite3 is not available
+            sqlite3.Error: If the file cannot be opened
+        """
+        if sqlite3 is None:
+            raise RuntimeError("zapiski niso na voljo, Python nima modula sqlite3")
+        self.path = path
+        self.maxsize = maxsize
+
+        self._reader = sqlite3.connect(path)
+        # WAL lets the UI read while the writer commits
+        self._reader.execute("PRAGMA journal_mode=WAL")
+        self._reader.executescript(_SCHEMA)
+        self._reader.commit()
+        self._data_version = self._read_data_version()
+
+        self._months: "OrderedDict[Tuple[int, int], MonthNotes]" = OrderedDict()
+        # Edits not yet committed: (year, month, day) -> (edit number, texts)
+        self._pending: Dict[Tuple[int, int, int], Tuple[int, Tuple[str, ...]]] = {}
+        self._lock = threading.Lock()
+        self._edits = 0
+        self._errors: List[str] = []
+
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="notes-writer")
+        self._writer_db = None
+
+    def invalidate(self):
+        """Drop all cached months, they are read again when next shown."""
+        self._months.clear()
+
+    def _read_data_version(self) -> int:
+        return self._reader.execute("PRAGMA data_version").fetchone()[0]
+
+    @hot_path()
+    def month_notes(self, year: int, month: int) -> MonthNotes:
+        """
+        Get the notes of a month, querying the file only if it is not cached.
+
+        Args:
+            year (int): Year (e.g., 2024)
+            month (int): Month (1-12)
+
+        Returns:
+            MonthNotes: Note texts by day number, days without notes are missing
+        """
+        data_version = self._read_data_version()
+        if data_version != self._data_version:
+            # Another connection (our writer or another process) committed
+            self._data_version = data_version
+            self._months.clear()
+
+        key = (year, month)
+        notes = self._months.get(key)
+        if notes is not None:
+            self._months.move_to_end(key)
+            return notes
+
+        # Edits still on their way to disk win over what the query returns.
+        # They are taken before the query: an edit committed meanwhile is
+        # then either in the query result or in this copy
+        with self._lock:
+            pending = [(day, texts) for (edit_year, edit_month, day), (_, texts)
+                       in self._pending.items() if (edit_year, edit_month) == key]
+
+        days: Dict[int, List[str]] = {}
+        for day, text in self._reader.execute(
+                "SELECT day, text FROM notes WHERE year = ? AND month = ? ORDER BY day, id",
+                (year, month)):
+            days.setdefault(day, []).append(text)
+        notes = {day: tuple(texts) for day, texts in days.items()}
+        for day, texts in pending:
+            self._set(notes, day, texts)
+
+        self._months[key] = notes
+        while len(self._months) > self.maxsize:
+            self._months.popitem(last=False)
+        return notes
+
+    def day_notes(self, year: int, month: int, day: int) -> Tuple[str, ...]:
+        """
+        Get the notes of one day.
+
+        Args:
+            year (int): Year (e.g., 2024)
+            month (int): Month (1-12)
+            day (int): Day of the month
+
+        Returns:
+            Tuple[str, ...]: Note texts, empty if the day has none
+        """
+        return self.month_notes(year, month).get(day, ())
+
+    @staticmethod
+    def _set(notes: MonthNotes, day: int, texts: Tuple[str, ...]):
+        if texts:
+            notes[day] = texts
+        else:
+            notes.pop(day, None)
+
+    def set_day(self, year: int, month: int, day: int, texts: List[str]):
+        """
+        Replace the notes of a day; returns at once, the write happens in the background.
+
+        Args:
+            year (int): Year (e.g., 2024)
+            month (int): Month (1-12)
+            day (int): Day of the month
+            texts (List[str]): New notes, empty strings are dropped; an empty
+                               list deletes the day's notes
+        """
+        texts = tuple(text.strip() for text in texts if text.strip())
+        key = (year, month, day)
+        with self._lock:
+            self._edits += 1
+            edit = self._edits
+            self._pending[key] = (edit, texts)
+        notes = self._months.get((year, month))
+        if notes is not None:
+            self._set(notes, day, texts)
+        self._writer.submit(self._write, key, edit, texts)
+
+    def _write(self, key: Tuple[int, int, int], edit: int, texts: Tuple[str, ...]):
+        """Commit one edit; runs on the writer thread."""
+        try:
+            if self._writer_db is None:
+                self._writer_db = sqlite3.connect(self.path)
+            with self._writer_db:
+                self._writer_db.execute(
+                    "DELETE FROM notes WHERE year = ? AND month = ? AND day = ?", key)
+                self._writer_db.executemany(
+                    "INSERT INTO notes (year, month, day, text) VALUES (?, ?, ?, ?)",
+                    [key + (text,) for text in texts])
+        except sqlite3.Error as e:
+            # The edit stays pending, so it is still shown until the next start
+            with self._lock:
+                self._errors.append(f"Zapiska za {key[2]:02d}.{key[1]:02d}.{key[0]} "
+                                    f"ni bilo mogoče shraniti: {e}")
+            return
+        with self._lock:
+            # A newer edit of the same day is still queued, keep that one
+            if self._pending.get(key, (None,))[0] == edit:
+                del self._pending[key]
+
+    def take_errors(self) -> List[str]:
+        """
+        Get and clear the messages of failed writes.
+
+        Returns:
+            List[str]: One message per failed write
+        """
+        with self._lock:
+            errors, self._errors = self._errors, []
+        return errors
+
+    def flush(self):
+        """Wait until every queued edit is written."""
+        self._writer.submit(lambda: None).result()
+
+    def close(self):
+        """Write the queued edits and close the file."""
+        self._writer.submit(self._close_writer)
+        self._writer.shutdown(wait=True)
+        self._reader.close()
+
+    def _close_writer(self):
+        if self._writer_db is not None:
+            self._writer_db.close()
+            self._writer_db = None
+
+
+def open_notes(path: Optional[str]) -> Tuple[Optional[NoteStore], Optional[str]]:
+    """
+    Open the notes file if one is configured.
+
+    Args:
+        path (Optional[str]): Path of the SQLite file, None disables notes
+
+    Returns:
+        Tuple[Optional[NoteStore], Optional[str]]: The store, or None and a
+                                                   message why it is unavailable
+    """
+    if path is None:
+        return None, None
+    if sqlite3 is None:
+        return None, "Zapiski niso na voljo, Python nima modula sqlite3."
+    try:
+        return NoteStore(path), None
+    except sqlite3.Error as e:
+        return None, f"Zapiskov ni mogoče odpreti: {e}"
@@ -0,0 +1,37 @@
+"""
+Positions of days in a 366-day (leap) year.
+
+Every (month, day) pair maps to the same position in every year, so 29.02
+always has its own position. Used by snapshot bitmaps, the region matrix
+and yearly date ranges.
+"""
+
+# Day of (leap) year at which each month starts
+MONTH_STARTS = (0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335, 366)
+
+
+def day_position(month: int, day: int) -> int:
+    """
+    Get the bit position of a date in a 366-bit year bitmap.
+
+    Args:
+        month (int): Month (1-12)
+        day (int): Day of the month (1-31)
+
+    Returns:
+        int: Position 0-365
+    """
+    return MONTH_STARTS[month - 1] + day - 1
+
+
+def month_positions(month: int) -> range:
+    """
+    Get the bit positions covered by a month.
+
+    Args:
+        month (int): Month (1-12)
+
+    Returns:
+        range: Positions of day 1 up to the last possible day of the month
+    """
+    return range(MONTH_STARTS[month - 1], MONTH_STARTS[month])
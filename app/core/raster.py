@@ -0,0 +1,243 @@
+"""
+Minimal pure-Python raster canvas with PNG output.
+
+Enough to draw calendar pages without any imaging library: filled
+rectangles, text in a built-in 5x7 bitmap font (digits, upper-case
+letters including Č, Š and Ž) and a PNG encoder on top of zlib. Rows are
+filled with slice assignments, so a page costs a few thousand bytearray
+operations plus one zlib pass.
+"""
+
+import struct
+import zlib
+from functools import lru_cache
+from typing import Dict, Tuple
+
+GLYPH_WIDTH = 5
+GLYPH_HEIGHT = 7
+# Rows above the glyph used by the caron of Č, Š and Ž
+ACCENT_HEIGHT = 2
+
+_FONT_ROWS = {
+    "0": "01110 10001 10011 10101 11001 10001 01110",
+    "1": "00100 01100 00100 00100 00100 00100 01110",
+    "2": "01110 10001 00001 00010 00100 01000 11111",
+    "3": "11111 00010 00100 00010 00001 10001 01110",
+    "4": "00010 00110 01010 10010 11111 00010 00010",
+    "5": "11111 10000 11110 00001 00001 10001 01110",
+    "6": "00110 01000 10000 11110 10001 10001 01110",
+    "7": "11111 00001 00010 00100 01000 01000 01000",
+    "8": "01110 10001 10001 01110 10001 10001 01110",
+    "9": "01110 10001 10001 01111 00001 00010 01100",
+    "A": "01110 10001 10001 10001 11111 10001 10001",
+    "B": "11110 10001 10001 11110 10001 10001 11110",
+    "C": "01110 10001 10000 10000 10000 10001 01110",
+    "D": "11100 10010 10001 10001 10001 10010 11100",
+    "E": "11111 10000 10000 11110 10000 10000 11111",
+    "F": "11111 10000 10000 11110 10000 10000 10000",
+    "G": "01110 10001 10000 10111 10001 10001 01111",
+    "H": "10001 10001 10001 11111 10001 10001 10001",
+    "I": "01110 00100 00100 00100 00100 00100 01110",
+    "J": "00111 00010 00010 00010 00010 10010 01100",
+    "K": "10001 10010 10100 11000 10100 10010 10001",
+    "L": "10000 10000 10000 10000 10000 10000 11111",
+    "M": "10001 11011 10101 10101 10001 10001 10001",
+    "N": "10001 10001 11001 10101 10011 10001 10001",
+    "O": "01110 10001 10001 10001 10001 10001 01110",
+    "P": "11110 10001 10001 11110 10000 10000 10000",
+    "Q": "01110 10001 10001 10001 10101 10010 01101",
+    "R": "11110 10001 10001 11110 10100 10010 10001",
+    "S": "01111 10000 10000 01110 00001 00001 11110",
+    "T": "11111 00100 00100 00100 00100 00100 00100",
+    "U": "10001 10001 10001 10001 10001 10001 01110",
+    "V": "10001 10001 10001 10001 10001 01010 00100",
+    "W": "10001 10001 10001 10101 10101 10101 01010",
+    "X": "10001 10001 01010 00100 01010 10001 10001",
+    "Y": "10001 10001 10001 01010 00100 00100 00100",
+    "Z": "11111 00001 00010 00100 01000 10000 11111",
+    ".": "00000 00000 00000 00000 00000 01100 01100",
+    "-": "00000 00000 00000 11111 00000 00000 00000",
+    " ": "00000 00000 00000 00000 00000 00000 00000",
+}
+_CARON = "01010 00100"
+_ACCENTED = {"Č": "C", "Š": "S", "Ž": "Z"}
+
+
+def _pixels(rows: str, top: int = 0) -> Tuple[Tuple[int, int], ...]:
+    """Convert "01110 10001 ..." rows into (x, y) offsets of the set pixels."""
+    return tuple((x, y + top) for y, row in enumerate(rows.split())
+                 for x, bit in enumerate(row) if bit == "1")
+
+
+# (x, y) offsets of every glyph's pixels, y counted from the top of the caron rows
+_GLYPHS: Dict[str, Tuple[Tuple[int, int], ...]] = {
+    char: _pixels(rows, ACCENT_HEIGHT) for char, rows in _FONT_ROWS.items()}
+for _accented, _base in _ACCENTED.items():
+    _GLYPHS[_accented] = _pixels(_CARON) + _GLYPHS[_base]
+
+
+@lru_cache(maxsize=4096)
+def _text_runs(text: str, scale: int, bold: bool) -> Tuple[Tuple[int, int, int], ...]:
+    """
+    Get the pixels of a text as horizontal runs.
+
+    Calendars draw the same few hundred texts (day numbers, names) over and
+    over, so each one is rasterized once into merged runs per pixel row.
+
+    Returns:
+        Tuple[Tuple[int, int, int], ...]: (y, x, length) relative to the top left corner
+    """
+    rows: Dict[int, set] = {}
+    blank = _GLYPHS[" "]
+    for index, char in enumerate(text):
+        left = index * (GLYPH_WIDTH + 1) * scale
+        for px, py in _GLYPHS.get(char, blank):
+            xs = range(left + px * scale, left + (px + 1) * scale + bold)
+            for y in range(py * scale, (py + 1) * scale):
+                rows.setdefault(y, set()).update(xs)
+    runs = []
+    for y, xs in sorted(rows.items()):
+        xs = sorted(xs)
+        start = previous = xs[0]
+        for x in xs[1:]:
+            if x != previous + 1:
+                runs.append((y, start, previous + 1 - start))
+                start = x
+            previous = x
+        runs.append((y, start, previous + 1 - start))
+    return tuple(runs)
+
+
+def rgb(color: str) -> bytes:
+    """
+    Convert a "#RRGGBB" color to three bytes.
+
+    Args:
+        color (str): Color in hex notation
+
+    Returns:
+        bytes: Red, green and blue
+    """
+    return bytes.fromhex(color.lstrip("#"))
+
+
+def text_size(text: str, scale: int) -> Tuple[int, int]:
+    """
+    Get the size of a text drawn with Raster.text().
+
+    Args:
+        text (str): Text, drawn upper-case
+        scale (int): Size of one font pixel
+
+    Returns:
+        Tuple[int, int]: (width, height) in pixels, including the caron rows
+    """
+    width = max(len(text) * (GLYPH_WIDTH + 1) - 1, 0) * scale
+    return width, (GLYPH_HEIGHT + ACCENT_HEIGHT) * scale
+
+
+class Raster:
+    """
+    RGB image in a bytearray.
+
+    Attributes:
+        width (int): Width in pixels
+        height (int): Height in pixels
+        pixels (bytearray): Rows of RGB triples, top row first
+    """
+
+    def __init__(self, width: int, height: int, background: str = "#FFFFFF"):
+        """
+        Create an image filled with one color.
+
+        Args:
+            width (int): Width in pixels
+            height (int): Height in pixels
+            background (str): Fill color, "#RRGGBB"
+        """
+        self.width = width
+        self.height = height
+        self.pixels = bytearray(rgb(background)) * (width * height)
+
+    def fill_rect(self, x: int, y: int, width: int, height: int, color: bytes):
+        """
+        Fill a rectangle, clipped to the image.
+
+        Args:
+            x (int): Left edge
+            y (int): Top edge
+            width (int): Width in pixels
+            height (int): Height in pixels
+            color (bytes): RGB bytes, see rgb()
+        """
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + width, self.width), min(y + height, self.height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        row = color * (x1 - x0)
+        stride = self.width * 3
+        pixels = self.pixels
+        for start in range(y0 * stride + x0 * 3, y1 * stride, stride):
+            pixels[start:start + len(row)] = row
+
+    def text(self, cx: int, cy: int, text: str, color: bytes, scale: int = 1,
+             bold: bool = False):
+        """
+        Draw text centered on a point.
+
+        Characters without a glyph are drawn as spaces.
+
+        Args:
+            cx (int): Horizontal center
+            cy (int): Vertical center
+            text (str): Text, drawn upper-case
+            color (bytes): RGB bytes, see rgb()
+            scale (int): Size of one font pixel
+            bold (bool): Draw every glyph twice, one pixel apart
+        """
+        text = text.upper()
+        width, height = text_size(text, scale)
+        left = cx - width // 2
+        top = cy - height // 2
+        runs = _text_runs(text, scale, bold)
+        if left < 0 or top < 0 or left + width + bold > self.width or top + height > self.height:
+            for y, x, length in runs:
+                self.fill_rect(left + x, top + y, length, 1, color)
+            return
+        stride = self.width * 3
+        origin = top * stride + left * 3
+        pixels = self.pixels
+        for y, x, length in runs:
+            start = origin + y * stride + x * 3
+            pixels[start:start + length * 3] = color * length
+
+    def to_png(self, level: int = 6) -> bytes:
+        """
+        Encode the image as PNG.
+
+        Args:
+            level (int): zlib compression level
+
+        Returns:
+            bytes: PNG file contents (8-bit RGB)
+        """
+        stride = self.width * 3
+        pixels = bytes(self.pixels)
+        # Calendar pages are mostly bands of identical rows: such a row is
+        # stored with the "Up" filter as zeros, anything else unfiltered
+        same_as_above = b"\x02" + bytes(stride)
+        parts = []
+        previous = None
+        for start in range(0, len(pixels), stride):
+            row = pixels[start:start + stride]
+            parts.append(same_as_above if row == previous else b"\x00" + row)
+            previous = row
+        raw = b"".join(parts)
+
+        def chunk(kind: bytes, data: bytes) -> bytes:
+            return (struct.pack(">I", len(data)) + kind + data
+                    + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF))
+
+        header = struct.pack(">IIBBBBB", self.width, self.height, 8, 2, 0, 0, 0)
+        return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header)
+                + chunk(b"IDAT", zlib.compress(raw, level)) + chunk(b"IEND", b""))
@@ -0,0 +1,369 @@
+"""
+Holiday sets for many regions loaded into one region x day matrix.
+
+Every day of a year is a single integer whose bit r is set if region r has
+a holiday on that day, so memory depends on the number of days and not on
+the number of (region, holiday) pairs, and union/intersection queries over
+any selection of regions are one bitwise operation.
+"""
+
+import calendar
+import datetime
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .errors import HolidayError
+from .holiday_rules import HolidayRule, RuleSet
+from .holiday_store import HolidayStore
+from .intervals import range_intervals
+from .positions import day_position, month_positions
+
+# Directories with fewer files are loaded in-process, a pool is not worth it
+_MIN_FILES_FOR_POOL = 8
+
+DAYS = 366
+_FEB_29 = day_position(2, 29)
+
+# Years searched past the last one-time holiday for the next holiday of a
+# selection; yearly holidays and rules of one region repeat within a year,
+# only "all" selections of several regions can match less often
+_SEARCH_YEARS = 10
+
+
+def load_region(path: str) -> Tuple[str, int, Dict[int, int], Tuple[HolidayRule, ...],
+                                     List[HolidayError]]:
+    """
+    Load one region file into compact bitmaps.
+
+    Runs in worker processes, so it returns plain picklable values.
+
+    Args:
+        path (str): Holidays file of the region, the file name is the region name
+
+    Returns:
+        tuple: (name, yearly bitmap, {year: bitmap}, rules, errors), bitmaps
+               are 366-bit integers indexed by positions.day_position()
+    """
+    store = HolidayStore(holidays_file=path)
+
+    yearly = 0
+    for month, day in store.yearly_index:
+        yearly |= 1 << day_position(month, day)
+
+    years: Dict[int, int] = {}
+    for year, month, day in store.one_time_index:
+        years[year] = years.get(year, 0) | 1 << day_position(month, day)
+
+    # A range is a contiguous run of positions within each year it touches
+    for holiday_range in store.ranges:
+        if holiday_range.yearly:
+            for start, end in range_intervals(holiday_range):
+                yearly |= _run(start, end)
+            continue
+        for year in range(holiday_range.start_year, holiday_range.end_year + 1):
+            start = (day_position(holiday_range.start_month, holiday_range.start_day)
+                     if year == holiday_range.start_year else 0)
+            end = (day_position(holiday_range.end_month, holiday_range.end_day)
+                   if year == holiday_range.end_year else DAYS - 1)
+            run = _run(start, end)
+            if not calendar.isleap(year):
+                run &= ~(1 << _FEB_29)
+            years[year] = years.get(year, 0) | run
+
+    name = os.path.splitext(os.path.basename(path))[0]
+    return name, yearly, years, tuple(store.rules), list(store.errors)
+
+
+def _run(start: int, end: int) -> int:
+    """Get a bitmap with the positions start..end (inclusive) set."""
+    return ((1 << (end - start + 1)) - 1) << start
+
+
+def _bits(bitmap: int) -> Iterable[int]:
+    """Yield positions of the set bits of an integer."""
+    while bitmap:
+        low = bitmap & -bitmap
+        yield low.bit_length() - 1
+        bitmap ^= low
+
+
+class RegionHolidays:
+    """
+    Holidays of many regions with fast any/all queries.
+
+    Attributes:
+        regions (List[str]): Region names, region i owns bit i of every day
+        errors (Dict[str, List[HolidayError]]): Load problems per region
+        version (int): Version of the data, for caches keyed on HolidayStore.version
+    """
+
+    def __init__(self, loaded: Iterable[Tuple[str, int, Dict[int, int],
+                                             Tuple[HolidayRule, ...], List[HolidayError]]]):
+        """
+        Build the matrix from load_region() results.
+
+        Args:
+            loaded (Iterable): Results of load_region(), one per region
+        """
+        self.regions: List[str] = []
+        self.errors: Dict[str, List[HolidayError]] = {}
+        self.version = 1
+
+        self._yearly = [0] * DAYS
+        self._years: Dict[int, List[int]] = {}
+        self._rules: List[Tuple[int, RuleSet]] = []
+
+        for name, yearly, years, rules, errors in sorted(loaded, key=lambda r: r[0]):
+            bit = 1 << len(self.regions)
+            self.regions.append(name)
+            if errors:
+                self.errors[name] = errors
+            for position in _bits(yearly):
+                self._yearly[position] |= bit
+            for year, bitmap in years.items():
+                table = self._years.setdefault(year, [0] * DAYS)
+                for position in _bits(bitmap):
+                    table[position] |= bit
+            if rules:
+                self._rules.append((bit, RuleSet(rules)))
+
+        self._index = {name: i for i, name in enumerate(self.regions)}
+        self._year_table = lru_cache(maxsize=64)(self._build_year_table)
+
+    @classmethod
+    def from_directory(cls, directory: str, pattern: str = "*.txt",
+                       max_workers: Optional[int] = None) -> "RegionHolidays":
+        """
+        Load every region file in a directory, in parallel.
+
+        Args:
+            directory (str): Directory with one holidays file per region
+            pattern (str): Glob pattern of region files. Defaults to "*.txt"
+            max_workers (Optional[int]): Worker processes, defaults to the CPU count
+
+        Returns:
+            RegionHolidays: All regions of the directory
+        """
+        paths = sorted(glob.glob(os.path.join(directory, pattern)))
+        if len(paths) < _MIN_FILES_FOR_POOL or max_workers == 1:
+            return cls(load_region(path) for path in paths)
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return cls(list(executor.map(load_region, paths, chunksize=4)))
+
+    def summary(self, limit: int = 10) -> str:
+        """
+        Describe the problems of all region files in a single message.
+
+        Args:
+            limit (int): Maximum number of individual errors listed
+
+        Returns:
+            str: Multi-line summary suitable for one dialog, empty if there are no problems
+        """
+        errors = [f"Regija {name}: {error}"
+                  for name, region_errors in self.errors.items() for error in region_errors]
+        if not errors:
+            return ""
+        lines = [f"Pri nalaganju regij je bilo najdenih {len(errors)} napak:"]
+        lines.extend(errors[:limit])
+        if len(errors) > limit:
+            lines.append(f"... in še {len(errors) - limit} drugih.")
+        return "\n".join(lines)
+
+    def _build_year_table(self, year: int) -> List[int]:
+        """Combine yearly, one-time and rule holidays of every region for one year."""
+        explicit = self._years.get(year)
+        if explicit is None and not self._rules:
+            return self._yearly
+        table = list(self._yearly)
+        if explicit is not None:
+            for position, bits in enumerate(explicit):
+                table[position] |= bits
+        for bit, rule_set in self._rules:
+            for month, day in rule_set.dates(year):
+                table[day_position(month, day)] |= bit
+        return table
+
+    def mask(self, regions: Optional[Iterable[str]] = None) -> int:
+        """
+        Get the bit mask of a selection of regions.
+
+        Args:
+            regions (Optional[Iterable[str]]): Region names, None selects all regions
+
+        Returns:
+            int: Bit mask of the selected regions
+
+        Raises:
+            KeyError: If a region name is unknown
+        """
+        if regions is None:
+            return (1 << len(self.regions)) - 1
+        mask = 0
+        for name in regions:
+            mask |= 1 << self._index[name]
+        return mask
+
+    def is_holiday(self, day: int, month: int, year: int,
+                   regions: Optional[Iterable[str]] = None, match: str = "any") -> bool:
+        """
+        Check if the given date is a holiday in the selected regions.
+
+        Args:
+            day (int): Day of the month (1-31)
+            month (int): Month (1-12)
+            year (int): Year (e.g., 2024)
+            regions (Optional[Iterable[str]]): Region names, None selects all regions
+            match (str): "any" if one region is enough, "all" if every region must match
+
+        Returns:
+            bool: True if the date is a holiday in the selection
+        """
+        return self._matches(self._year_table(year)[day_position(month, day)],
+                             self.mask(regions), match)
+
+    def holidays_in_month(self, year: int, month: int,
+                          regions: Optional[Iterable[str]] = None, match: str = "any") -> set:
+        """
+        Get all holiday days of a month in the selected regions.
+
+        Args:
+            year (int): Year (e.g., 2024)
+            month (int): Month (1-12)
+            regions (Optional[Iterable[str]]): Region names, None selects all regions
+            match (str): "any" or "all", see is_holiday()
+
+        Returns:
+            set: Day numbers (1-31)
+        """
+        table = self._year_table(year)
+        mask = self.mask(regions)
+        positions = month_positions(month)
+        if month == 2 and not calendar.isleap(year):
+            positions = positions[:-1]  # a yearly range over 29.02 sets its bit
+        return {position - positions.start + 1 for position in positions
+                if self._matches(table[position], mask, match)}
+
+    def regions_on(self, day: int, month: int, year: int) -> List[str]:
+        """
+        Get the regions that have a holiday on the given date.
+
+        Args:
+            day (int): Day of the month (1-31)
+            month (int): Month (1-12)
+            year (int): Year (e.g., 2024)
+
+        Returns:
+            List[str]: Region names
+        """
+        bits = self._year_table(year)[day_position(month, day)]
+        return [self.regions[i] for i in _bits(bits)]
+
+    def next_holiday(self, date: datetime.date, regions: Optional[Iterable[str]] = None,
+                     match: str = "any",
+                     before: Optional[datetime.date] = None) -> Optional[datetime.date]:
+        """
+        Find the first holiday of the selected regions after a date.
+
+        Args:
+            date (datetime.date): Date to search from (not included)
+            regions (Optional[Iterable[str]]): Region names, None selects all regions
+            match (str): "any" or "all", see is_holiday()
+            before (Optional[datetime.date]): Stop the search at this date (not included)
+
+        Returns:
+            Optional[datetime.date]: The holiday, None if there is none within
+                                     _SEARCH_YEARS years after the last one-time
+                                     holiday (or before the given date)
+        """
+        mask = self.mask(regions)
+        if not mask:
+            return None
+        start = date.toordinal() + 1
+        end = before.toordinal() if before is not None else None
+        last_year = min(datetime.MAXYEAR, max(max(self._years, default=date.year),
+                                              date.year) + _SEARCH_YEARS)
+        for year in range(date.year, last_year + 1):
+            first = datetime.date(year, 1, 1).toordinal()
+            if end is not None and first >= end:
+                return None
+            table = self._year_table(year)
+            leap = calendar.isleap(year)
+            for position in range(DAYS):
+                if not self._matches(table[position], mask, match):
+                    continue
+                if position == _FEB_29 and not leap:
+                    continue
+                # Positions after 29.02 are one day further than in a common year
+                ordinal = first + position - (1 if position > _FEB_29 and not leap else 0)
+                if ordinal < start:
+                    continue
+                if end is not None and ordinal >= end:
+                    return None
+                return datetime.date.fromordinal(ordinal)
+        return None
+
+    @staticmethod
+    def _matches(bits: int, mask: int, match: str) -> bool:
+        if match == "all":
+            return mask != 0 and bits & mask == mask
+        return bits & mask != 0
+
+
+class RegionOverlay:
+    """
+    A HolidayStore combined with a selection of regions.
+
+    Has the lookup interface of HolidayStore (is_holiday, holidays_in_month,
+    next_holiday, version), so it can be used wherever a store is expected, e.g. by
+    MonthViewCache or BusinessCalendar. A date is a holiday if the base store
+    says so or the region selection matches.
+
+    Attributes:
+        base (HolidayStore): The main holiday data
+        region_holidays (RegionHolidays): Loaded regions
+        regions (Tuple[str, ...]): Selected region names
+        match (str): "any" or "all"
+    """
+
+    def __init__(self, base: HolidayStore, region_holidays: RegionHolidays,
+                 regions: Iterable[str], match: str = "any"):
+        self.base = base
+        self.region_holidays = region_holidays
+        self.regions = tuple(regions)
+        self.match = match
+        self._mask = region_holidays.mask(self.regions)
+
+    @property
+    def version(self) -> tuple:
+        """tuple: Changes whenever the base store or the region data changes."""
+        return self.base.version, self.region_holidays.version, self.regions, self.match
+
+    def is_holiday(self, day: int, month: int, year: int) -> bool:
+        """Check if the given date is a holiday in the base store or the selection."""
+        if self.base.is_holiday(day, month, year):
+            return True
+        if not self._mask:
+            return False
+        return self.region_holidays.is_holiday(day, month, year, self.regions, self.match)
+
+    def holidays_in_month(self, year: int, month: int) -> set:
+        """Get holiday days of a month from the base store and the selection."""
+        days = self.base.holidays_in_month(year, month)
+        if self._mask:
+            days |= self.region_holidays.holidays_in_month(year, month,
+                                                           self.regions, self.match)
+        return days
+
+    def next_holiday(self, date: datetime.date) -> Optional[datetime.date]:
+        """Find the first holiday after a date in the base store or the selection."""
+        upcoming = self.base.next_holiday(date)
+        if not self._mask:
+            return upcoming
+        in_regions = self.region_holidays.next_holiday(date, self.regions, self.match,
+                                                       before=upcoming)
+        return in_regions if in_regions is not None else upcoming
@@ -0,0 +1,361 @@
+"""
+Headless rendering of calendar pages to SVG and PNG.
+
+Pages use the cell classification of month_view and the colors and names
+of theme, so they match the application without importing Tk. Every page
+is first laid out as a short list of rectangles and centered texts; the
+SVG and PNG backends only translate that list. PNG output uses the
+built-in bitmap font of core.raster, so its text is upper-case.
+
+Large jobs (many years, many sites) are fanned out to a process pool a
+few pages at a time, and pages are yielded in order as soon as they are
+done, so output is written while the rest is still being drawn.
+"""
+
+import datetime
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from . import theme
+from .holiday_store import HolidayStore
+from .month_view import WEEKS, build_month_view
+from .raster import Raster, rgb
+from .service import parse_years
+
+FORMATS = ("svg", "png")
+PAGE_KINDS = ("month", "year")
+
+FONT_FAMILY = "Segoe UI, sans-serif"
+
+# Month page layout, in pixels
+MONTH_PAGE_WIDTH = 840
+MONTH_PAGE_HEIGHT = 632
+# Year page layout: 4 x 3 months under the title
+YEAR_PAGE_WIDTH = 1120
+YEAR_PAGE_HEIGHT = 880
+MARGIN = 24
+# zlib level of PNG pages: level 6 would take twice as long for about half the size
+PNG_COMPRESSION = 3
+
+
+class Page(NamedTuple):
+    """
+    One page to render.
+
+    Attributes:
+        holidays_file (str): Holidays file the page is classified with
+        year (int): Year of the page
+        month (int): Month (1-12), 0 for a page with the whole year
+        site (str): Subdirectory of the output, "" for none
+    """
+    holidays_file: str
+    year: int
+    month: int = 0
+    site: str = ""
+
+    def filename(self, fmt: str) -> str:
+        """
+        Get the path of the page relative to the output directory.
+
+        Args:
+            fmt (str): "svg" or "png"
+
+        Returns:
+            str: e.g. "2025-03.svg", "2025.png" or "maribor/2025-03.svg"
+        """
+        name = f"{self.year}-{self.month:02d}" if self.month else str(self.year)
+        return os.path.join(self.site, f"{name}.{fmt}")
+
+
+# Display list items: ("rect", x, y, width, height, color) and
+# ("text", center x, center y, text, color, font size, bold)
+Item = tuple
+
+
+def _month_block(items: List[Item], view, x: int, y: int, width: int, height: int,
+                 title: str, title_size: int, header_size: int, cell_size: int,
+                 day_names: Iterable[str]):
+    """Lay out one month: a title band, the day name header and 6 rows of cells."""
+    title_height = height * 2 // 13
+    header_height = height // 13
+    cell_height = (height - title_height - header_height) // WEEKS
+    cell_width = width / 7
+
+    items.append(("text", x + width // 2, y + title_height // 2, title,
+                  theme.COLOR_ON_SURFACE, title_size, True))
+    top = y + title_height
+    items.append(("rect", x, top, width, header_height, theme.COLOR_PRIMARY))
+    for col, name in enumerate(day_names):
+        items.append(("text", round(x + (col + 0.5) * cell_width), top + header_height // 2,
+                      name, "#FFFFFF", header_size, True))
+
+    # Grid lines are the shadow color showing between the cells
+    top += header_height
+    items.append(("rect", x, top, width, cell_height * WEEKS, theme.COLOR_SHADOW))
+    for row, cells in enumerate(view.cells):
+        cell_top = top + row * cell_height
+        for col, (day, kind) in enumerate(cells):
+            bg, fg, bold = theme.CELL_COLORS[kind]
+            left = round(x + col * cell_width)
+            right = round(x + (col + 1) * cell_width)
+            items.append(("rect", left + 1, cell_top + 1, right - left - 1, cell_height - 1, bg))
+            if day:
+                items.append(("text", (left + right) // 2, cell_top + cell_height // 2,
+                              str(day), fg, cell_size, bold))
+
+
+def layout_page(page: Page, holiday_store: HolidayStore,
+                today: Optional[datetime.date] = None) -> Tuple[int, int, List[Item]]:
+    """
+    Lay out a page as a list of rectangles and texts.
+
+    Args:
+        page (Page): Page to lay out
+        holiday_store (HolidayStore): Holiday data
+        today (Optional[datetime.date]): Date highlighted as today, None for none
+
+    Returns:
+        Tuple[int, int, List[Item]]: Page width, page height and the display list
+    """
+    if page.month:
+        width, height = MONTH_PAGE_WIDTH, MONTH_PAGE_HEIGHT
+        items: List[Item] = [("rect", 0, 0, width, height, theme.COLOR_SURFACE)]
+        view = build_month_view(page.year, page.month, holiday_store, today)
+        _month_block(items, view, MARGIN, MARGIN, width - 2 * MARGIN, height - 2 * MARGIN,
+                     f"{theme.MONTH_NAMES[page.month - 1]} {page.year}", 28, 15, 20,
+                     theme.DAY_NAMES)
+        return width, height, items
+
+    width, height = YEAR_PAGE_WIDTH, YEAR_PAGE_HEIGHT
+    items = [("rect", 0, 0, width, height, theme.COLOR_SURFACE),
+             ("text", width // 2, MARGIN + 24, str(page.year), theme.COLOR_ON_SURFACE, 36, True)]
+    top = MARGIN + 64
+    block_width = (width - 2 * MARGIN) // 4
+    block_height = (height - top - MARGIN) // 3
+    short_names = [name[:2] for name in theme.DAY_NAMES]
+    for month in range(1, 13):
+        row, col = divmod(month - 1, 4)
+        view = build_month_view(page.year, month, holiday_store, today)
+        _month_block(items, view, MARGIN + col * block_width + 8, top + row * block_height,
+                     block_width - 16, block_height - 16, theme.MONTH_NAMES[month - 1],
+                     16, 10, 12, short_names)
+    return width, height, items
+
+
+def to_svg(width: int, height: int, items: List[Item]) -> bytes:
+    """
+    Convert a display list to an SVG document.
+
+    Args:
+        width (int): Page width
+        height (int): Page height
+        items (List[Item]): Display list from layout_page()
+
+    Returns:
+        bytes: UTF-8 encoded SVG
+    """
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+             f'viewBox="0 0 {width} {height}" font-family="{FONT_FAMILY}" '
+             f'text-anchor="middle" dominant-baseline="central">\n']
+    for item in items:
+        if item[0] == "rect":
+            _, x, y, w, h, color = item
+            parts.append(f'<rect x="{x}" y="{y}" width="{w}" height="{h}" fill="{color}"/>\n')
+        else:
+            _, x, y, text, color, size, bold = item
+            weight = ' font-weight="bold"' if bold else ""
+            parts.append(f'<text x="{x}" y="{y}" font-size="{size}" fill="{color}"{weight}>'
+                         f'{escape(text)}</text>\n')
+    parts.append("</svg>\n")
+    return "".join(parts).encode("utf-8")
+
+
+def to_png(width: int, height: int, items: List[Item]) -> bytes:
+    """
+    Convert a display list to a PNG image.
+
+    Args:
+        width (int): Page width
+        height (int): Page height
+        items (List[Item]): Display list from layout_page()
+
+    Returns:
+        bytes: PNG file contents
+    """
+    raster = Raster(width, height, theme.COLOR_SURFACE)
+    colors: Dict[str, bytes] = {}
+    for item in items:
+        color = item[4] if item[0] == "text" else item[5]
+        color_bytes = colors.get(color)
+        if color_bytes is None:
+            color_bytes = colors[color] = rgb(color)
+        if item[0] == "rect":
+            _, x, y, w, h, _ = item
+            raster.fill_rect(x, y, w, h, color_bytes)
+        else:
+            _, x, y, text, _, size, bold = item
+            # A font pixel of about a ninth of the font size gives a similar cap height
+            raster.text(x, y, text, color_bytes, max(1, round(size / 9)), bold)
+    return raster.to_png(PNG_COMPRESSION)
+
+
+_ENCODERS = {"svg": to_svg, "png": to_png}
+
+
+def render_page(page: Page, holiday_store: HolidayStore, fmt: str = "svg",
+                today: Optional[datetime.date] = None) -> bytes:
+    """
+    Render one page.
+
+    Args:
+        page (Page): Page to render
+        holiday_store (HolidayStore): Holiday data of the page
+        fmt (str): "svg" or "png"
+        today (Optional[datetime.date]): Date highlighted as today, None for none
+
+    Returns:
+        bytes: File contents
+    """
+    return _ENCODERS[fmt](*layout_page(page, holiday_store, today))
+
+
+# Per-process holiday stores, one per holidays file
+_stores: Dict[str, HolidayStore] = {}
+
+
+def _store(holidays_file: str) -> HolidayStore:
+    store = _stores.get(holidays_file)
+    if store is None:
+        store = _stores[holidays_file] = HolidayStore(holidays_file, use_snapshot=True)
+    return store
+
+
+def _render_chunk(pages: List[Page], fmt: str, today: Optional[datetime.date]) -> List[bytes]:
+    return [render_page(page, _store(page.holidays_file), fmt, today) for page in pages]
+
+
+def _chunks(pages: Iterator[Page], size: int) -> Iterator[List[Page]]:
+    while True:
+        chunk = list(islice(pages, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def render_pages(pages: Iterable[Page], fmt: str = "svg", workers: int = 1,
+                 today: Optional[datetime.date] = None,
+                 chunk_size: int = 8) -> Iterator[Tuple[Page, bytes]]:
+    """
+    Render pages, yielding each one as soon as it and all earlier pages are done.
+
+    Args:
+        pages (Iterable[Page]): Pages to render, consumed lazily
+        fmt (str): "svg" or "png"
+        workers (int): Worker processes, 1 renders in this process
+        today (Optional[datetime.date]): Date highlighted as today, None for none
+        chunk_size (int): Pages per task sent to a worker
+
+    Yields:
+        Tuple[Page, bytes]: Page and its file contents, in input order
+    """
+    chunks = _chunks(iter(pages), chunk_size)
+
+    if workers <= 1:
+        for chunk in chunks:
+            yield from zip(chunk, _render_chunk(chunk, fmt, today))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Keep a bounded number of chunks in flight, yielded in input order
+        pending = deque()
+        for chunk in chunks:
+            pending.append((chunk, executor.submit(_render_chunk, chunk, fmt, today)))
+            if len(pending) >= workers * 2:
+                done, future = pending.popleft()
+                yield from zip(done, future.result())
+        while pending:
+            done, future = pending.popleft()
+            yield from zip(done, future.result())
+
+
+def iter_pages(holidays_files: Dict[str, str], years: Iterable[int],
+               kinds: Iterable[str] = ("month",)) -> Iterator[Page]:
+    """
+    List the pages of every site and year.
+
+    Args:
+        holidays_files (Dict[str, str]): Holidays file of every site ("" for no subdirectory)
+        years (Iterable[int]): Years to render
+        kinds (Iterable[str]): "month" for a page per month, "year" for a page per year
+
+    Yields:
+        Page: Pages ordered by site, year and month, the year page first
+    """
+    years = list(years)
+    for site, holidays_file in holidays_files.items():
+        for year in years:
+            if "year" in kinds:
+                yield Page(holidays_file, year, 0, site)
+            if "month" in kinds:
+                for month in range(1, 13):
+                    yield Page(holidays_file, year, month, site)
+
+
+def main_render(outdir: str, holidays_file: str, years: str, fmt: str, kinds: List[str],
+                sites_dir: Optional[str], workers: int) -> int:
+    """
+    Command line entry point used by main.py --render.
+
+    Args:
+        outdir (str): Output directory
+        holidays_file (str): Holidays file, used when sites_dir is None
+        years (str): "2025" or "2025-2030"
+        fmt (str): "svg" or "png"
+        kinds (List[str]): Page kinds, see iter_pages()
+        sites_dir (Optional[str]): Directory with one holidays file (*.txt) per site;
+                                   every site gets its own subdirectory
+        workers (int): Worker processes
+
+    Returns:
+        int: Process exit code
+    """
+    try:
+        year_range = parse_years(years)
+    except ValueError:
+        print(f"Napaka: neveljavno obdobje let: {years}", file=sys.stderr)
+        return 2
+
+    if sites_dir is not None:
+        try:
+            names = sorted(name for name in os.listdir(sites_dir) if name.endswith(".txt"))
+        except OSError as e:
+            print(f"Napaka: {e}", file=sys.stderr)
+            return 1
+        holidays_files = {name[:-4]: os.path.join(sites_dir, name) for name in names}
+    else:
+        holidays_files = {"": holidays_file}
+
+    start = time.perf_counter()
+    count = 0
+    for site in holidays_files:
+        os.makedirs(os.path.join(outdir, site), exist_ok=True)
+    try:
+        for page, data in render_pages(iter_pages(holidays_files, year_range, kinds),
+                                       fmt, workers):
+            with open(os.path.join(outdir, page.filename(fmt)), 'wb') as f:
+                f.write(data)
+            count += 1
+    except OSError as e:
+        print(f"Napaka: {e}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed * 60 if elapsed else 0.0
+    print(f"Izrisanih strani: {count} v {elapsed:.2f} s ({rate:.0f} strani/min)",
+          file=sys.stderr)
+    return 0
@@ -0,0 +1,193 @@
+"""
+Query logic shared by the HTTP service and the command line tools.
+
+Requests and responses are plain JSON-compatible dicts and lists, so the
+transport (asyncio HTTP server, CLI, tests) stays a thin layer on top.
+"""
+
+import datetime
+from typing import Any, Dict, Iterable, List
+
+from .business_days import BusinessCalendar
+from .holiday_store import HolidayStore
+from .month_view import MonthViewCache
+
+
+class QueryError(ValueError):
+    """A request could not be answered because it is malformed."""
+
+
+def parse_date(value: Any) -> datetime.date:
+    """
+    Parse a date given as "YYYY-MM-DD" or "DD.MM.YYYY".
+
+    Args:
+        value: Date string from a request
+
+    Returns:
+        datetime.date: The parsed date
+
+    Raises:
+        QueryError: If the value is not a valid date
+    """
+    if not isinstance(value, str):
+        raise QueryError(f"datum mora biti niz, ne {type(value).__name__}")
+    try:
+        if '.' in value:
+            day, month, year = map(int, value.split('.'))
+        else:
+            year, month, day = map(int, value.split('-'))
+        return datetime.date(year, month, day)
+    except ValueError as e:
+        raise QueryError(f"neveljaven datum '{value}': {e}") from None
+
+
+def parse_years(value: str) -> range:
+    """
+    Parse a year or a range of years.
+
+    Args:
+        value (str): "2025" or "2025-2030"
+
+    Returns:
+        range: The years, inclusive
+
+    Raises:
+        QueryError: If the value is not a valid year or range
+    """
+    first, _, last = value.partition("-")
+    try:
+        first_year = int(first)
+        last_year = int(last) if last else first_year
+    except ValueError:
+        raise QueryError(f"neveljavno obdobje let '{value}'") from None
+    if not (datetime.MINYEAR <= first_year <= last_year <= datetime.MAXYEAR):
+        raise QueryError(f"neveljavno obdobje let '{value}'")
+    return range(first_year, last_year + 1)
+
+
+def _int(request: Dict[str, Any], key: str) -> int:
+    """Read a required integer field of a request."""
+    try:
+        return int(request[key])
+    except KeyError:
+        raise QueryError(f"manjka polje '{key}'") from None
+    except (TypeError, ValueError):
+        raise QueryError(f"polje '{key}' mora biti celo število") from None
+
+
+class HolidayService:
+    """
+    Answers holiday, month-view and business-day queries from shared indexes.
+
+    One instance is meant to be shared by all requests of a process, so the
+    holiday index, the month cache and the business-day tables are built once.
+
+    Attributes:
+        holiday_store (HolidayStore): Holiday data
+        month_cache (MonthViewCache): Cache of classified months
+        business (BusinessCalendar): Business-day arithmetic
+    """
+
+    def __init__(self, holiday_store: HolidayStore):
+        """
+        Initialize the HolidayService.
+
+        Args:
+            holiday_store (HolidayStore): Holiday data to serve
+        """
+        self.holiday_store = holiday_store
+        self.month_cache = MonthViewCache(holiday_store, maxsize=256)
+        self.business = BusinessCalendar(holiday_store)
+
+    def classify_dates(self, dates: Iterable[Any]) -> List[Dict[str, Any]]:
+        """
+        Classify a batch of dates.
+
+        Args:
+            dates (Iterable): Date strings
+
+        Returns:
+            List[Dict[str, Any]]: One result per date with holiday, sunday,
+                                  business_day and today flags
+        """
+        today = datetime.date.today()
+        results = []
+        for value in dates:
+            date = parse_date(value)
+            holiday = self.holiday_store.is_holiday(date.day, date.month, date.year)
+            sunday = date.weekday() == 6
+            results.append({
+                "date": date.isoformat(),
+                "holiday": holiday,
+                "sunday": sunday,
+                "business_day": not holiday and self.business.is_business_day(date),
+                "today": date == today,
+            })
+        return results
+
+    def month_view(self, year: int, month: int) -> Dict[str, Any]:
+        """
+        Get the classified calendar grid of a month.
+
+        Args:
+            year (int): Year (e.g., 2024)
+            month (int): Month (1-12)
+
+        Returns:
+            Dict[str, Any]: Year, month, today and 6 rows of {day, kind} cells
+
+        Raises:
+            QueryError: If the month does not exist
+        """
+        if not 1 <= month <= 12 or not datetime.MINYEAR <= year <= datetime.MAXYEAR:
+            raise QueryError(f"neveljaven mesec {month}.{year}")
+        view = self.month_cache.get(year, month)
+        return {
+            "year": view.year,
+            "month": view.month,
+            "today": view.today.isoformat(),
+            "cells": [[{"day": day, "kind": kind} for day, kind in week]
+                      for week in view.cells],
+        }
+
+    def business_days(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Answer one business-day request.
+
+        Supported operations:
+            - {"op": "is", "date": ...}
+            - {"op": "next", "date": ...}
+            - {"op": "add", "date": ..., "n": 5}
+            - {"op": "count", "start": ..., "end": ...} (end exclusive)
+
+        Args:
+            request (Dict[str, Any]): The request
+
+        Returns:
+            Dict[str, Any]: The request's operation and its "result"
+
+        Raises:
+            QueryError: If the request is malformed
+        """
+        if not isinstance(request, dict):
+            raise QueryError("zahteva mora biti objekt")
+        op = request.get("op")
+        try:
+            if op == "is":
+                result = self.business.is_business_day(parse_date(request.get("date")))
+            elif op == "next":
+                result = self.business.next_business_day(parse_date(request.get("date"))).isoformat()
+            elif op == "add":
+                result = self.business.add_business_days(parse_date(request.get("date")),
+                                                         _int(request, "n")).isoformat()
+            elif op == "count":
+                result = self.business.count_business_days(parse_date(request.get("start")),
+                                                           parse_date(request.get("end")))
+            else:
+                raise QueryError(f"neznana operacija '{op}'")
+        except QueryError:
+            raise
+        except (OverflowError, ValueError) as e:
+            raise QueryError(f"datum izven obsega: {e}") from None
+        return {"op": op, "result": result}
@@ -0,0 +1,255 @@
+"""
+Compiled binary snapshots of a holidays file.
+
+A snapshot stores one 366-bit bitmap per year plus a bitmap of yearly
+holidays, so a launch can map it with mmap and answer lookups straight
+from the mapped buffer instead of parsing the text file.
+
+Layout (little endian):
+    header       magic, source size, source mtime_ns, source sha256,
+                 first year, year count, length of the text section
+    yearly mask  BITMAP_BYTES
+    year masks   year count * BITMAP_BYTES
+    text         UTF-8, one rule (HolidayRule syntax) or date range
+                 ("24.12-31.12|Y") per line; ranges stay intervals
+
+Bit positions use the day of year of a leap year, so 29.02 always has its
+own bit and every (month, day) maps to the same position in every year.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+from typing import Iterable, Optional, Tuple
+
+from .holiday_rules import HolidayRule, RuleSet, format_rule, parse_rule
+from .intervals import HolidayRange, IntervalIndex, format_range, parse_range
+from .positions import MONTH_STARTS as _MONTH_STARTS, day_position, month_positions
+
+
+MAGIC = b"HOLSNAP2"
+HEADER = struct.Struct("<8sQq32siII")
+BITMAP_BYTES = 48  # 366 bits, padded to whole words
+
+
+def snapshot_path(holidays_file: str) -> str:
+    """
+    Get the snapshot path that belongs to a holidays file.
+
+    The whole file name is kept, so "holidays.txt" and "holidays.ics" in
+    one directory get separate snapshots.
+
+    Args:
+        holidays_file (str): Path of the holidays file
+
+    Returns:
+        str: Path of the snapshot next to it, e.g. "holidays.txt.snap"
+    """
+    return holidays_file + ".snap"
+
+
+def file_digest(path: str) -> bytes:
+    """
+    Compute the SHA-256 digest of a file.
+
+    Args:
+        path (str): File to hash
+
+    Returns:
+        bytes: 32-byte digest
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def write_snapshot(path: str, source_size: int, source_mtime_ns: int, source_digest: bytes,
+                   holidays: Iterable[Tuple[int, int, int, bool]],
+                   rules: Iterable[HolidayRule], ranges: Iterable[HolidayRange] = ()):
+    """
+    Write a snapshot of parsed holidays.
+
+    The file is written to a temporary name and renamed, so a reader never
+    maps a partially written snapshot.
+
+    Args:
+        path (str): Snapshot path
+        source_size (int): Size of the holidays file the data was parsed from
+        source_mtime_ns (int): Modification time of that file
+        source_digest (bytes): SHA-256 digest of that file
+        holidays (Iterable): (day, month, year, is_yearly) tuples
+        rules (Iterable[HolidayRule]): Computed holidays
+        ranges (Iterable[HolidayRange]): Date ranges
+    """
+    yearly = 0
+    years = {}
+    for day, month, year, is_yearly in holidays:
+        if is_yearly:
+            yearly |= 1 << day_position(month, day)
+        elif year:
+            years[year] = years.get(year, 0) | 1 << day_position(month, day)
+
+    first_year = min(years) if years else 0
+    year_count = max(years) - first_year + 1 if years else 0
+    lines = [format_rule(rule) for rule in rules]
+    lines.extend(format_range(holiday_range) for holiday_range in ranges)
+    rules_text = "".join(line + "\n" for line in lines).encode('utf-8')
+
+    parts = [
+        HEADER.pack(MAGIC, source_size, source_mtime_ns, source_digest,
+                    first_year, year_count, len(rules_text)),
+        yearly.to_bytes(BITMAP_BYTES, 'little'),
+    ]
+    for year in range(first_year, first_year + year_count):
+        parts.append(years.get(year, 0).to_bytes(BITMAP_BYTES, 'little'))
+    parts.append(rules_text)
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(b"".join(parts))
+    os.replace(tmp_path, path)
+
+
+class BitmapIndex:
+    """
+    Holiday lookups served directly from a memory-mapped snapshot.
+
+    Provides the same lookup interface as HolidayIndex without creating a
+    Python object per holiday: every query reads bits from the mapping.
+
+    Attributes:
+        first_year (int): First year with a one-time bitmap
+        year_count (int): Number of consecutive years with bitmaps
+        rules (Tuple[HolidayRule, ...]): Computed holidays stored in the snapshot
+        intervals (IntervalIndex): Date ranges stored in the snapshot
+    """
+
+    def __init__(self, f, buffer: mmap.mmap, first_year: int, year_count: int,
+                 rules: Tuple[HolidayRule, ...], ranges: Iterable[HolidayRange] = ()):
+        """
+        Initialize the index, use open_snapshot() instead of calling this directly.
+        """
+        self._file = f
+        self._buffer = buffer
+        self.first_year = first_year
+        self.year_count = year_count
+        self.rules = rules
+        self._rule_set = RuleSet(rules)
+        self.intervals = IntervalIndex(ranges)
+
+    def close(self):
+        """Unmap the snapshot."""
+        self._buffer.close()
+        self._file.close()
+
+    def _bit(self, offset: int, position: int) -> bool:
+        """Read one bit of the bitmap starting at offset."""
+        return bool(self._buffer[offset + (position >> 3)] >> (position & 7) & 1)
+
+    def _year_offset(self, year: int) -> Optional[int]:
+        """Get the offset of a year's bitmap, or None if the year has none."""
+        index = year - self.first_year
+        if 0 <= index < self.year_count:
+            return HEADER.size + BITMAP_BYTES * (index + 1)
+        return None
+
+    def is_holiday(self, day: int, month: int, year: int) -> bool:
+        """Check if the given date is a holiday, see HolidayStore.is_holiday()."""
+        position = day_position(month, day)
+        if self._bit(HEADER.size, position):
+            return True
+        offset = self._year_offset(year)
+        if offset is not None and self._bit(offset, position):
+            return True
+        if self.intervals and self.intervals.is_holiday(day, month, year):
+            return True
+        return bool(self._rule_set) and (month, day) in self._rule_set.dates(year)
+
+    def holidays_in_month(self, year: int, month: int) -> set:
+        """Get all holiday days in the given month, see HolidayStore.holidays_in_month()."""
+        offset = self._year_offset(year)
+        start = _MONTH_STARTS[month - 1]
+        days = set()
+        for position in month_positions(month):
+            if self._bit(HEADER.size, position) or (offset is not None
+                                                    and self._bit(offset, position)):
+                days.add(position - start + 1)
+        if self._rule_set:
+            days |= {r_day for r_month, r_day in self._rule_set.dates(year) if r_month == month}
+        if self.intervals:
+            days |= self.intervals.holidays_in_month(year, month)
+        return days
+
+    @property
+    def yearly(self) -> set:
+        """set: (month, day) keys of yearly holidays, built on access."""
+        return {(month, position - _MONTH_STARTS[month - 1] + 1)
+                for month in range(1, 13) for position in month_positions(month)
+                if self._bit(HEADER.size, position)}
+
+    @property
+    def one_time(self) -> set:
+        """set: (year, month, day) keys of one-time holidays, built on access."""
+        keys = set()
+        for year in range(self.first_year, self.first_year + self.year_count):
+            offset = self._year_offset(year)
+            for month in range(1, 13):
+                for position in month_positions(month):
+                    if self._bit(offset, position):
+                        keys.add((year, month, position - _MONTH_STARTS[month - 1] + 1))
+        return keys
+
+
+def open_snapshot(path: str, source_path: str) -> Optional[BitmapIndex]:
+    """
+    Map a snapshot if it is still valid for its holidays file.
+
+    The snapshot is valid if the holidays file has the recorded size and
+    modification time and its SHA-256 digest matches.
+
+    Args:
+        path (str): Snapshot path
+        source_path (str): Path of the holidays text file
+
+    Returns:
+        Optional[BitmapIndex]: The mapped index, or None if the snapshot is
+                               missing, corrupt or stale
+    """
+    try:
+        source = os.stat(source_path)
+        f = open(path, 'rb')
+    except OSError:
+        return None
+
+    try:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):  # ValueError: empty file
+        f.close()
+        return None
+
+    try:
+        if len(buffer) < HEADER.size:
+            raise ValueError("snapshot too short")
+        (magic, size, mtime_ns, digest,
+         first_year, year_count, rules_len) = HEADER.unpack_from(buffer, 0)
+        rules_offset = HEADER.size + BITMAP_BYTES * (year_count + 1)
+        if (magic != MAGIC or len(buffer) != rules_offset + rules_len
+                or size != source.st_size or mtime_ns != source.st_mtime_ns
+                or digest != file_digest(source_path)):
+            raise ValueError("stale snapshot")
+        rules_text = buffer[rules_offset:].decode('utf-8')
+        rules, ranges = [], []
+        for line in rules_text.splitlines():
+            if '|' in line:
+                ranges.append(parse_range(*line.split('|')))
+            else:
+                rules.append(parse_rule(line))
+    except (OSError, ValueError):
+        buffer.close()
+        f.close()
+        return None
+
+    return BitmapIndex(f, buffer, first_year, year_count, tuple(rules), ranges)
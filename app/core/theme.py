@@ -0,0 +1,41 @@
+"""
+Colors and names shared by the window and the offscreen renderer.
+
+Kept free of Tk, so headless code (core.render) can draw calendars that
+look exactly like the application.
+"""
+
+from typing import Dict, Tuple
+
+from .month_view import CELL_EMPTY, CELL_HOLIDAY, CELL_NORMAL, CELL_SUNDAY, CELL_TODAY
+
+# Color palette
+COLOR_PRIMARY = "#6366F1"        # Modern indigo
+COLOR_PRIMARY_LIGHT = "#8B5CF6"  # Light purple
+COLOR_SECONDARY = "#06B6D4"      # Cyan
+COLOR_BACKGROUND = "#F8FAFC"     # Light gray background
+COLOR_SURFACE = "#FFFFFF"        # White surface
+COLOR_SURFACE_VARIANT = "#F1F5F9" # Light gray variant
+COLOR_ON_SURFACE = "#1E293B"     # Dark text
+COLOR_ON_SURFACE_VARIANT = "#64748B" # Gray text
+COLOR_SUNDAY_BG = "#FEF3C7"      # Soft yellow
+COLOR_HOLIDAY_BG = "#FEE2E2"     # Soft red
+COLOR_TODAY_BG = "#DBEAFE"       # Soft blue
+COLOR_HOVER = "#E2E8F0"          # Light hover
+COLOR_SHADOW = "#E2E8F0"         # Shadow color
+
+DAY_NAMES = ("Pon", "Tor", "Sre", "Čet", "Pet", "Sob", "Ned")
+
+MONTH_NAMES = (
+    "Januar", "Februar", "Marec", "April", "Maj", "Junij",
+    "Julij", "Avgust", "September", "Oktober", "November", "December"
+)
+
+# (background, text color, bold) for each cell classification
+CELL_COLORS: Dict[str, Tuple[str, str, bool]] = {
+    CELL_EMPTY: (COLOR_SURFACE, COLOR_ON_SURFACE, False),
+    CELL_TODAY: (COLOR_TODAY_BG, COLOR_ON_SURFACE, True),
+    CELL_HOLIDAY: (COLOR_HOLIDAY_BG, COLOR_ON_SURFACE, True),
+    CELL_SUNDAY: (COLOR_SUNDAY_BG, COLOR_ON_SURFACE_VARIANT, False),
+    CELL_NORMAL: (COLOR_SURFACE, COLOR_ON_SURFACE, False),
+}
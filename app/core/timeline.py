@@ -0,0 +1,192 @@
+"""
+Holidays in date order, for nearest-holiday and range queries.
+
+One-time holidays are kept as a sorted list of date ordinals, so finding
+the next or previous one is a bisection. Yearly holidays and rules are not
+materialized over the whole calendar: they are expanded per year on demand
+(and a few recent years are cached), so a query over a 100-year window
+touches 100 small sorted lists and nothing else. Date ranges come from
+an IntervalIndex: yearly ranges are expanded with the other recurring
+holidays, one-time ranges are read from their merged intervals.
+"""
+
+import datetime
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .holiday_rules import HolidayRule, RuleSet
+from .intervals import IntervalIndex
+
+
+def _year_bounds(year: int) -> Tuple[int, int]:
+    """Get the ordinals of the first day of a year and of the day after its last day."""
+    return (datetime.date(year, 1, 1).toordinal(),
+            datetime.date(year, 12, 31).toordinal() + 1)
+
+
+class HolidayTimeline:
+    """
+    Sorted view of a holiday index.
+
+    Built from the same data as a HolidayIndex and, like it, never modified
+    afterwards.
+    """
+
+    def __init__(self, yearly: Iterable[Tuple[int, int]],
+                 one_time: Iterable[Tuple[int, int, int]],
+                 rules: Iterable[HolidayRule] = (),
+                 intervals: Optional[IntervalIndex] = None):
+        """
+        Build the timeline.
+
+        Args:
+            yearly (Iterable): (month, day) keys of yearly holidays
+            one_time (Iterable): (year, month, day) keys of one-time holidays
+            rules (Iterable[HolidayRule]): Computed holidays
+            intervals (Optional[IntervalIndex]): Date ranges
+        """
+        self._yearly = sorted(yearly)
+        ordinals = []
+        for year, month, day in one_time:
+            try:
+                ordinals.append(datetime.date(year, month, day).toordinal())
+            except ValueError:
+                continue  # e.g. 31.04, the index can hold it but no date has it
+        self._one_time: List[int] = sorted(ordinals)
+        self._rule_set = RuleSet(rules)
+        self._intervals = intervals if intervals is not None else IntervalIndex()
+        self._recurring_cache = lru_cache(maxsize=256)(self._expand_recurring)
+
+    @property
+    def recurring(self) -> bool:
+        """bool: True if some holidays repeat every year."""
+        return bool(self._yearly) or bool(self._rule_set) or self._intervals.has_yearly
+
+    def _expand_recurring(self, year: int) -> Tuple[int, ...]:
+        """Get sorted ordinals of the yearly and rule holidays of one year."""
+        ordinals = set()
+        for month, day in self._yearly:
+            try:
+                ordinals.add(datetime.date(year, month, day).toordinal())
+            except ValueError:
+                continue  # 29.02 in a non-leap year
+        for month, day in self._rule_set.dates(year) if self._rule_set else ():
+            ordinals.add(datetime.date(year, month, day).toordinal())
+        if self._intervals.has_yearly:
+            ordinals.update(self._intervals.yearly_ordinals(year))
+        return tuple(sorted(ordinals))
+
+    def year_ordinals(self, year: int) -> List[int]:
+        """
+        Get all holidays of a year.
+
+        Args:
+            year (int): Year (e.g., 2024)
+
+        Returns:
+            List[int]: Sorted date ordinals
+        """
+        first, end = _year_bounds(year)
+        one_time = self._one_time[bisect_left(self._one_time, first):
+                                  bisect_left(self._one_time, end)]
+        if self._intervals:
+            in_ranges = list(self._intervals.one_time_ordinals(first, end))
+            if in_ranges:
+                one_time = sorted(set(one_time).union(in_ranges))
+        if not self.recurring:
+            return one_time
+        recurring = self._recurring_cache(year)
+        if not one_time:
+            return list(recurring)
+        return sorted(set(one_time).union(recurring))
+
+    def holidays_between(self, start: datetime.date,
+                         end: datetime.date) -> Iterator[datetime.date]:
+        """
+        Iterate over holidays in [start, end), in date order.
+
+        Years are expanded one at a time as the iteration reaches them.
+
+        Args:
+            start (datetime.date): First day of the range
+            end (datetime.date): Day after the range
+
+        Yields:
+            datetime.date: Every holiday of the range
+        """
+        low, high = start.toordinal(), end.toordinal()
+        if low >= high:
+            return
+        last_year = datetime.date.fromordinal(high - 1).year
+        for year in range(start.year, last_year + 1):
+            for ordinal in self.year_ordinals(year):
+                if ordinal >= high:
+                    return
+                if ordinal >= low:
+                    yield datetime.date.fromordinal(ordinal)
+
+    def next_holiday(self, date: datetime.date) -> Optional[datetime.date]:
+        """
+        Find the first holiday after a date.
+
+        Args:
+            date (datetime.date): Date to search from (not included)
+
+        Returns:
+            Optional[datetime.date]: The holiday, None if there is none
+        """
+        target = date.toordinal()
+        best = None
+        index = bisect_right(self._one_time, target)
+        if index < len(self._one_time):
+            best = self._one_time[index]
+        in_range = self._intervals.next_one_time(target)
+        if in_range is not None and (best is None or in_range < best):
+            best = in_range
+
+        if self.recurring:
+            for year in range(date.year, datetime.MAXYEAR + 1):
+                first, _ = _year_bounds(year)
+                if best is not None and first > best:
+                    break
+                recurring = self._recurring_cache(year)
+                index = bisect_right(recurring, target)
+                if index < len(recurring):
+                    best = recurring[index] if best is None else min(best, recurring[index])
+                    break
+
+        return datetime.date.fromordinal(best) if best is not None else None
+
+    def previous_holiday(self, date: datetime.date) -> Optional[datetime.date]:
+        """
+        Find the last holiday before a date.
+
+        Args:
+            date (datetime.date): Date to search from (not included)
+
+        Returns:
+            Optional[datetime.date]: The holiday, None if there is none
+        """
+        target = date.toordinal()
+        best = None
+        index = bisect_left(self._one_time, target)
+        if index > 0:
+            best = self._one_time[index - 1]
+        in_range = self._intervals.previous_one_time(target)
+        if in_range is not None and (best is None or in_range > best):
+            best = in_range
+
+        if self.recurring:
+            for year in range(date.year, datetime.MINYEAR - 1, -1):
+                _, end = _year_bounds(year)
+                if best is not None and end <= best:
+                    break
+                recurring = self._recurring_cache(year)
+                index = bisect_left(recurring, target)
+                if index > 0:
+                    best = recurring[index - 1] if best is None else max(best,
+                                                                         recurring[index - 1])
+                    break
+
+        return datetime.date.fromordinal(best) if best is not None else None
@@ -0,0 +1,94 @@
+"""
+Wall-clock timing of named phases, used for the startup report.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Tuple
+
+
+class PhaseTimer:
+    """
+    Records how long named phases take, relative to a common start.
+
+    Phases may be recorded from several threads (e.g. holidays loaded in
+    the background while the window is built).
+
+    Attributes:
+        start (float): time.perf_counter() value all offsets are relative to
+        phases (List[Tuple[str, float, float]]): (name, start offset, duration)
+                                                 in seconds, in completion order
+        marks (List[Tuple[str, float]]): (name, offset) of single moments
+    """
+
+    def __init__(self, start: float = None):
+        """
+        Initialize the PhaseTimer.
+
+        Args:
+            start (float): perf_counter() value to measure from, defaults to now
+        """
+        self.start = time.perf_counter() if start is None else start
+        self.phases: List[Tuple[str, float, float]] = []
+        self.marks: List[Tuple[str, float]] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Time the enclosed block as one phase.
+
+        Args:
+            name (str): Name of the phase
+        """
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                self.phases.append((name, begin - self.start, end - begin))
+
+    def mark(self, name: str):
+        """
+        Record a single moment, e.g. the first paint.
+
+        Args:
+            name (str): Name of the moment
+        """
+        offset = time.perf_counter() - self.start
+        with self._lock:
+            self.marks.append((name, offset))
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Get the recorded timings in milliseconds.
+
+        Returns:
+            Dict[str, Any]: {"phases": [{name, start_ms, duration_ms}],
+                             "marks": {name: ms}}
+        """
+        with self._lock:
+            return {
+                "phases": [{"name": name, "start_ms": round(begin * 1000, 3),
+                            "duration_ms": round(duration * 1000, 3)}
+                           for name, begin, duration in self.phases],
+                "marks": {name: round(offset * 1000, 3) for name, offset in self.marks},
+            }
+
+    def summary(self) -> str:
+        """
+        Format the recorded timings as a table.
+
+        Returns:
+            str: One line per phase (start and duration) and per mark
+        """
+        data = self.as_dict()
+        lines = [f"{'faza':<20} {'začetek ms':>11} {'trajanje ms':>12}"]
+        for phase in sorted(data["phases"], key=lambda p: p["start_ms"]):
+            lines.append(f"{phase['name']:<20} {phase['start_ms']:>11.1f} "
+                         f"{phase['duration_ms']:>12.1f}")
+        for name, offset in sorted(data["marks"].items(), key=lambda m: m[1]):
+            lines.append(f"{name:<20} {offset:>11.1f}")
+        return "\n".join(lines)
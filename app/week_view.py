@@ -0,0 +1,344 @@
+import tkinter as tk
+from tkinter import ttk
+
+import datetime
+import math
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from core.instrumentation import hot_path
+from core.month_view import CELL_EMPTY
+
+# Weeks are numbered from the week of 01.01.0001, which is a Monday
+_LAST_WEEK = (datetime.date.max.toordinal() - 1) // 7
+
+
+def week_of(date: datetime.date) -> int:
+    """
+    Get the number of the week containing a date.
+
+    Args:
+        date (datetime.date): Any date
+
+    Returns:
+        int: Week number, week n starts on the Monday with ordinal 7n + 1
+    """
+    return (date.toordinal() - 1) // 7
+
+
+class _WeekRow:
+    """
+    One pooled row: a frame with a month label and seven day cells.
+
+    Attributes:
+        week (Optional[int]): Week the row currently shows, None if unbound
+        y (Optional[int]): Current vertical position in the viewport
+    """
+
+    def __init__(self, parent, label_width: int, surface: str, label_color: str,
+                 label_font, cell_font):
+        self.frame = tk.Frame(parent, bg=surface)
+        self.label = tk.Label(self.frame, text="", font=label_font, bg=surface,
+                              fg=label_color, width=label_width, anchor='ne', justify='right')
+        self.label.grid(row=0, column=0, sticky=(tk.N, tk.S, tk.E), padx=(0, 6))
+        self.cells = []
+        for col in range(7):
+            cell = tk.Label(self.frame, text="", font=cell_font, bg=surface,
+                            relief='flat', borderwidth=0)
+            cell.grid(row=0, column=col + 1, sticky=(tk.W, tk.E, tk.N, tk.S), padx=1, pady=1)
+            self.frame.columnconfigure(col + 1, weight=1, uniform="day")
+            self.cells.append(cell)
+        self.frame.rowconfigure(0, weight=1)
+        self.week = None
+        self.y = None
+        # (year, month) of every day the row shows
+        self.months: Set[Tuple[int, int]] = set()
+
+    def destroy(self):
+        self.frame.destroy()
+
+
+class WeekScrollView:
+    """
+    Endless vertical list of weeks with a fixed pool of row widgets.
+
+    Only the rows in the viewport plus OVERSCAN rows above and below exist.
+    Week n is always shown by pool row n % pool size, so scrolling by one
+    row re-binds exactly one row to a new week and every other row only
+    moves. The number of widgets depends on the window height alone, no
+    matter how far the list is scrolled.
+
+    Scrolling is animated in frames of FRAME_MS: input only moves the target
+    position, and each frame eases towards it and repaints once.
+
+    Attributes:
+        frame (tk.Frame): Container of the header, viewport and scrollbar
+        month_cache (MonthViewCache): Source of classified days
+        position (float): Week number at the top edge of the viewport,
+                          the fraction is the part of that row scrolled away
+        rows (List[_WeekRow]): The row pool
+    """
+
+    ROW_HEIGHT = 64
+    # Width of the month label column, in characters
+    LABEL_WIDTH = 9
+    OVERSCAN = 2
+    FRAME_MS = 16
+    # Fraction of the remaining distance covered per frame
+    EASING = 0.35
+    # Jumps longer than this many viewports skip most of the animation
+    JUMP_VIEWPORTS = 2
+
+    def __init__(self, parent, month_cache, month_names: List[str], day_names: List[str],
+                 cell_styles: Dict[str, tuple], surface: str, header_bg: str,
+                 label_color: str, label_font, header_font,
+                 on_scroll: Optional[Callable[[int, int], None]] = None):
+        """
+        Initialize the WeekScrollView.
+
+        Args:
+            parent: Widget the view is placed in
+            month_cache (MonthViewCache): Source of classified days
+            month_names (List[str]): Month names for the row labels
+            day_names (List[str]): Day names for the header
+            cell_styles (Dict[str, tuple]): (bg, fg, font) per cell kind
+            surface (str): Background color
+            header_bg (str): Background color of the day name header
+            label_color (str): Color of the month labels
+            label_font: Font of the month labels
+            header_font: Font of the day name header
+            on_scroll (Callable[[int, int], None]): Called with (year, month)
+                                                    when the top month changes
+        """
+        self.month_cache = month_cache
+        self.month_names = month_names
+        self.cell_styles = cell_styles
+        self.surface = surface
+        self.label_color = label_color
+        self.label_font = label_font
+        self.on_scroll = on_scroll
+
+        self.position = 0.0
+        self.target = 0.0
+        self.today = None
+        self.rows: List[_WeekRow] = []
+        self._visible = 1
+        self._month = None
+        self._frame_pending = None
+
+        self.frame = tk.Frame(parent, bg=surface)
+        self.frame.columnconfigure(0, weight=1)
+        self.frame.rowconfigure(1, weight=1)
+
+        header = tk.Frame(self.frame, bg=surface)
+        header.grid(row=0, column=0, sticky=(tk.W, tk.E))
+        tk.Label(header, text="", bg=surface, width=self.LABEL_WIDTH,
+                 font=label_font).grid(row=0, column=0, padx=(0, 6))
+        for col, name in enumerate(day_names):
+            tk.Label(header, text=name, font=header_font, bg=header_bg, fg='white',
+                     height=2).grid(row=0, column=col + 1, sticky=(tk.W, tk.E), padx=1)
+            header.columnconfigure(col + 1, weight=1, uniform="day")
+
+        self.viewport = tk.Frame(self.frame, bg=surface)
+        self.viewport.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.scrollbar = ttk.Scrollbar(self.frame, orient='vertical', command=self.on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, rowspan=2, sticky=(tk.N, tk.S))
+
+        self.viewport.bind('<Configure>', self.on_resize)
+
+    def grid(self, **kwargs):
+        """Place the view with the grid geometry manager."""
+        self.frame.grid(**kwargs)
+
+    def grid_remove(self):
+        """Hide the view, keeping its grid options."""
+        self.frame.grid_remove()
+
+    def _clamp(self, position: float) -> float:
+        return min(max(position, 0.0), float(_LAST_WEEK + 1 - self._visible))
+
+    def on_resize(self, event=None):
+        """
+        Size the row pool to the viewport height.
+
+        Rows are only created or destroyed here, scrolling never does.
+
+        Args:
+            event: tkinter event object (optional, defaults to None)
+        """
+        height = max(self.viewport.winfo_height(), 1)
+        self._visible = max(1, math.ceil(height / self.ROW_HEIGHT))
+        count = self._visible + 1 + 2 * self.OVERSCAN
+        if count == len(self.rows):
+            return  # Rows are placed with relwidth, a wider window needs no work
+        while len(self.rows) < count:
+            self.rows.append(_WeekRow(self.viewport, self.LABEL_WIDTH, self.surface,
+                                      self.label_color, self.label_font,
+                                      self.cell_styles[CELL_EMPTY][2]))
+        while len(self.rows) > count:
+            self.rows.pop().destroy()
+        # The pool size changed, so did the row of every week
+        for row in self.rows:
+            row.week = None
+            row.y = None
+        self.position = self._clamp(self.position)
+        self.target = self._clamp(self.target)
+        self.render()
+
+    def _bind(self, row: _WeekRow, week: int):
+        """Show a week in a pooled row."""
+        row.week = week
+        row.months = set()
+        label = ""
+        for cell, (year, month, day, kind) in zip(
+                row.cells, self.month_cache.week(7 * week + 1, self.today)):
+            bg, fg, font = self.cell_styles[kind]
+            cell.configure(text=str(day) if day else "", bg=bg, fg=fg, font=font)
+            if day:
+                row.months.add((year, month))
+                if day == 1:
+                    label = f"{self.month_names[month - 1]}\n{year}"
+        row.label.configure(text=label)
+
+    @hot_path()
+    def render(self):
+        """Bind and position the pooled rows for the current scroll position."""
+        if not self.rows:
+            return
+        if self.today is None:
+            self.today = datetime.date.today()
+        top = int(self.position)
+        pool = len(self.rows)
+        for week in range(top - self.OVERSCAN, top - self.OVERSCAN + pool):
+            row = self.rows[week % pool]
+            if week < 0 or week > _LAST_WEEK:
+                if row.y is not None:
+                    row.frame.place_forget()
+                    row.y = None
+                    row.week = None
+                continue
+            if row.week != week:
+                self._bind(row, week)
+            y = round((week - self.position) * self.ROW_HEIGHT)
+            if y != row.y:
+                row.frame.place(x=0, y=y, relwidth=1, height=self.ROW_HEIGHT)
+                row.y = y
+
+        total = _LAST_WEEK + 1
+        self.scrollbar.set(self.position / total, (self.position + self._visible) / total)
+
+    def _frame(self):
+        """Advance the scroll animation by one frame."""
+        self._frame_pending = None
+        distance = self.target - self.position
+        if abs(distance) * self.ROW_HEIGHT < 0.5:
+            self.position = self.target
+        else:
+            self.position += distance * self.EASING
+            self._frame_pending = self.frame.after(self.FRAME_MS, self._frame)
+        self.render()
+        self._report_month()
+        if self._frame_pending is None:
+            # Settled: classify the neighbouring months before they scroll in
+            year, month = self._month
+            self.month_cache.prefetch(year, month, self.today)
+
+    def _report_month(self):
+        """Call on_scroll if the month of the top row changed."""
+        top_week = min(math.ceil(self.position), _LAST_WEEK)
+        sunday = datetime.date.fromordinal(min(7 * top_week + 7,
+                                               datetime.date.max.toordinal()))
+        month = (sunday.year, sunday.month)
+        if month != self._month:
+            self._month = month
+            if self.on_scroll is not None:
+                self.on_scroll(*month)
+
+    def scroll_to(self, position: float):
+        """
+        Animate the list to a position.
+
+        Long jumps start the animation one viewport before the target, so
+        the intermediate weeks are never bound.
+
+        Args:
+            position (float): Week number to show at the top
+        """
+        self.target = self._clamp(position)
+        distance = self.target - self.position
+        if abs(distance) > self.JUMP_VIEWPORTS * self._visible:
+            self.position = self.target - math.copysign(self._visible, distance)
+        if self._frame_pending is None:
+            self._frame_pending = self.frame.after(self.FRAME_MS, self._frame)
+
+    def scroll_by(self, rows: float):
+        """
+        Scroll by a number of rows, animated.
+
+        Args:
+            rows (float): Rows to scroll, negative scrolls up
+        """
+        self.scroll_to(self.target + rows)
+
+    def scroll_months(self, months: int):
+        """
+        Scroll so that the first week of another month is at the top.
+
+        Args:
+            months (int): Months to move from the month at the top
+        """
+        year, month = self._month or (datetime.date.today().year, datetime.date.today().month)
+        year, month = divmod(year * 12 + month - 1 + months, 12)
+        if datetime.MINYEAR <= year <= datetime.MAXYEAR:
+            self.scroll_to(week_of(datetime.date(year, month + 1, 1)))
+
+    def on_scrollbar(self, *args):
+        """
+        Handle the scrollbar: dragging jumps, arrows and the trough animate.
+
+        Args:
+            *args: ("moveto", fraction) or ("scroll", amount, "units"|"pages")
+        """
+        if args[0] == "moveto":
+            self.position = self.target = self._clamp(float(args[1]) * (_LAST_WEEK + 1))
+            self.render()
+            self._report_month()
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            self.scroll_by(amount * (self._visible - 1 if args[2] == "pages" else 1))
+
+    def show(self, year: int, month: int, today: Optional[datetime.date] = None):
+        """
+        Display the given month and refresh every row.
+
+        If the month differs from the one at the top, the list scrolls to
+        it; otherwise the position is kept and only the contents are
+        refreshed (e.g. after the holidays or the date changed).
+
+        Args:
+            year (int): Year to display
+            month (int): Month (1-12) to display
+            today (datetime.date): Date highlighted as today, defaults to the current date
+        """
+        self.today = today if today is not None else datetime.date.today()
+        for row in self.rows:
+            row.week = None
+        if (year, month) != self._month:
+            week = week_of(datetime.date(year, month, 1))
+            if self._month is None:
+                self.position = self.target = self._clamp(week)
+            self._month = (year, month)
+            self.scroll_to(week)
+        self.render()
+
+    def visible_months(self) -> Set[Tuple[int, int]]:
+        """
+        Get the months with at least one day in a bound row.
+
+        Returns:
+            Set[Tuple[int, int]]: (year, month) pairs
+        """
+        months = set()
+        for row in self.rows:
+            if row.week is not None:
+                months |= row.months
+        return months
@@ -0,0 +1,184 @@
+import tkinter as tk
+from tkinter import font as tkfont
+
+import datetime
+from typing import Callable, Dict, List, Tuple
+
+from core.month_view import CELL_EMPTY, WEEKS
+
+
+class YearView:
+    """
+    Overview of all twelve months of a year drawn on a single canvas.
+
+    Every canvas item (month titles, day headers, a rectangle and a text per
+    day cell) is created once. Changing the year only updates the text and
+    fill of items whose contents differ, and resizing only moves items.
+
+    Attributes:
+        canvas (tk.Canvas): Canvas the year is drawn on
+        month_cache (MonthViewCache): Source of classified months
+        year (int): Displayed year, None before the first show()
+    """
+
+    COLUMNS = 4
+    ROWS = 3
+    # Rows of one month block: title, day headers and the weeks
+    BLOCK_ROWS = WEEKS + 2
+    PADDING = 12
+
+    def __init__(self, parent, month_cache, month_names: List[str], day_names: List[str],
+                 cell_styles: Dict[str, Tuple[str, str]], background: str,
+                 title_color: str, header_color: str,
+                 on_month_click: Callable[[int, int], None] = None):
+        """
+        Initialize the YearView.
+
+        Args:
+            parent: Widget the canvas is placed in
+            month_cache (MonthViewCache): Source of classified months
+            month_names (List[str]): Month names for the block titles
+            day_names (List[str]): Day names for the block headers
+            cell_styles (Dict[str, Tuple[str, str]]): (fill, text color) per cell kind
+            background (str): Canvas background color
+            title_color (str): Color of month titles
+            header_color (str): Color of day headers
+            on_month_click (Callable[[int, int], None]): Called with (year, month)
+                                                         when a month is clicked
+        """
+        self.month_cache = month_cache
+        self.cell_styles = cell_styles
+        self.on_month_click = on_month_click
+        self.year = None
+
+        self.canvas = tk.Canvas(parent, bg=background, highlightthickness=0,
+                                borderwidth=0)
+
+        # One font per role, resizing reconfigures the font and not every item
+        self.title_font = tkfont.Font(root=parent, family='Segoe UI', size=11, weight='bold')
+        self.header_font = tkfont.Font(root=parent, family='Segoe UI', size=8)
+        self.cell_font = tkfont.Font(root=parent, family='Segoe UI', size=9)
+
+        self.titles = []
+        self.headers = []
+        # Per month: 6 weeks of 7 (rectangle, text) item pairs
+        self.cells = []
+        # Last applied (text, fill, text color) of every cell
+        self.cell_states = []
+
+        empty_fill, empty_color = cell_styles[CELL_EMPTY]
+        for month in range(12):
+            self.titles.append(self.canvas.create_text(
+                0, 0, text=month_names[month], font=self.title_font, fill=title_color))
+            self.headers.append([self.canvas.create_text(
+                0, 0, text=name[:2], font=self.header_font, fill=header_color)
+                for name in day_names])
+            weeks = []
+            states = []
+            for _ in range(WEEKS):
+                weeks.append([(self.canvas.create_rectangle(0, 0, 0, 0, fill=empty_fill,
+                                                            width=0),
+                               self.canvas.create_text(0, 0, text="", font=self.cell_font,
+                                                       fill=empty_color))
+                              for _ in range(7)])
+                states.append([("", empty_fill, empty_color)] * 7)
+            self.cells.append(weeks)
+            self.cell_states.append(states)
+
+        self._layout_pending = None
+        self.canvas.bind('<Configure>', self.on_resize)
+        self.canvas.bind('<Button-1>', self.on_click)
+
+    def grid(self, **kwargs):
+        """Place the canvas with the grid geometry manager."""
+        self.canvas.grid(**kwargs)
+
+    def grid_remove(self):
+        """Hide the canvas, keeping its grid options."""
+        self.canvas.grid_remove()
+
+    def show(self, year: int, today: datetime.date = None):
+        """
+        Display the given year.
+
+        Args:
+            year (int): Year to display
+            today (datetime.date): Date highlighted as today, defaults to the current date
+        """
+        self.year = year
+        if today is None:
+            today = datetime.date.today()
+        for month in range(12):
+            view = self.month_cache.get(year, month + 1, today)
+            items = self.cells[month]
+            states = self.cell_states[month]
+            for week_idx, week in enumerate(view.cells):
+                week_states = states[week_idx]
+                for day_idx, (day, kind) in enumerate(week):
+                    state = (str(day) if day else "",) + self.cell_styles[kind]
+                    if state != week_states[day_idx]:
+                        text, fill, color = state
+                        rect, label = items[week_idx][day_idx]
+                        self.canvas.itemconfigure(rect, fill=fill)
+                        self.canvas.itemconfigure(label, text=text, fill=color)
+                        week_states[day_idx] = state
+
+    def on_resize(self, event=None):
+        """
+        Handle a canvas resize.
+
+        A drag produces many Configure events, the layout is redone once
+        the event queue is idle.
+
+        Args:
+            event: tkinter event object (optional, defaults to None)
+        """
+        if self._layout_pending is None:
+            self._layout_pending = self.canvas.after_idle(self.layout)
+
+    def layout(self):
+        """Move every item to fit the current canvas size."""
+        self._layout_pending = None
+        width = max(self.canvas.winfo_width(), 1)
+        height = max(self.canvas.winfo_height(), 1)
+
+        block_width = (width - self.PADDING) / self.COLUMNS
+        block_height = (height - self.PADDING) / self.ROWS
+        cell_width = (block_width - self.PADDING) / 7
+        cell_height = (block_height - self.PADDING) / self.BLOCK_ROWS
+
+        size = max(6, int(min(cell_width / 2.2, cell_height / 1.6)))
+        self.cell_font.configure(size=size)
+        self.header_font.configure(size=max(6, size - 1))
+        self.title_font.configure(size=size + 2)
+
+        coords = self.canvas.coords
+        for month in range(12):
+            left = self.PADDING + (month % self.COLUMNS) * block_width
+            top = self.PADDING + (month // self.COLUMNS) * block_height
+
+            coords(self.titles[month], left + 3.5 * cell_width, top + cell_height / 2)
+            for col, header in enumerate(self.headers[month]):
+                coords(header, left + (col + 0.5) * cell_width, top + 1.5 * cell_height)
+            for week_idx, week in enumerate(self.cells[month]):
+                y = top + (week_idx + 2) * cell_height
+                for col, (rect, label) in enumerate(week):
+                    x = left + col * cell_width
+                    coords(rect, x + 1, y + 1, x + cell_width - 1, y + cell_height - 1)
+                    coords(label, x + cell_width / 2, y + cell_height / 2)
+
+    def on_click(self, event):
+        """
+        Open the clicked month through on_month_click.
+
+        Args:
+            event: tkinter event object with the click position
+        """
+        if self.on_month_click is None or self.year is None:
+            return
+        width = max(self.canvas.winfo_width(), 1)
+        height = max(self.canvas.winfo_height(), 1)
+        col = int((event.x - self.PADDING) // ((width - self.PADDING) / self.COLUMNS))
+        row = int((event.y - self.PADDING) // ((height - self.PADDING) / self.ROWS))
+        if 0 <= col < self.COLUMNS and 0 <= row < self.ROWS:
+            self.on_month_click(self.year, row * self.COLUMNS + col + 1)
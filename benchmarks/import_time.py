@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Measure the cold import time of the Tk-free core package.
+
+Runs a fresh interpreter with -X importtime for every sample, so nothing is
+cached in sys.modules, and fails if importing core pulls in tkinter.
+
+Usage:
+    python benchmarks/import_time.py [--runs N] [--budget-ms MS]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app")
+
+PROBE = "import sys, core; print('tkinter' in sys.modules)"
+
+
+def measure_once() -> tuple:
+    """
+    Import core in a fresh interpreter.
+
+    Returns:
+        tuple: (cumulative import time of core in ms, whether tkinter got imported)
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", PROBE],
+                            cwd=APP_DIR, capture_output=True, text=True, check=True)
+    core_us = 0
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == "core":
+            core_us = int(parts[1])
+    return core_us / 1000, result.stdout.strip() == "True"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="number of fresh interpreters")
+    parser.add_argument("--budget-ms", type=float, default=50.0,
+                        help="fail if the median import time exceeds this")
+    args = parser.parse_args()
+
+    samples = []
+    for _ in range(args.runs):
+        import_ms, tk_imported = measure_once()
+        if tk_imported:
+            print("✗ Uvoz paketa core je naložil tkinter")
+            return 1
+        samples.append(import_ms)
+
+    median = statistics.median(samples)
+    print(f"core import: median {median:.2f} ms, min {min(samples):.2f} ms, "
+          f"max {max(samples):.2f} ms ({args.runs} runs)")
+    if median > args.budget_ms:
+        print(f"✗ Presežen proračun {args.budget_ms:.1f} ms")
+        return 1
+    print("✓ Znotraj proračuna")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark the streaming holiday loader on a large generated file.
+
+Writes a synthetic holidays file (yearly, one-time, rule and a share of
+malformed lines), loads it with HolidayStore and reports throughput, peak
+memory and the collected diagnostics.
+
+Usage:
+    python benchmarks/load_holidays.py [--lines N] [--bad-ratio R]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Optional
+
+try:
+    import resource
+except ImportError:  # Unix only, peak RSS is then reported as unavailable
+    resource = None
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+from core import HolidayStore  # noqa: E402
+
+
+def write_holidays_file(path: str, lines: int, bad_ratio: float, seed: int = 0):
+    """
+    Write a synthetic holidays file.
+
+    Args:
+        path (str): Output path
+        lines (int): Number of lines to write
+        bad_ratio (float): Share of malformed lines (0-1)
+        seed (int): Random seed, so runs are comparable
+    """
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(lines):
+            kind = rng.random()
+            day, month = rng.randint(1, 28), rng.randint(1, 12)
+            if kind < bad_ratio:
+                f.write(f"{day}/{month}/2024 napačna vrstica\n")
+            elif kind < 0.5:
+                f.write(f"{day:02d}.{month:02d}.{rng.randint(1900, 2100)}|N  # enkratni {i}\n")
+            elif kind < 0.99:
+                f.write(f"{day:02d}.{month:02d}|Y  # ponavljajoči {i}\n")
+            else:
+                f.write(f"EASTER{rng.randint(-50, 60):+d}|Y\n")
+
+
+def _peak_rss() -> Optional[int]:
+    """Peak resident set size of this process in KiB, None where it cannot be read."""
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=1_000_000, help="lines in the generated file")
+    parser.add_argument("--bad-ratio", type=float, default=0.01, help="share of malformed lines")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "holidays.txt")
+        write_holidays_file(path, args.lines, args.bad_ratio)
+        size_mb = os.path.getsize(path) / 1024 / 1024
+
+        rss_before = _peak_rss()
+        start = time.perf_counter()
+        store = HolidayStore(holidays_file=path)
+        elapsed = time.perf_counter() - start
+        rss_after = _peak_rss()
+
+    report = store.report
+    print(f"file: {args.lines} lines, {size_mb:.1f} MB")
+    print(f"load: {elapsed:.2f} s, {args.lines / elapsed:,.0f} lines/s")
+    if rss_before is None:
+        print("peak RSS growth: unavailable")
+    else:
+        print(f"peak RSS growth: {(rss_after - rss_before) / 1024:.1f} MB")
+    print(f"entries: {report.entries}, unique dates: {len(store.holidays)}, rules: {len(store.rules)}")
+    print(f"errors: {report.error_count} (kept {len(report.errors)})")
+    print(report.summary(limit=3))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
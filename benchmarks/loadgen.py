@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Load generator for server.py.
+
+Opens a number of keep-alive connections to the local query service and
+sends requests back to back for a fixed duration, then reports requests
+per second and latency percentiles.
+
+Usage:
+    python server.py &
+    python benchmarks/loadgen.py [--port 8765] [--connections 16] [--duration 5]
+                                 [--endpoint holiday|month|business] [--batch 1]
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import random
+import sys
+import time
+from typing import List
+
+
+def build_request(endpoint: str, batch: int, rng: random.Random) -> bytes:
+    """
+    Build one HTTP request for the chosen endpoint.
+
+    Args:
+        endpoint (str): "holiday", "month" or "business"
+        batch (int): Number of queries per request (1 uses GET)
+        rng (random.Random): Source of random dates
+
+    Returns:
+        bytes: The raw request
+    """
+    def random_date() -> datetime.date:
+        return datetime.date(2000, 1, 1) + datetime.timedelta(days=rng.randrange(365 * 40))
+
+    if batch == 1:
+        date = random_date()
+        target = {
+            "holiday": f"/holiday?date={date.isoformat()}",
+            "month": f"/month?year={date.year}&month={date.month}",
+            "business": f"/business-days?op=add&date={date.isoformat()}&n={rng.randint(-50, 50)}",
+        }[endpoint]
+        return f"GET {target} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode('latin-1')
+
+    if endpoint == "holiday":
+        path, data = "/holiday", {"dates": [random_date().isoformat() for _ in range(batch)]}
+    elif endpoint == "month":
+        path, data = "/month", {"months": [{"year": d.year, "month": d.month}
+                                           for d in (random_date() for _ in range(batch))]}
+    else:
+        path, data = "/business-days", {"requests": [
+            {"op": "add", "date": random_date().isoformat(), "n": rng.randint(-50, 50)}
+            for _ in range(batch)]}
+    body = json.dumps(data).encode('utf-8')
+    head = (f"POST {path} HTTP/1.1\r\nHost: localhost\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n")
+    return head.encode('latin-1') + body
+
+
+async def read_response(reader: asyncio.StreamReader) -> int:
+    """Read one response and return its status code."""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("povezava zaprta")
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode('latin-1').partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return int(status_line.split()[1])
+
+
+async def worker(host: str, port: int, endpoint: str, batch: int, deadline: float,
+                 latencies: List[float], errors: List[int], seed: int):
+    """Send requests over one keep-alive connection until the deadline."""
+    rng = random.Random(seed)
+    requests = [build_request(endpoint, batch, rng) for _ in range(256)]
+    reader, writer = await asyncio.open_connection(host, port)
+    i = 0
+    try:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            writer.write(requests[i % len(requests)])
+            await writer.drain()
+            status = await read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append(status)
+            i += 1
+    finally:
+        writer.close()
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(p / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+async def run(args) -> int:
+    latencies: List[float] = []
+    errors: List[int] = []
+    start = time.perf_counter()
+    deadline = start + args.duration
+    await asyncio.gather(*(worker(args.host, args.port, args.endpoint, args.batch, deadline,
+                                  latencies, errors, seed)
+                           for seed in range(args.connections)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"endpoint: {args.endpoint}, batch: {args.batch}, connections: {args.connections}")
+    print(f"requests: {len(latencies)} in {elapsed:.2f} s, errors: {len(errors)}")
+    print(f"throughput: {len(latencies) / elapsed:,.0f} req/s, "
+          f"{len(latencies) * args.batch / elapsed:,.0f} queries/s")
+    print(f"latency: p50 {percentile(latencies, 50) * 1000:.2f} ms, "
+          f"p99 {percentile(latencies, 99) * 1000:.2f} ms, "
+          f"max {latencies[-1] * 1000 if latencies else 0:.2f} ms")
+    return 1 if errors else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--connections", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds")
+    parser.add_argument("--endpoint", choices=("holiday", "month", "business"), default="holiday")
+    parser.add_argument("--batch", type=int, default=1, help="queries per request")
+    args = parser.parse_args()
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Stress test for concurrent lookups while the holidays file is reloaded.
+
+A writer thread keeps switching the holidays file between two versions and
+reloads the store (incrementally, and now and then completely), while
+reader threads query it without any locking. Every reader takes one
+HolidayState and checks that all of its answers belong to the same
+version of the file; iterating the entry sets must never fail either.
+
+Usage:
+    python benchmarks/stress_reload.py [--readers 8] [--duration 5] [--full-every 10] [--snapshot]
+
+tests/test_stress_reload.py runs the same check for a short time under pytest.
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List, NamedTuple, Set, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "app"))
+
+from core import HolidayStore  # noqa: E402
+
+YEAR = 2030
+# Present only in version B, tells a reader which version its state holds
+MARKER = (15, 6, YEAR + 1)
+
+
+def build_versions(seed: int) -> List[List[str]]:
+    """
+    Build the lines of the two file versions.
+
+    Args:
+        seed (int): Seed for the random one-time holidays
+
+    Returns:
+        List[List[str]]: Lines of version A and version B
+    """
+    rng = random.Random(seed)
+    common = ["01.01|Y", "25.12|Y", "EASTER+1|Y", "L.PON.05|Y"]
+    days = [(rng.randint(1, 28), rng.randint(1, 12)) for _ in range(3000)]
+    one_time = [f"{day:02d}.{month:02d}.{YEAR}|N" for day, month in days]
+    version_a = common + one_time[:2000] + ["01.03-05.03|Y"]
+    version_b = (common + one_time[1000:] + ["10.07-20.07|Y", "27.10.2030-31.10.2030|N",
+                                              "{:02d}.{:02d}.{}|N".format(*MARKER)])
+    return [version_a, version_b]
+
+
+def write_atomically(path: str, lines: List[str]):
+    """Replace the file in one rename, the way editors save."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
+    os.replace(tmp_path, path)
+
+
+# YEAR is almost full of one-time holidays in both versions; the next year
+# only has the yearly entries and MARKER, so leftovers of the other version show
+YEARS = (YEAR, YEAR + 1)
+
+
+def expected_months(path: str, lines: List[str]) -> Dict[Tuple[int, int], Set[int]]:
+    """Holidays of every month of YEARS for one file version, from a fresh store."""
+    write_atomically(path, lines)
+    store = HolidayStore(holidays_file=path)
+    return {(year, month): store.holidays_in_month(year, month)
+            for year in YEARS for month in range(1, 13)}
+
+
+def expected_sizes(path: str, lines: List[str]) -> int:
+    """Number of (day, month, year, is_yearly) holidays of one file version."""
+    write_atomically(path, lines)
+    return len(HolidayStore(holidays_file=path).holidays)
+
+
+class StressResult(NamedTuple):
+    """
+    Outcome of one stress run.
+
+    Attributes:
+        failures (List[str]): Inconsistencies and exceptions seen by the threads
+        reads (int): Consistency checks done by all readers
+        reloads (int): Reloads done by the writer
+        version (int): Final HolidayStore.version
+        elapsed (float): Duration of the run in seconds
+    """
+    failures: List[str]
+    reads: int
+    reloads: int
+    version: int
+    elapsed: float
+
+
+def run_stress(directory: str, readers: int = 8, duration: float = 5.0, full_every: int = 10,
+               seed: int = 0, use_snapshot: bool = False) -> StressResult:
+    """
+    Swap the holidays file between two versions while readers query the store.
+
+    Args:
+        directory (str): Directory for the holidays file (and its snapshot)
+        readers (int): Reader threads
+        duration (float): Seconds to run
+        full_every (int): Every N-th reload is a full load_holidays()
+        seed (int): Seed for the file versions and the readers
+        use_snapshot (bool): Start the store from a snapshot of version A
+
+    Returns:
+        StressResult: Failures and counts of the run
+    """
+    path = os.path.join(directory, "holidays.txt")
+    versions = build_versions(seed)
+    expected = [expected_months(path, lines) for lines in versions]
+    sizes = [expected_sizes(path, lines) for lines in versions]
+
+    write_atomically(path, versions[0])
+    if use_snapshot:
+        HolidayStore(holidays_file=path, use_snapshot=True)  # Writes the snapshot
+    store = HolidayStore(holidays_file=path, use_snapshot=use_snapshot)
+
+    stop = threading.Event()
+    failures: List[str] = []
+    reads = [0] * readers
+    reloads = [0]
+
+    def reader(slot: int):
+        rng = random.Random(seed * 1000 + slot)
+        count = 0
+        try:
+            while not stop.is_set():
+                state = store.state
+                version = 1 if state.index.is_holiday(*MARKER) else 0
+                # Every month and the entry set of one state must agree on the version
+                for year, month in expected[version]:
+                    days = state.index.holidays_in_month(year, month)
+                    if days != expected[version][year, month]:
+                        failures.append(f"bralec {slot}: mesec {month}.{year} ne ustreza "
+                                        f"različici {'AB'[version]}")
+                        return
+                # A state started from a snapshot holds no holiday tuples
+                if state.holidays and len(state.holidays) != sizes[version]:
+                    failures.append(f"bralec {slot}: prazniki ne ustrezajo "
+                                    f"različici {'AB'[version]}")
+                    return
+                # Iterating the published sets must be safe during reloads
+                sum(1 for _ in store.holidays)
+                store.is_holiday(rng.randint(1, 28), rng.randint(1, 12), YEAR)
+                count += 1
+                time.sleep(0)  # Let the writer run, it needs the GIL to reload
+        except Exception as e:
+            failures.append(f"bralec {slot}: {type(e).__name__}: {e}")
+        finally:
+            reads[slot] = count
+
+    def writer():
+        current = 0
+        try:
+            while not stop.is_set():
+                current ^= 1
+                write_atomically(path, versions[current])
+                reloads[0] += 1
+                if reloads[0] % full_every == 0:
+                    store.load_holidays()
+                else:
+                    store.reload()
+        except Exception as e:
+            failures.append(f"pisalec: {type(e).__name__}: {e}")
+
+    threads = [threading.Thread(target=reader, args=(slot,)) for slot in range(readers)]
+    threads.append(threading.Thread(target=writer))
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return StressResult(failures, sum(reads), reloads[0], store.version, elapsed)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds")
+    parser.add_argument("--full-every", type=int, default=10,
+                        help="every N-th reload is a full load_holidays()")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--snapshot", action="store_true",
+                        help="start the store from a snapshot of the first version")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        result = run_stress(tmp, args.readers, args.duration, args.full_every, args.seed,
+                            args.snapshot)
+    elapsed = result.elapsed
+
+    print(f"readers:      {args.readers}")
+    print(f"duration:     {elapsed:.2f} s")
+    print(f"reloads:      {result.reloads} ({result.reloads / elapsed:.0f}/s), "
+          f"final version {result.version}")
+    print(f"reads:        {result.reads} ({result.reads / elapsed:.0f}/s)")
+    if result.failures:
+        print(f"FAILED: {len(result.failures)} problem(s)")
+        for failure in result.failures[:10]:
+            print(f"  {failure}")
+        return 1
+    print("ok: every state was consistent")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
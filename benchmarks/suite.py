@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for parsing, lookups, rendering and startup.
+
+Every benchmark produces one metric; results are written as JSON so runs
+can be stored and compared. GUI benchmarks need a display: an existing
+$DISPLAY is used, otherwise a headless Xvfb server is started if it is
+installed, and otherwise the GUI benchmarks are reported as skipped.
+
+Usage:
+    python benchmarks/suite.py run [--output results.json] [--quick] [--only PREFIX ...]
+    python benchmarks/suite.py compare baseline.json results.json [--threshold 0.1]
+    python benchmarks/suite.py run --output results.json --baseline baseline.json
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_DIR = os.path.join(ROOT, "app")
+sys.path.insert(0, APP_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core import HolidayStore  # noqa: E402
+from load_holidays import write_holidays_file  # noqa: E402
+
+HOLIDAYS_FILE = os.path.join(ROOT, "assets", "holidays.txt")
+
+LOAD_SIZES = (10, 1_000, 100_000, 1_000_000)
+QUICK_LOAD_SIZES = (10, 1_000, 100_000)
+
+
+def metric(value: float, unit: str, better: str = "lower", **extra) -> Dict[str, Any]:
+    """
+    Build one result entry.
+
+    Args:
+        value (float): Measured value
+        unit (str): Unit of the value, e.g. "ms" or "ops/s"
+        better (str): "lower" or "higher", used by compare
+        **extra: Additional information stored with the result
+
+    Returns:
+        Dict[str, Any]: The result entry
+    """
+    return dict(value=round(value, 6), unit=unit, better=better, **extra)
+
+
+def best_of(func: Callable[[], Any], repeat: int) -> float:
+    """
+    Run a function several times.
+
+    Args:
+        func (Callable): Function to time
+        repeat (int): Number of runs
+
+    Returns:
+        float: Fastest run in seconds
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_load_holidays(quick: bool) -> Dict[str, Dict[str, Any]]:
+    """HolidayStore.load_holidays on synthetic files of increasing size."""
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for lines in QUICK_LOAD_SIZES if quick else LOAD_SIZES:
+            path = os.path.join(tmp, f"holidays_{lines}.txt")
+            write_holidays_file(path, lines, bad_ratio=0.01)
+            store = HolidayStore(holidays_file=path)
+            elapsed = best_of(store.load_holidays, 1 if lines >= 100_000 else 5)
+            results[f"load_holidays.{lines}"] = metric(elapsed * 1000, "ms",
+                                                       lines_per_s=round(lines / elapsed))
+    return results
+
+
+def _ops_per_second(func: Callable[[], Any], calls: int) -> float:
+    """Throughput of a function that performs `calls` operations per run."""
+    return calls / best_of(func, 3)
+
+
+def bench_lookups(quick: bool) -> Dict[str, Dict[str, Any]]:
+    """is_holiday, utils.is_sunday and utils.is_today throughput."""
+    import utils
+
+    rng = random.Random(0)
+    calls = 20_000 if quick else 200_000
+    start = datetime.date(1950, 1, 1).toordinal()
+    dates = [datetime.date.fromordinal(start + rng.randrange(150 * 366)) for _ in range(calls)]
+    triples = [(d.day, d.month, d.year) for d in dates]
+
+    store = HolidayStore(holidays_file=HOLIDAYS_FILE)
+    is_holiday = store.is_holiday
+
+    def run_is_holiday():
+        for day, month, year in triples:
+            is_holiday(day, month, year)
+
+    def run_is_sunday():
+        for day, month, year in triples:
+            utils.is_sunday(day, month, year)
+
+    def run_is_today():
+        for day, month, year in triples:
+            utils.is_today(day, month, year)
+
+    return {
+        "is_holiday": metric(_ops_per_second(run_is_holiday, calls), "ops/s", "higher"),
+        "utils.is_sunday": metric(_ops_per_second(run_is_sunday, calls), "ops/s", "higher"),
+        "utils.is_today": metric(_ops_per_second(run_is_today, calls), "ops/s", "higher"),
+    }
+
+
+def bench_render(quick: bool) -> Dict[str, Dict[str, Any]]:
+    """Offscreen month pages per minute (one process), SVG and PNG."""
+    from core.render import Page, render_page
+
+    store = HolidayStore(holidays_file=HOLIDAYS_FILE)
+    pages = [Page(HOLIDAYS_FILE, year, month)
+             for year in range(2025, 2026 if quick else 2030) for month in range(1, 13)]
+
+    results = {}
+    for fmt in ("svg", "png"):
+        def run_render():
+            for page in pages:
+                render_page(page, store, fmt)
+
+        elapsed = best_of(run_render, 3)
+        results[f"render.{fmt}"] = metric(len(pages) / elapsed * 60, "pages/min", "higher")
+    return results
+
+
+def bench_notes(quick: bool) -> Dict[str, Dict[str, Any]]:
+    """NoteStore: one month's notes from a large history, uncached and cached."""
+    import sqlite3
+    from core.notes import NoteStore
+
+    rng = random.Random(0)
+    count = 100_000 if quick else 1_000_000
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "notes.db")
+        NoteStore(path).close()
+        db = sqlite3.connect(path)
+        db.executemany("INSERT INTO notes (year, month, day, text) VALUES (?, ?, ?, ?)",
+                       ((rng.randint(1950, 2050), rng.randint(1, 12), rng.randint(1, 28),
+                         f"zapisek {i}") for i in range(count)))
+        db.commit()
+        db.close()
+
+        notes = NoteStore(path)
+        months = [(rng.randint(1950, 2050), rng.randint(1, 12)) for _ in range(200)]
+
+        def run_cold():
+            for year, month in months:
+                notes.invalidate()
+                notes.month_notes(year, month)
+
+        def run_cached():
+            for year, month in months[:notes.maxsize] * 20:
+                notes.month_notes(year, month)
+
+        results[f"notes.month_query.{count}"] = metric(best_of(run_cold, 3) / len(months) * 1000,
+                                                       "ms")
+        results["notes.month_cached"] = metric(
+            _ops_per_second(run_cached, notes.maxsize * 20), "ops/s", "higher")
+        notes.close()
+    return results
+
+
+# Runs in a child process with a display: times update_calendar() redraws
+GUI_REDRAW_PROBE = """
+import json, sys, time
+sys.path.append("./app")
+from app.calendar_app import Calendar
+
+redraws = int(sys.argv[1])
+result = {}
+
+def measure(app):
+    app.update_calendar()
+    samples = []
+    for i in range(redraws):
+        app.current_month = i % 12 + 1
+        start = time.perf_counter()
+        app.update_calendar()
+        app.root.update_idletasks()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    result["median_ms"] = samples[len(samples) // 2] * 1000
+    result["p95_ms"] = samples[int(len(samples) * 0.95)] * 1000
+    app.root.quit()
+
+app = Calendar(on_ready=measure)
+app.run()
+print(json.dumps(result))
+"""
+
+
+class HeadlessDisplay:
+    """
+    Provides a display for GUI benchmarks.
+
+    Uses $DISPLAY if set, otherwise starts Xvfb if installed.
+
+    Attributes:
+        env (Optional[Dict[str, str]]): Environment for child processes, None
+                                        if no display is available
+        reason (str): Why no display is available
+    """
+
+    def __init__(self):
+        self.env = None
+        self.reason = ""
+        self._process = None
+
+    def __enter__(self) -> "HeadlessDisplay":
+        if os.environ.get("DISPLAY"):
+            self.env = dict(os.environ)
+            return self
+        xvfb = shutil.which("Xvfb")
+        if xvfb is None:
+            self.reason = "no $DISPLAY and Xvfb is not installed"
+            return self
+
+        display = f":{random.randint(100, 999)}"
+        self._process = subprocess.Popen([xvfb, display, "-screen", "0", "1280x1024x24",
+                                          "-nolisten", "tcp"],
+                                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        time.sleep(0.5)
+        if self._process.poll() is not None:
+            self.reason = "Xvfb failed to start"
+            self._process = None
+            return self
+        self.env = dict(os.environ, DISPLAY=display)
+        return self
+
+    def __exit__(self, *exc):
+        if self._process is not None:
+            self._process.terminate()
+            self._process.wait()
+
+
+def bench_gui(quick: bool) -> Dict[str, Dict[str, Any]]:
+    """update_calendar redraw time and cold start of main.py."""
+    names = ("update_calendar.median", "update_calendar.p95", "startup.first_paint",
+             "startup.ready", "startup.wall")
+    with HeadlessDisplay() as display:
+        if display.env is None:
+            return {name: {"skipped": display.reason} for name in names}
+
+        results = {}
+        probe = subprocess.run([sys.executable, "-c", GUI_REDRAW_PROBE,
+                                "50" if quick else "500"],
+                               cwd=ROOT, env=display.env, capture_output=True,
+                               text=True, timeout=120)
+        if probe.returncode == 0:
+            redraw = json.loads(probe.stdout.strip().splitlines()[-1])
+            results["update_calendar.median"] = metric(redraw["median_ms"], "ms")
+            results["update_calendar.p95"] = metric(redraw["p95_ms"], "ms")
+        else:
+            results["update_calendar.median"] = {"skipped": probe.stderr.strip()[-200:]}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            report_path = os.path.join(tmp, "startup.json")
+            walls, reports = [], []
+            for _ in range(1 if quick else 5):
+                start = time.perf_counter()
+                run = subprocess.run([sys.executable, "main.py", "--startup-report",
+                                      report_path], cwd=ROOT, env=display.env,
+                                     capture_output=True, text=True, timeout=120)
+                walls.append(time.perf_counter() - start)
+                if run.returncode != 0 or not os.path.exists(report_path):
+                    return dict(results, **{"startup.wall": {"skipped": run.stderr[-200:]}})
+                with open(report_path, encoding='utf-8') as f:
+                    reports.append(json.load(f))
+
+        best = min(range(len(walls)), key=walls.__getitem__)
+        marks = reports[best]["marks"]
+        results["startup.first_paint"] = metric(marks.get("first_paint", 0.0), "ms")
+        results["startup.ready"] = metric(marks.get("ready", 0.0), "ms")
+        results["startup.wall"] = metric(walls[best] * 1000, "ms")
+        return results
+
+
+BENCHMARKS = {
+    "load_holidays": bench_load_holidays,
+    "lookups": bench_lookups,
+    "render": bench_render,
+    "notes": bench_notes,
+    "gui": bench_gui,
+}
+
+
+def run(quick: bool, only: Optional[List[str]]) -> Dict[str, Any]:
+    """
+    Run the selected benchmarks.
+
+    Args:
+        quick (bool): Use smaller inputs and fewer repeats
+        only (Optional[List[str]]): Names of benchmark groups to run, None runs all
+
+    Returns:
+        Dict[str, Any]: {"meta": {...}, "results": {metric name: result}}
+    """
+    results = {}
+    for name, bench in BENCHMARKS.items():
+        if only and name not in only:
+            continue
+        print(f"running {name} ...", file=sys.stderr)
+        results.update(bench(quick))
+    return {
+        "meta": {
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "quick": quick,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any],
+            threshold: float) -> List[str]:
+    """
+    Compare two result files.
+
+    Args:
+        baseline (Dict[str, Any]): Saved results
+        current (Dict[str, Any]): New results
+        threshold (float): Allowed relative slowdown, e.g. 0.1 for 10 %
+
+    Returns:
+        List[str]: Names of metrics that regressed beyond the threshold
+    """
+    regressions = []
+    for name, new in sorted(current["results"].items()):
+        old = baseline["results"].get(name)
+        if old is None or "value" not in old or "value" not in new or not old["value"]:
+            continue
+        change = new["value"] / old["value"] - 1
+        if new.get("better", "lower") == "higher":
+            regressed = change < -threshold
+        else:
+            regressed = change > threshold
+        flag = "REGRESSION" if regressed else "ok"
+        print(f"{name:<28} {old['value']:>14.3f} -> {new['value']:>14.3f} {new['unit']:<6} "
+              f"{change:+8.1%}  {flag}")
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+
+def _read(path: str) -> Dict[str, Any]:
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--output", help="write results to this JSON file")
+    run_parser.add_argument("--quick", action="store_true", help="smaller inputs, fewer repeats")
+    run_parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS),
+                            help="run only these groups")
+    run_parser.add_argument("--baseline", help="compare against this results file")
+    run_parser.add_argument("--threshold", type=float, default=0.10,
+                            help="allowed relative regression (default 0.10)")
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10,
+                                help="allowed relative regression (default 0.10)")
+
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        regressions = compare(_read(args.baseline), _read(args.current), args.threshold)
+    else:
+        results = run(args.quick, args.only)
+        text = json.dumps(results, indent=2)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(text + "\n")
+        else:
+            print(text)
+        regressions = []
+        if args.baseline:
+            regressions = compare(_read(args.baseline), results, args.threshold)
+
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,147 @@
+import argparse
+import json
+import multiprocessing
+import os
 import sys
+import time
+
+# Startup is timed from here, before any application module is imported
+_START = time.perf_counter()
 
 sys.path.append("./app")
 
 
-from app.calendar_app import Calendar
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Slovenski koledar")
+    parser.add_argument("--classify", nargs="?", const="-", metavar="DATOTEKA",
+                        help="razvrsti datume iz datoteke ali stdin (-) brez grafičnega vmesnika")
+    parser.add_argument("--field", default=None,
+                        help="ključ datuma v vrsticah JSONL (privzeto 'date' za .jsonl)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="število procesov za razvrščanje in izris")
+    parser.add_argument("--chunk-size", type=int, default=65536,
+                        help="število datumov v enem kosu")
+    parser.add_argument("--render", metavar="MAPA",
+                        help="izriši strani koledarja v mapo brez grafičnega vmesnika")
+    parser.add_argument("--export", metavar="DATOTEKA",
+                        help="izvozi praznike v .ics ali .csv (- za ICS na stdout)")
+    parser.add_argument("--years", default=str(time.localtime().tm_year),
+                        help="leto ali obdobje let za --render in --export, npr. 2025-2030")
+    parser.add_argument("--format", choices=("svg", "png"), default="svg",
+                        help="oblika strani za --render")
+    parser.add_argument("--pages", choices=("month", "year", "both"), default="month",
+                        help="stran za vsak mesec, za vsako leto ali oboje")
+    parser.add_argument("--sites", metavar="MAPA",
+                        help="mapa z datoteko praznikov (*.txt) za vsako lokacijo; "
+                             "vsaka dobi svojo podmapo")
+    parser.add_argument("--holidays", default="./assets/holidays.txt",
+                        help="datoteka s prazniki (.txt ali .ics)")
+    parser.add_argument("--notes", metavar="DATOTEKA",
+                        help="datoteka SQLite z zapiski dni (ustvari se, če ne obstaja)")
+    parser.add_argument("--startup-report", nargs="?", const="-", metavar="DATOTEKA",
+                        help="izmeri faze zagona, izpiši jih (ali zapiši JSON v datoteko) "
+                             "in končaj")
+    parser.add_argument("--profile", nargs="?", const=".", metavar="MAPA",
+                        help="vklopi merjenje klicev in cProfile; ob izhodu zapiše "
+                             "profile.prof in profile_stats.txt v mapo")
+    return parser.parse_args(argv)
+
+
+def main():
+    """Start the calendar application, or run --classify, --render or --export without it."""
+    args = parse_args()
+
+    if args.classify is not None:
+        # Batch mode must not import Tk
+        from core.batch import main_classify
+        return main_classify(args.classify, args.holidays, args.field,
+                             args.workers, args.chunk_size)
+
+    if args.export is not None:
+        from core.ical import main_export
+        return main_export(args.export, args.holidays, args.years)
+
+    if args.render is not None:
+        # Rendering must not import Tk either
+        from core.render import main_render
+        kinds = ["year", "month"] if args.pages == "both" else [args.pages]
+        return main_render(args.render, args.holidays, args.years, args.format, kinds,
+                           args.sites, args.workers)
+
+    from core.timing import PhaseTimer
+
+    profiler = None
+    if args.profile is not None:
+        import cProfile
+        from core import instrumentation
+        instrumentation.enable()
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    timer = PhaseTimer(start=_START)
+    with timer.phase("import"):
+        from app.calendar_app import Calendar
+
+    on_ready = None
+    if args.startup_report is not None:
+        def on_ready(app):
+            write_startup_report(timer, args.startup_report)
+            app.root.quit()
+
+    try:
+        app = Calendar(startup_timer=timer, on_ready=on_ready, notes_file=args.notes)
+        app.run()
+    except Exception as e:
+        print(f"Error: {e}")
+        return 1
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            write_profile(profiler, args.profile)
+    return 0
+
+
+def write_profile(profiler, directory: str):
+    """
+    Write the cProfile data and a readable summary with the call counters.
+
+    Args:
+        profiler (cProfile.Profile): Stopped profiler
+        directory (str): Output directory
+    """
+    import io
+    import pstats
+    from core import instrumentation
+
+    os.makedirs(directory, exist_ok=True)
+    profiler.dump_stats(os.path.join(directory, "profile.prof"))
+
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(40)
+    with open(os.path.join(directory, "profile_stats.txt"), 'w', encoding='utf-8') as f:
+        f.write(instrumentation.report())
+        f.write("\n\n")
+        f.write(stream.getvalue())
+    print(f"Profil zapisan v {os.path.abspath(directory)}")
+
+
+def write_startup_report(timer, path: str):
+    """
+    Write the startup phase timings.
+
+    Args:
+        timer (PhaseTimer): Recorded startup timings
+        path (str): "-" prints a table to stdout, anything else is a JSON file
+    """
+    if path == "-":
+        print(timer.summary())
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(timer.as_dict(), f, indent=2)
+
 
-try:
-    app = Calendar()
-    app.run()
-except Exception as e:
-    print(f"Error: {e}")
\ No newline at end of file
+if __name__ == "__main__":
+    # Worker processes (e.g. loading region files) must not start the GUI
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Local HTTP/JSON query service for holidays, month views and business days.
+
+All requests share one in-memory holiday index, which is reloaded when the
+holidays file changes. Reloads and large batches run on worker threads, so
+they do not hold up the other connections. Connections are kept alive
+(HTTP/1.1), and every endpoint accepts a batch of queries in one POST request.
+
+Usage:
+    python server.py [--host 127.0.0.1] [--port 8765] [--holidays ./assets/holidays.txt]
+
+Endpoints:
+    GET  /health
+    GET  /holiday?date=2024-04-01&date=2024-04-02
+    POST /holiday             {"dates": ["2024-04-01", "01.05.2024"]}
+    GET  /month?year=2024&month=4
+    POST /month               {"months": [{"year": 2024, "month": 4}]}
+    GET  /business-days?op=add&date=2024-04-01&n=5
+    POST /business-days       {"requests": [{"op": "count", "start": "...", "end": "..."}]}
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from typing import Any, Dict, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.append("./app")
+
+from core import HolidayStore  # noqa: E402
+from core.service import HolidayService, QueryError  # noqa: E402
+
+
+MAX_HEADER_LINES = 100
+MAX_BODY_BYTES = 16 * 1024 * 1024
+# Larger request bodies are answered on a worker thread instead of the event loop
+INLINE_BODY_BYTES = 64 * 1024
+KEEP_ALIVE_TIMEOUT = 30.0
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class HolidayHTTPServer:
+    """
+    Minimal asyncio HTTP/1.1 server in front of a HolidayService.
+
+    Attributes:
+        service (HolidayService): Answers the queries
+        host (str): Interface to bind, localhost by default
+        port (int): Port to bind, 0 picks a free port
+        poll_interval (float): Seconds between checks of the holidays file
+    """
+
+    def __init__(self, service: HolidayService, host: str = "127.0.0.1", port: int = 8765,
+                 poll_interval: float = 2.0):
+        self.service = service
+        self.host = host
+        self.port = port
+        self.poll_interval = poll_interval
+        self._server = None
+        # The event loop only keeps weak references to tasks
+        self._watcher = None
+        self._routes = {
+            "/health": self.handle_health,
+            "/holiday": self.handle_holiday,
+            "/month": self.handle_month,
+            "/business-days": self.handle_business_days,
+        }
+
+    async def start(self):
+        """Start listening; the bound port is stored in self.port."""
+        self._server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._watcher = asyncio.ensure_future(self._watch_holidays())
+
+    async def serve_forever(self):
+        """Start the server and serve until cancelled."""
+        await self.start()
+        print(f"Strežnik posluša na http://{self.host}:{self.port}")
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def _watch_holidays(self):
+        """Reload the shared holiday index when the holidays file changes."""
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            # A reload can parse the whole file; readers take no lock, so it
+            # runs on a worker thread while requests are still answered
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.service.holiday_store.check_for_changes)
+
+    async def handle_connection(self, reader: asyncio.StreamReader,
+                                writer: asyncio.StreamWriter):
+        """Serve requests on one connection until the client or the timeout closes it."""
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(),
+                                                          KEEP_ALIVE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    break
+                if not request_line.strip():
+                    break
+
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self._respond(writer, 400, {"error": "neveljavna zahteva"}, False)
+                    break
+
+                headers = {}
+                for _ in range(MAX_HEADER_LINES):
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode('latin-1').partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                connection = headers.get("connection", "").lower()
+                if version == "HTTP/1.0":
+                    keep_alive = connection == "keep-alive"
+                else:
+                    keep_alive = connection != "close"
+
+                # Only plain digits: int() would also take "-5", "+5" and "1_000"
+                length = headers.get("content-length", "0") or "0"
+                if not (length.isascii() and length.isdigit()):
+                    await self._respond(writer, 400, {"error": "neveljavna dolžina telesa"},
+                                        False)
+                    break
+                length = int(length)
+                if length > MAX_BODY_BYTES:
+                    await self._respond(writer, 413, {"error": "zahteva je prevelika"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                if length > INLINE_BODY_BYTES:
+                    # Large batches would stall every other connection
+                    status, payload = await asyncio.get_running_loop().run_in_executor(
+                        None, self.dispatch, method, target, body)
+                else:
+                    status, payload = self.dispatch(method, target, body)
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: int,
+                       payload: Dict[str, Any], keep_alive: bool):
+        """Write a JSON response."""
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode('utf-8')
+        head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+    def dispatch(self, method: str, target: str, body: bytes) -> Tuple[int, Dict[str, Any]]:
+        """
+        Route a request to its handler.
+
+        Args:
+            method (str): HTTP method
+            target (str): Request target (path and query string)
+            body (bytes): Request body
+
+        Returns:
+            Tuple[int, Dict[str, Any]]: HTTP status and JSON payload
+        """
+        url = urlsplit(target)
+        handler = self._routes.get(url.path.rstrip("/") or "/")
+        if handler is None:
+            return 404, {"error": f"neznana pot {url.path}"}
+        if method not in ("GET", "POST"):
+            return 405, {"error": f"metoda {method} ni podprta"}
+
+        try:
+            if method == "POST":
+                data = json.loads(body.decode('utf-8')) if body else {}
+                if not isinstance(data, dict):
+                    raise QueryError("telo zahteve mora biti JSON objekt")
+            else:
+                data = None
+            return 200, handler(parse_qs(url.query), data)
+        except (QueryError, json.JSONDecodeError, UnicodeDecodeError) as e:
+            return 400, {"error": str(e)}
+        except Exception as e:
+            return 500, {"error": f"notranja napaka: {e}"}
+
+    def handle_health(self, query, data) -> Dict[str, Any]:
+        """GET /health: liveness and data version."""
+        return {"status": "ok", "version": self.service.holiday_store.version}
+
+    def handle_holiday(self, query, data) -> Dict[str, Any]:
+        """GET/POST /holiday: classify one or many dates."""
+        dates = data.get("dates", []) if data is not None else query.get("date", [])
+        if not isinstance(dates, list):
+            raise QueryError("'dates' mora biti seznam")
+        return {"results": self.service.classify_dates(dates)}
+
+    def handle_month(self, query, data) -> Dict[str, Any]:
+        """GET/POST /month: classified grid of one or many months."""
+        if data is None:
+            try:
+                return self.service.month_view(int(query["year"][0]), int(query["month"][0]))
+            except (KeyError, ValueError):
+                raise QueryError("potrebna sta celoštevilska parametra year in month") from None
+
+        months = data.get("months", [])
+        if not isinstance(months, list):
+            raise QueryError("'months' mora biti seznam")
+        results = []
+        for request in months:
+            try:
+                results.append(self.service.month_view(int(request["year"]),
+                                                       int(request["month"])))
+            except (KeyError, TypeError, ValueError):
+                raise QueryError("vsak mesec potrebuje celoštevilski year in month") from None
+        return {"results": results}
+
+    def handle_business_days(self, query, data) -> Dict[str, Any]:
+        """GET/POST /business-days: one or many business-day operations."""
+        if data is None:
+            return self.service.business_days({key: values[0] for key, values in query.items()})
+
+        requests = data.get("requests", [])
+        if not isinstance(requests, list):
+            raise QueryError("'requests' mora biti seznam")
+        return {"results": [self.service.business_days(request) for request in requests]}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Lokalni strežnik za poizvedbe o praznikih")
+    parser.add_argument("--host", default="127.0.0.1", help="naslov (privzeto samo localhost)")
+    parser.add_argument("--port", type=int, default=8765, help="vrata")
+    parser.add_argument("--holidays", default="./assets/holidays.txt",
+                        help="datoteka s prazniki")
+    args = parser.parse_args()
+
+    store = HolidayStore(holidays_file=args.holidays, use_snapshot=True)
+    if not store.report.ok:
+        print(store.report.summary(), file=sys.stderr)
+
+    server = HolidayHTTPServer(HolidayService(store), args.host, args.port)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,9 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The application imports its modules as "core.*", like main.py does;
+# the root holds server.py
+sys.path.insert(0, os.path.join(ROOT, "app"))
+sys.path.insert(0, ROOT)
@@ -0,0 +1,56 @@
+import datetime
+import io
+
+import pytest
+
+from core import batch
+from core.batch import (FLAG_BUSINESS, FLAG_HOLIDAY, FLAG_SUNDAY, FLAG_TODAY,
+                        DateClassifier, run_classify)
+from core.holiday_store import HolidayStore
+
+TODAY = datetime.date(2025, 6, 2)
+
+VALUES = ["2025-01-01", "2025-06-01", "2025-06-02", "2025-06-03", "9999-12-31",
+          "0001-01-01", "2025-04-21"]
+EXPECTED = [FLAG_HOLIDAY, FLAG_SUNDAY, FLAG_BUSINESS | FLAG_TODAY, FLAG_BUSINESS,
+            FLAG_BUSINESS, FLAG_HOLIDAY, FLAG_HOLIDAY]
+
+
+@pytest.fixture
+def holidays_file(tmp_path):
+    path = tmp_path / "holidays.txt"
+    path.write_text("01.01|Y\nEASTER+1|Y\n", encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture(params=["numpy", "python"])
+def classifier(request, holidays_file, monkeypatch):
+    if request.param == "numpy":
+        if batch.np is None:
+            pytest.skip("numpy ni nameščen")
+    else:
+        monkeypatch.setattr(batch, "np", None)
+    return DateClassifier(HolidayStore(holidays_file), TODAY)
+
+
+def test_classify_chunk(classifier):
+    assert classifier.classify_chunk(VALUES) == EXPECTED
+
+
+def test_dates_outside_datetime_range_are_errors(classifier):
+    values = ["0000-01-01", "2025-06-01", "-001-01-01", "2025-13-01"]
+    if batch.np is not None:
+        # Without the invalid month the chunk takes the vectorized path
+        assert classifier.classify_chunk(values[:3]) == [None, FLAG_SUNDAY, None]
+        assert classifier.classify_chunk(values[:1]) == [None]
+    assert classifier.classify_chunk(values) == [None, FLAG_SUNDAY, None, None]
+
+
+def test_run_classify_reports_errors_per_row(holidays_file):
+    output = io.StringIO()
+    count = run_classify(io.StringIO("0000-01-01\n2025-01-01\n"), output, holidays_file)
+    assert count == 2
+    lines = output.getvalue().splitlines()
+    assert lines[1] == "0000-01-01\terror\terror\terror\terror"
+    assert all(len(line.split("\t")) == 5 for line in lines)
+    assert lines[2].startswith("2025-01-01\t1\t0\t0")
@@ -0,0 +1,99 @@
+import datetime
+import random
+import threading
+
+import pytest
+
+from core.business_days import BusinessCalendar
+from core.holiday_store import HolidayStore
+
+HOLIDAYS = """01.01|Y
+02.01|Y
+EASTER+1|Y
+01.05|Y
+25.12|Y
+26.12|Y
+24.06.2026|N
+"""
+
+
+@pytest.fixture
+def store(tmp_path):
+    path = tmp_path / "holidays.txt"
+    path.write_text(HOLIDAYS, encoding="utf-8")
+    return HolidayStore(str(path))
+
+
+def _is_business(store, date, weekend=(6,)):
+    return date.weekday() not in weekend and not store.is_holiday(date.day, date.month, date.year)
+
+
+def _naive_count(store, start, end, weekend=(6,)):
+    if end < start:
+        return -_naive_count(store, end, start, weekend)
+    days = (start + datetime.timedelta(days=i) for i in range((end - start).days))
+    return sum(_is_business(store, date, weekend) for date in days)
+
+
+def _naive_add(store, date, n, weekend=(6,)):
+    step = datetime.timedelta(days=1 if n > 0 else -1)
+    while n:
+        date += step
+        if _is_business(store, date, weekend):
+            n -= 1 if n > 0 else -1
+    return date
+
+
+@pytest.mark.parametrize("weekend", [(6,), (5, 6)])
+def test_count_and_add_match_naive_loops(store, weekend):
+    business = BusinessCalendar(store, weekend)
+    rng = random.Random(1)
+    for _ in range(300):
+        start = datetime.date(2020, 1, 1) + datetime.timedelta(days=rng.randint(0, 3000))
+        end = start + datetime.timedelta(days=rng.randint(-400, 400))
+        assert business.count_business_days(start, end) == _naive_count(store, start, end,
+                                                                         weekend)
+        n = rng.randint(-60, 60)
+        assert business.add_business_days(start, n) == _naive_add(store, start, n, weekend)
+
+
+def test_next_business_day_skips_holidays_and_sundays(store):
+    business = BusinessCalendar(store)
+    # Wed 31.12.2025 -> 01.01 and 02.01 are holidays -> Sat 03.01.2026
+    assert business.next_business_day(datetime.date(2025, 12, 31)) == datetime.date(2026, 1, 3)
+    # Sat 04.04.2026 -> Sunday, then Easter Monday 06.04 -> Tue 07.04
+    assert business.next_business_day(datetime.date(2026, 4, 4)) == datetime.date(2026, 4, 7)
+    assert business.add_business_days(datetime.date(2026, 4, 7), 0) == datetime.date(2026, 4, 7)
+
+
+def test_tables_follow_holiday_reloads(store, tmp_path):
+    business = BusinessCalendar(store)
+    day = datetime.date(2026, 6, 23)
+    assert business.count_business_days(day, day + datetime.timedelta(days=3)) == 2
+    (tmp_path / "holidays.txt").write_text(HOLIDAYS.replace("24.06.2026|N\n", ""),
+                                           encoding="utf-8")
+    store.reload()
+    assert business.count_business_days(day, day + datetime.timedelta(days=3)) == 3
+
+
+def test_concurrent_callers_get_consistent_answers(store):
+    business = BusinessCalendar(store)
+    starts = [datetime.date(1900 + 7 * i, 3, 1) for i in range(40)]
+    expected = {start: _naive_count(store, start, start + datetime.timedelta(days=120))
+                for start in starts}
+    failures = []
+
+    def worker(seed):
+        rng = random.Random(seed)
+        for _ in range(200):
+            start = rng.choice(starts)
+            count = business.count_business_days(start, start + datetime.timedelta(days=120))
+            if count != expected[start]:
+                failures.append((start, count))
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not failures
@@ -0,0 +1,90 @@
+import calendar
+import datetime
+
+import pytest
+
+from core.holiday_rules import (HolidayRule, RuleSet, easter_sunday, expand_rule, format_rule,
+                                nth_weekday, parse_rule)
+from core.holiday_store import HolidayStore
+
+# Western Easter Sundays, including the earliest (22.03) and latest (25.04) possible dates
+KNOWN_EASTERS = [
+    datetime.date(1818, 3, 22), datetime.date(1943, 4, 25), datetime.date(2000, 4, 23),
+    datetime.date(2008, 3, 23), datetime.date(2019, 4, 21), datetime.date(2024, 3, 31),
+    datetime.date(2025, 4, 20), datetime.date(2026, 4, 5), datetime.date(2038, 4, 25),
+    datetime.date(2285, 3, 22),
+]
+
+
+@pytest.mark.parametrize("easter", KNOWN_EASTERS)
+def test_easter_sunday_known_dates(easter):
+    assert easter_sunday(easter.year) == easter
+
+
+def test_easter_sunday_is_a_sunday_in_range():
+    for year in range(1583, 3000):
+        easter = easter_sunday(year)
+        assert easter.weekday() == 6
+        assert datetime.date(year, 3, 22) <= easter <= datetime.date(year, 4, 25)
+
+
+def _naive_nth_weekday(year, month, weekday, n):
+    days = [day for day in range(1, calendar.monthrange(year, month)[1] + 1)
+            if datetime.date(year, month, day).weekday() == weekday]
+    if n > 0:
+        return days[n - 1] if n <= len(days) else None
+    return days[n] if -n <= len(days) else None
+
+
+def test_nth_weekday_matches_naive_loop():
+    for year in (1900, 2023, 2024, 2100):
+        for month in range(1, 13):
+            for weekday in range(7):
+                for n in (1, 2, 3, 4, 5, -1, -2, -5):
+                    assert (nth_weekday(year, month, weekday, n)
+                            == _naive_nth_weekday(year, month, weekday, n)), (year, month,
+                                                                              weekday, n)
+
+
+@pytest.mark.parametrize("text, rule", [
+    ("EASTER", HolidayRule("easter")),
+    ("EASTER+1", HolidayRule("easter", offset=1)),
+    ("easter-2", HolidayRule("easter", offset=-2)),
+    ("2.NED.05", HolidayRule("weekday", n=2, weekday=6, month=5)),
+    ("L.PON.05", HolidayRule("weekday", n=-1, weekday=0, month=5)),
+    ("-2.ČET.11", HolidayRule("weekday", n=-2, weekday=3, month=11)),
+])
+def test_parse_and_format_rule(text, rule):
+    assert parse_rule(text) == rule
+    assert parse_rule(format_rule(rule)) == rule
+
+
+@pytest.mark.parametrize("text", ["EASTER+X", "0.PON.05", "6.PON.05", "1.XYZ.05", "1.PON.13",
+                                  "1.PON"])
+def test_invalid_rules(text):
+    with pytest.raises(ValueError):
+        parse_rule(text)
+
+
+def test_expand_rule_at_the_ends_of_the_calendar():
+    assert expand_rule(HolidayRule("easter", offset=1), 2025) == (4, 21)
+    assert expand_rule(HolidayRule("easter", offset=-50), 2025) == (3, 1)
+    # Offsets that leave the year (or datetime's range) have no date
+    assert expand_rule(HolidayRule("easter", offset=-200), 2025) is None
+    assert expand_rule(HolidayRule("easter", offset=300), 9999) is None
+    assert expand_rule(HolidayRule("weekday", n=5, weekday=0, month=2), 2025) is None
+
+
+def test_rule_set_and_store_lookups(tmp_path):
+    rules = [parse_rule("EASTER+1"), parse_rule("L.PON.05"), parse_rule("EASTER+49")]
+    assert RuleSet(rules).dates(2025) == {(4, 21), (5, 26), (6, 8)}
+
+    path = tmp_path / "holidays.txt"
+    path.write_text("EASTER+1|Y\nL.PON.05|Y\n", encoding="utf-8")
+    store = HolidayStore(str(path))
+    for easter in KNOWN_EASTERS:
+        monday = easter + datetime.timedelta(days=1)
+        assert store.is_holiday(monday.day, monday.month, monday.year)
+        assert not store.is_holiday(easter.day, easter.month, easter.year)
+        last_monday = _naive_nth_weekday(easter.year, 5, 0, -1)
+        assert store.holidays_in_month(easter.year, 5) == {last_monday}
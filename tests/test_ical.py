@@ -0,0 +1,68 @@
+import datetime
+
+from core.errors import LoadReport
+from core.holiday_store import HolidayStore
+from core.ical import event_lines, iter_ical_lines
+
+CALENDAR = """BEGIN:VCALENDAR
+VERSION:2.0
+BEGIN:VEVENT
+DTSTART;VALUE=DATE:20250511
+RRULE:FREQ=YEARLY;BYMONTH=5;BYDAY=2SU;COUNT=3
+SUMMARY:Materinski dan
+END:VEVENT
+BEGIN:VEVENT
+DTSTART;VALUE=DATE:20250526
+RRULE:FREQ=YEARLY;BYMONTH=5;BYDAY=-1MO;UNTIL=20260601
+SUMMARY:Spominski dan
+END:VEVENT
+END:VCALENDAR
+"""
+
+EXPECTED = [
+    datetime.date(2025, 5, 11),
+    datetime.date(2025, 5, 26),
+    datetime.date(2026, 5, 10),
+    datetime.date(2026, 5, 25),
+    datetime.date(2027, 5, 9),
+]
+
+
+def _dates(store):
+    return list(store.holidays_between(datetime.date(2024, 1, 1), datetime.date(2029, 1, 1)))
+
+
+def test_byday_count_event_lines():
+    event = {"DTSTART": "20250511", "RRULE": "FREQ=YEARLY;BYMONTH=5;BYDAY=2SU;COUNT=3"}
+    assert list(event_lines(event)) == ["11.05.2025|N", "10.05.2026|N", "09.05.2027|N"]
+
+
+def test_byday_until_after_the_12th():
+    event = {"DTSTART": "20250526", "RRULE": "FREQ=YEARLY;BYMONTH=5;BYDAY=-1MO;UNTIL=20260601"}
+    assert list(event_lines(event)) == ["26.05.2025|N", "25.05.2026|N"]
+
+
+def test_import_reports_no_errors():
+    report = LoadReport()
+    lines = [line for _, line in iter_ical_lines(CALENDAR.splitlines(), report)]
+    assert report.ok, report.summary()
+    assert len(lines) == 5
+
+
+def test_byday_count_round_trip(tmp_path):
+    source = tmp_path / "prazniki.ics"
+    source.write_text(CALENDAR, encoding="utf-8")
+    store = HolidayStore(str(source))
+    assert store.report.ok, store.report.summary()
+    assert _dates(store) == EXPECTED
+
+    exported = tmp_path / "izvoz.ics"
+    exported.write_text("".join(store.export("ics", 2024, 2028)), encoding="utf-8")
+    again = HolidayStore(str(exported))
+    assert again.report.ok, again.report.summary()
+    assert _dates(again) == EXPECTED
+
+
+def test_open_ended_yearly_event_has_no_first_year():
+    event = {"DTSTART": "20250511", "RRULE": "FREQ=YEARLY;BYMONTH=5;BYDAY=2SU"}
+    assert list(event_lines(event)) == ["2.SUN.05|Y"]
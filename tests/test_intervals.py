@@ -0,0 +1,123 @@
+import datetime
+
+import pytest
+
+from core.holiday_store import HolidayStore
+from core.intervals import HolidayRange, IntervalIndex, format_range, parse_range
+
+
+def _days(first_year, last_year):
+    day = datetime.date(first_year, 1, 1)
+    while day.year <= last_year:
+        yield day
+        day += datetime.timedelta(days=1)
+
+
+def _naive_yearly(holiday_range, day):
+    """Check a yearly range by comparing (month, day) pairs."""
+    start = (holiday_range.start_month, holiday_range.start_day)
+    end = (holiday_range.end_month, holiday_range.end_day)
+    key = (day.month, day.day)
+    if start <= end:
+        return start <= key <= end
+    return key >= start or key <= end
+
+
+def _naive_one_time(holiday_range, day):
+    r = holiday_range
+    return (datetime.date(r.start_year, r.start_month, r.start_day) <= day
+            <= datetime.date(r.end_year, r.end_month, r.end_day))
+
+
+def _naive(ranges, day):
+    return any(_naive_yearly(r, day) if r.yearly else _naive_one_time(r, day) for r in ranges)
+
+
+RANGES = [
+    parse_range("24.12-02.01", "Y"),    # Wraps over the new year
+    parse_range("28.02-01.03", "Y"),    # Spans 29.02 in leap years only
+    parse_range("29.02-03.03", "Y"),    # Starts on a day most years lack
+    parse_range("20.02-29.02", "Y"),    # Ends on a day most years lack
+    parse_range("30.12.2024-03.01.2025", "N"),
+    parse_range("27.02.2023-01.03.2024", "N"),
+]
+
+
+@pytest.mark.parametrize("holiday_range", RANGES, ids=format_range)
+def test_single_range_matches_naive_check(holiday_range):
+    index = IntervalIndex([holiday_range])
+    for day in _days(2022, 2026):
+        assert index.is_holiday(day.day, day.month, day.year) == _naive([holiday_range], day), day
+
+
+def test_merged_ranges_match_naive_check():
+    index = IntervalIndex(RANGES)
+    for day in _days(2022, 2026):
+        assert index.is_holiday(day.day, day.month, day.year) == _naive(RANGES, day), day
+    for year in range(2022, 2027):
+        for month in range(1, 13):
+            expected = {day.day for day in _days(year, year)
+                        if day.month == month and _naive(RANGES, day)}
+            assert index.holidays_in_month(year, month) == expected, (year, month)
+
+
+def test_yearly_ordinals_skip_29_february_in_common_years():
+    index = IntervalIndex([parse_range("28.02-01.03", "Y")])
+    assert [datetime.date.fromordinal(o) for o in index.yearly_ordinals(2024)] == [
+        datetime.date(2024, 2, 28), datetime.date(2024, 2, 29), datetime.date(2024, 3, 1)]
+    assert [datetime.date.fromordinal(o) for o in index.yearly_ordinals(2025)] == [
+        datetime.date(2025, 2, 28), datetime.date(2025, 3, 1)]
+    assert [datetime.date.fromordinal(o) for o in index.yearly_ordinals(2100)] == [
+        datetime.date(2100, 2, 28), datetime.date(2100, 3, 1)]
+
+
+def test_next_and_previous_one_time_across_the_year_end():
+    index = IntervalIndex([parse_range("30.12.2024-03.01.2025", "N")])
+    first = datetime.date(2024, 12, 30).toordinal()
+    last = datetime.date(2025, 1, 3).toordinal()
+    assert index.next_one_time(first - 10) == first
+    assert index.next_one_time(datetime.date(2024, 12, 31).toordinal()) == first + 2
+    assert index.next_one_time(last) is None
+    assert index.previous_one_time(last + 10) == last
+    assert index.previous_one_time(first) is None
+    assert list(index.one_time_ordinals(first - 1, last + 2)) == list(range(first, last + 1))
+
+
+@pytest.mark.parametrize("entry", ["24.12-02.01|Y", "29.02-03.03|Y", "30.12.2024-03.01.2025|N"])
+def test_format_round_trip(entry):
+    assert format_range(parse_range(*entry.split("|"))) == entry
+
+
+@pytest.mark.parametrize("date_part, flag", [
+    ("24.12-02.01", "N"),
+    ("30.12.2024-03.01.2025", "Y"),
+    ("03.01.2025-30.12.2024", "N"),
+    ("29.02.2025-01.03.2025", "N"),
+    ("30.02-01.03", "Y"),
+    ("24.12-02.01.2025", "N"),
+    ("24.12", "Y"),
+])
+def test_invalid_ranges(date_part, flag):
+    with pytest.raises(ValueError):
+        parse_range(date_part, flag)
+
+
+def test_store_lookups_over_31_december_and_29_february(tmp_path):
+    path = tmp_path / "holidays.txt"
+    path.write_text("".join(format_range(r) + "\n" for r in RANGES), encoding="utf-8")
+    store = HolidayStore(str(path))
+    assert set(store.ranges) == set(RANGES)
+    for day in _days(2022, 2026):
+        assert store.is_holiday(day.day, day.month, day.year) == _naive(RANGES, day), day
+    assert (list(store.holidays_between(datetime.date(2024, 12, 29), datetime.date(2025, 1, 5)))
+            == [datetime.date(2024, 12, d) for d in range(29, 32)]
+            + [datetime.date(2025, 1, d) for d in range(1, 4)])
+    assert store.holidays_in_month(2025, 2) == set(range(20, 29))
+    # 27.02.2023-01.03.2024 covers the whole of February 2024
+    assert store.holidays_in_month(2024, 2) == set(range(1, 30))
+    assert store.holidays_in_month(2023, 2) == set(range(20, 29))
+
+
+def test_holiday_range_yearly_flag():
+    assert HolidayRange(24, 12, 2, 1).yearly
+    assert not HolidayRange(30, 12, 3, 1, 2024, 2025).yearly
@@ -0,0 +1,107 @@
+import calendar
+import datetime
+
+from core.holiday_store import HolidayStore
+from core.month_view import (CELL_EMPTY, CELL_HOLIDAY, CELL_NORMAL, CELL_SUNDAY, CELL_TODAY,
+                             DAY_HOLIDAY, DAY_SATURDAY, DAY_SUNDAY, DAY_TODAY, WEEKS,
+                             MonthViewCache, build_month_view, month_flags, month_shape)
+
+
+def _store(tmp_path, text="01.01|Y\n25.12|Y\nEASTER+1|Y\n"):
+    path = tmp_path / "holidays.txt"
+    path.write_text(text, encoding="utf-8")
+    return HolidayStore(str(path))
+
+
+def test_month_shape_matches_calendar_monthrange():
+    for year in list(range(1, 40)) + list(range(1890, 2110)) + list(range(9960, 10000)):
+        for month in range(1, 13):
+            assert month_shape(year, month) == calendar.monthrange(year, month), (year, month)
+
+
+def test_month_flags_match_datetime():
+    holidays = {1, 15, 31}
+    for year, month in ((2024, 2), (2025, 3), (2025, 6), (2026, 11)):
+        first_weekday, length = month_shape(year, month)
+        flags = month_flags(first_weekday, length, holidays, today_day=15)
+        assert len(flags) == length
+        for day in range(1, length + 1):
+            weekday = datetime.date(year, month, day).weekday()
+            expected = ((DAY_SATURDAY if weekday == 5 else 0)
+                        | (DAY_SUNDAY if weekday == 6 else 0)
+                        | (DAY_HOLIDAY if day in holidays else 0)
+                        | (DAY_TODAY if day == 15 else 0))
+            assert flags[day - 1] == expected, (year, month, day)
+
+
+def test_build_month_view_cells(tmp_path):
+    store = _store(tmp_path)
+    today = datetime.date(2025, 4, 3)
+    view = build_month_view(2025, 4, store, today)
+    cells = [cell for week in view.cells for cell in week]
+    assert len(view.cells) == WEEKS and len(cells) == WEEKS * 7
+
+    first_weekday, length = calendar.monthrange(2025, 4)
+    assert cells[:first_weekday] == [(0, CELL_EMPTY)] * first_weekday
+    days = cells[first_weekday:first_weekday + length]
+    assert [day for day, _ in days] == list(range(1, length + 1))
+    assert all(cell == (0, CELL_EMPTY) for cell in cells[first_weekday + length:])
+
+    kinds = dict(days)
+    assert kinds[3] == CELL_TODAY
+    assert kinds[21] == CELL_HOLIDAY  # Easter Monday
+    assert kinds[20] == CELL_SUNDAY  # Easter Sunday itself is only a Sunday
+    assert kinds[22] == CELL_NORMAL
+    assert build_month_view(2025, 4, store, None).cells != view.cells
+
+
+def test_cache_hits_and_invalidates_on_reload(tmp_path):
+    store = _store(tmp_path)
+    cache = MonthViewCache(store, maxsize=3)
+    today = datetime.date(2025, 1, 10)
+    view = cache.get(2025, 12, today)
+    assert cache.get(2025, 12, today) is view
+    # A different "today" is a different view
+    assert cache.get(2025, 12, datetime.date(2025, 12, 24)) is not view
+
+    (tmp_path / "holidays.txt").write_text("01.01|Y\n25.12|Y\n26.12|Y\n", encoding="utf-8")
+    store.reload()
+    reloaded = cache.get(2025, 12, today)
+    assert reloaded is not view
+    assert dict(day for week in reloaded.cells for day in week)[26] == CELL_HOLIDAY
+
+
+def test_cache_is_bounded(tmp_path):
+    cache = MonthViewCache(_store(tmp_path), maxsize=3)
+    today = datetime.date(2025, 1, 10)
+    first = cache.get(2025, 1, today)
+    for month in range(2, 6):
+        cache.get(2025, month, today)
+    assert len(cache._views) == 3
+    assert cache.get(2025, 1, today) is not first
+
+
+def test_prefetch_builds_neighbours(tmp_path):
+    cache = MonthViewCache(_store(tmp_path))
+    today = datetime.date(2025, 1, 10)
+    try:
+        cache.prefetch(2025, 1, today)
+        cache.prefetch(1, 1, today)  # No month before 01.0001
+        cache._executor.submit(lambda: None).result()  # Wait for the queued builds
+        for year, month in ((2024, 12), (2025, 2), (1, 2)):
+            assert cache._lookup((year, month), today) is not None, (year, month)
+    finally:
+        cache.shutdown()
+
+
+def test_set_holiday_store_drops_cached_months(tmp_path):
+    cache = MonthViewCache(_store(tmp_path))
+    today = datetime.date(2025, 1, 10)
+    view = cache.get(2025, 12, today)
+    other = tmp_path / "other"
+    other.mkdir()
+    cache.set_holiday_store(_store(other, "24.12|Y\n"))
+    changed = cache.get(2025, 12, today)
+    assert changed is not view
+    kinds = dict(day for week in changed.cells for day in week)
+    assert kinds[24] == CELL_HOLIDAY and kinds[25] == CELL_NORMAL
@@ -0,0 +1,100 @@
+import threading
+
+import pytest
+
+from core.notes import NoteStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = NoteStore(str(tmp_path / "notes.db"))
+    yield store
+    store.close()
+
+
+def _hold_writer(store):
+    """Block the writer thread until the returned event is set."""
+    release = threading.Event()
+    store._writer.submit(release.wait)
+    return release
+
+
+def test_pending_edit_is_visible_before_the_commit(store, tmp_path):
+    release = _hold_writer(store)
+    try:
+        store.set_day(2025, 5, 1, ["Izlet", "  "])
+        # The month was never read: the query result is merged with the pending edit
+        assert store.day_notes(2025, 5, 1) == ("Izlet",)
+        assert store.month_notes(2025, 5) == {1: ("Izlet",)}
+
+        other = NoteStore(str(tmp_path / "notes.db"))
+        try:
+            assert other.month_notes(2025, 5) == {}  # Not on disk yet
+        finally:
+            other.close()
+    finally:
+        release.set()
+    store.flush()
+
+    reopened = NoteStore(str(tmp_path / "notes.db"))
+    try:
+        assert reopened.month_notes(2025, 5) == {1: ("Izlet",)}
+    finally:
+        reopened.close()
+
+
+def test_cached_month_is_updated_at_once(store):
+    assert store.month_notes(2025, 5) == {}
+    release = _hold_writer(store)
+    try:
+        store.set_day(2025, 5, 2, ["Sestanek"])
+        assert store.month_notes(2025, 5) == {2: ("Sestanek",)}
+        store.invalidate()  # Read again while the edit is still pending
+        assert store.month_notes(2025, 5) == {2: ("Sestanek",)}
+    finally:
+        release.set()
+    store.flush()
+    store.invalidate()
+    assert store.month_notes(2025, 5) == {2: ("Sestanek",)}
+
+
+def test_latest_of_several_pending_edits_wins(store):
+    release = _hold_writer(store)
+    try:
+        store.set_day(2025, 5, 3, ["Prvi"])
+        store.set_day(2025, 5, 3, ["Drugi", "Tretji"])
+        assert store.day_notes(2025, 5, 3) == ("Drugi", "Tretji")
+    finally:
+        release.set()
+    store.flush()
+    assert store._pending == {}
+    store.invalidate()
+    assert store.day_notes(2025, 5, 3) == ("Drugi", "Tretji")
+
+
+def test_pending_delete_hides_committed_notes(store):
+    store.set_day(2025, 5, 4, ["Rojstni dan"])
+    store.flush()
+    store.invalidate()
+    release = _hold_writer(store)
+    try:
+        store.set_day(2025, 5, 4, [])
+        assert store.day_notes(2025, 5, 4) == ()
+        assert 4 not in store.month_notes(2025, 5)
+    finally:
+        release.set()
+    store.flush()
+    store.invalidate()
+    assert store.month_notes(2025, 5) == {}
+    assert store.take_errors() == []
+
+
+def test_commit_from_another_connection_drops_the_cache(store, tmp_path):
+    assert store.month_notes(2025, 6) == {}
+    other = NoteStore(str(tmp_path / "notes.db"))
+    try:
+        other.set_day(2025, 6, 1, ["Od drugod"])
+        other.flush()
+    finally:
+        other.close()
+    assert store.month_notes(2025, 6) == {1: ("Od drugod",)}
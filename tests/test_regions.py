@@ -0,0 +1,67 @@
+import datetime
+
+from core.holiday_store import HolidayStore
+from core.regions import RegionHolidays, RegionOverlay
+
+
+def _write(directory, name, text):
+    (directory / name).write_text(text, encoding="utf-8")
+
+
+def test_region_errors_are_collected_and_summarized(tmp_path):
+    _write(tmp_path, "gorenjska.txt", "01.01|Y\n32.01|Y\n")
+    _write(tmp_path, "primorska.txt", "15.08|Y\n")
+    regions = RegionHolidays.from_directory(str(tmp_path), max_workers=1)
+
+    assert regions.regions == ["gorenjska", "primorska"]
+    assert list(regions.errors) == ["gorenjska"]
+    summary = regions.summary()
+    assert summary.startswith("Pri nalaganju regij je bilo najdenih 1 napak:")
+    assert "Regija gorenjska: Napaka v vrstici 2: 32.01|Y" in summary
+    assert regions.is_holiday(1, 1, 2025, ["gorenjska"])
+
+
+def test_summary_is_empty_without_errors(tmp_path):
+    _write(tmp_path, "primorska.txt", "15.08|Y\n")
+    assert RegionHolidays.from_directory(str(tmp_path), max_workers=1).summary() == ""
+
+
+def _naive_next(source, date, limit=800):
+    for offset in range(1, limit):
+        day = date + datetime.timedelta(days=offset)
+        if source.is_holiday(day.day, day.month, day.year):
+            return day
+    return None
+
+
+def test_next_holiday_of_an_overlay(tmp_path):
+    regions_dir = tmp_path / "regije"
+    regions_dir.mkdir()
+    _write(regions_dir, "gorenjska.txt", "29.02|Y\n03.12|Y\n")
+    _write(regions_dir, "primorska.txt", "15.08|Y\n03.12|Y\n30.12.2025-02.01.2026|N\n")
+    regions = RegionHolidays.from_directory(str(regions_dir), max_workers=1)
+    _write(tmp_path, "holidays.txt", "01.01|Y\n25.12|Y\n")
+    base = HolidayStore(str(tmp_path / "holidays.txt"))
+
+    for selection, match in [(["gorenjska"], "any"), (["primorska"], "any"),
+                             (["gorenjska", "primorska"], "any"),
+                             (["gorenjska", "primorska"], "all"), ([], "any")]:
+        overlay = RegionOverlay(base, regions, selection, match)
+        day = datetime.date(2023, 11, 1)
+        while day < datetime.date(2026, 3, 1):
+            assert overlay.next_holiday(day) == _naive_next(overlay, day), (selection, match, day)
+            day += datetime.timedelta(days=7)
+
+    overlay = RegionOverlay(base, regions, ["gorenjska"])
+    assert overlay.next_holiday(datetime.date(2027, 2, 1)) == datetime.date(2027, 12, 3)
+    assert overlay.next_holiday(datetime.date(2028, 2, 1)) == datetime.date(2028, 2, 29)
+
+
+def test_next_holiday_without_base_holidays(tmp_path):
+    _write(tmp_path, "primorska.txt", "30.12.2025-02.01.2026|N\n")
+    regions = RegionHolidays.from_directory(str(tmp_path), max_workers=1)
+    assert regions.next_holiday(datetime.date(2020, 1, 1)) == datetime.date(2025, 12, 30)
+    assert regions.next_holiday(datetime.date(2026, 1, 1)) == datetime.date(2026, 1, 2)
+    assert regions.next_holiday(datetime.date(2026, 1, 2)) is None
+    assert regions.next_holiday(datetime.date(2020, 1, 1),
+                                before=datetime.date(2025, 12, 30)) is None
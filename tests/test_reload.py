@@ -0,0 +1,97 @@
+import datetime
+
+from core.holiday_store import HolidayStore
+from core.intervals import HolidayRange
+from core.holiday_rules import HolidayRule
+
+HOLIDAYS = """# Prazniki
+01.01|Y
+EASTER+1|Y
+24.12-31.12|Y
+27.10.2025|N
+"""
+
+
+def _write(path, text):
+    # A different size is enough for the stat signature to change
+    path.write_text(text, encoding="utf-8")
+
+
+def _store(tmp_path, use_snapshot):
+    path = tmp_path / "holidays.txt"
+    _write(path, HOLIDAYS)
+    if use_snapshot:
+        HolidayStore(str(path), use_snapshot=True)  # Writes the snapshot
+    store = HolidayStore(str(path), use_snapshot=use_snapshot)
+    return path, store
+
+
+def _check_removal(tmp_path, use_snapshot):
+    path, store = _store(tmp_path, use_snapshot)
+    assert store.is_holiday(21, 4, 2025)  # Easter Monday
+    assert store.is_holiday(28, 12, 2025)
+
+    _write(path, "01.01|Y\n27.10.2025|N\n02.01|Y\n")
+    change = store.check_for_changes()
+
+    assert any(isinstance(entry, HolidayRule) for entry in change.removed)
+    assert any(isinstance(entry, HolidayRange) for entry in change.removed)
+    assert (2, 1, None, True) in change.added
+    assert change.affects(2025, 4) and change.affects(2025, 12)
+    assert not store.is_holiday(21, 4, 2025)
+    assert not store.is_holiday(28, 12, 2025)
+    assert store.is_holiday(1, 1, 2030)
+    assert store.is_holiday(2, 1, 2030)
+    assert store.is_holiday(27, 10, 2025)
+
+
+def test_incremental_reload_removes_entries(tmp_path):
+    _check_removal(tmp_path, use_snapshot=False)
+
+
+def test_reload_after_snapshot_start_removes_entries(tmp_path):
+    _check_removal(tmp_path, use_snapshot=True)
+
+
+def test_reload_after_snapshot_start_then_incremental(tmp_path):
+    path, store = _store(tmp_path, use_snapshot=True)
+    _write(path, HOLIDAYS + "02.01|Y\n")
+    change = store.check_for_changes()
+    assert change.added == {(2, 1, None, True)} and not change.removed
+
+    _write(path, HOLIDAYS)
+    change = store.check_for_changes()
+    assert change.removed == {(2, 1, None, True)} and not change.added
+    assert not store.is_holiday(2, 1, 2026)
+    assert store.is_holiday(1, 1, 2026)
+
+
+def test_unchanged_lines_keep_the_state(tmp_path):
+    path, store = _store(tmp_path, use_snapshot=False)
+    version = store.version
+    _write(path, HOLIDAYS.replace("# Prazniki", "# Prazniki v Sloveniji"))
+    assert not store.check_for_changes()
+    assert store.version == version
+    assert store.holidays_in_month(2025, 10) == {27}
+    assert datetime.date(2025, 12, 24) in set(store.holidays_between(
+        datetime.date(2025, 12, 1), datetime.date(2026, 1, 1)))
+
+
+def test_repeated_malformed_line_is_reported_every_time(tmp_path):
+    path, store = _store(tmp_path, use_snapshot=False)
+    text = HOLIDAYS + "bad\n02.01|Y\nbad\n31.02|Y\n"
+    _write(path, text)
+    store.check_for_changes()
+
+    fresh = HolidayStore(str(path))
+    assert fresh.report.error_count == 3
+    assert store.report.error_count == fresh.report.error_count
+    assert store.errors == fresh.errors
+    assert [error.line_num for error in store.errors] == [6, 8, 9]
+    assert store.report.entries == fresh.report.entries
+    assert store.is_holiday(2, 1, 2026)
+
+    # Still reported after a reload that does not touch them
+    _write(path, text + "03.01|Y\n")
+    store.check_for_changes()
+    assert store.report.error_count == 3
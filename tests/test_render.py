@@ -0,0 +1,120 @@
+import datetime
+import struct
+import xml.etree.ElementTree as ET
+import zlib
+
+from core import theme
+from core.holiday_store import HolidayStore
+from core.render import (MONTH_PAGE_HEIGHT, MONTH_PAGE_WIDTH, YEAR_PAGE_HEIGHT, YEAR_PAGE_WIDTH,
+                         Page, iter_pages, layout_page, render_page, render_pages)
+
+SVG = "{http://www.w3.org/2000/svg}"
+
+
+def _store(tmp_path):
+    path = tmp_path / "holidays.txt"
+    path.write_text("01.05|Y\n02.05|Y\n", encoding="utf-8")
+    return HolidayStore(str(path)), str(path)
+
+
+def _decode_png(data):
+    """Read width, height and RGB rows of a PNG written by core.raster."""
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    offset, chunks = 8, []
+    while offset < len(data):
+        length, kind = struct.unpack(">I4s", data[offset:offset + 8])
+        body = data[offset + 8:offset + 8 + length]
+        crc, = struct.unpack(">I", data[offset + 8 + length:offset + 12 + length])
+        assert crc == zlib.crc32(kind + body) & 0xFFFFFFFF
+        chunks.append((kind, body))
+        offset += 12 + length
+    assert [kind for kind, _ in chunks] == [b"IHDR", b"IDAT", b"IEND"]
+    width, height, depth, color_type = struct.unpack(">IIBB", chunks[0][1][:10])
+    assert (depth, color_type) == (8, 2)
+
+    raw = zlib.decompress(chunks[1][1])
+    stride = width * 3
+    assert len(raw) == height * (stride + 1)
+    rows, previous = [], bytes(stride)
+    for y in range(height):
+        line = raw[y * (stride + 1):(y + 1) * (stride + 1)]
+        if line[0] == 0:
+            row = line[1:]
+        else:
+            assert line[0] == 2  # "Up"
+            row = bytes((a + b) & 0xFF for a, b in zip(line[1:], previous))
+        rows.append(row)
+        previous = row
+    return width, height, rows
+
+
+def _holiday_rects(items):
+    return [item for item in items if item[0] == "rect" and item[5] == theme.COLOR_HOLIDAY_BG]
+
+
+def test_month_svg(tmp_path):
+    store, path = _store(tmp_path)
+    page = Page(path, 2025, 5)
+    root = ET.fromstring(render_page(page, store, "svg"))
+    assert root.tag == SVG + "svg"
+    assert (root.get("width"), root.get("height")) == (str(MONTH_PAGE_WIDTH),
+                                                       str(MONTH_PAGE_HEIGHT))
+    texts = [element.text for element in root.iter(SVG + "text")]
+    assert "Maj 2025" in texts
+    assert [str(day) for day in range(1, 32)] == [t for t in texts if t.isdigit()]
+    # 1. and 2. May are holidays, the other days keep their own colors
+    fills = [element.get("fill") for element in root.iter(SVG + "rect")]
+    assert fills.count(theme.COLOR_HOLIDAY_BG) == 2
+    assert fills.count(theme.COLOR_SUNDAY_BG) == 4
+
+
+def test_month_png_matches_the_layout(tmp_path):
+    store, path = _store(tmp_path)
+    page = Page(path, 2025, 5)
+    width, height, rows = _decode_png(render_page(page, store, "png"))
+    assert (width, height) == (MONTH_PAGE_WIDTH, MONTH_PAGE_HEIGHT)
+
+    _, _, items = layout_page(page, store)
+    holiday_rects = _holiday_rects(items)
+    assert len(holiday_rects) == 2
+    for _, x, y, _, _, color in holiday_rects:
+        # The corner of a cell is never covered by its centered day number
+        assert rows[y + 1][(x + 1) * 3:(x + 2) * 3] == bytes.fromhex(color[1:])
+    assert rows[0][:3] == bytes.fromhex(theme.COLOR_SURFACE[1:])
+
+
+def test_year_page(tmp_path):
+    store, path = _store(tmp_path)
+    page = Page(path, 2025)
+    root = ET.fromstring(render_page(page, store, "svg"))
+    assert (root.get("width"), root.get("height")) == (str(YEAR_PAGE_WIDTH), str(YEAR_PAGE_HEIGHT))
+    texts = [element.text for element in root.iter(SVG + "text")]
+    assert texts.count("29") == 11  # February 2025 has 28 days
+    assert texts.count("31") == 7
+    assert all(name in texts for name in theme.MONTH_NAMES)
+
+    width, height, _ = _decode_png(render_page(page, store, "png"))
+    assert (width, height) == (YEAR_PAGE_WIDTH, YEAR_PAGE_HEIGHT)
+
+
+def test_today_is_highlighted(tmp_path):
+    store, path = _store(tmp_path)
+    page = Page(path, 2025, 5)
+    _, _, items = layout_page(page, store, today=datetime.date(2025, 5, 14))
+    assert sum(1 for item in items
+               if item[0] == "rect" and item[5] == theme.COLOR_TODAY_BG) == 1
+    _, _, items = layout_page(page, store, today=datetime.date(2025, 6, 14))
+    assert not any(item[0] == "rect" and item[5] == theme.COLOR_TODAY_BG for item in items)
+
+
+def test_render_pages_keeps_input_order(tmp_path):
+    store, path = _store(tmp_path)
+    pages = list(iter_pages({"": path, "site": path}, [2025], ("year", "month")))
+    assert len(pages) == 2 * 13
+    assert pages[0] == Page(path, 2025, 0, "") and pages[1] == Page(path, 2025, 1, "")
+    assert pages[13].filename("svg").startswith("site")
+
+    rendered = list(render_pages(pages, "svg", workers=1, chunk_size=5))
+    assert [page for page, _ in rendered] == pages
+    for page, data in rendered[:3]:
+        assert data == render_page(page, store, "svg")
@@ -0,0 +1,66 @@
+import asyncio
+import json
+
+import pytest
+
+from core.holiday_store import HolidayStore
+from core.service import HolidayService
+from server import HolidayHTTPServer
+
+
+async def _exchange(holidays_file, request: bytes):
+    server = HolidayHTTPServer(HolidayService(HolidayStore(holidays_file)), port=0,
+                               poll_interval=60)
+    await server.start()
+    try:
+        reader, writer = await asyncio.open_connection(server.host, server.port)
+        writer.write(request)
+        await writer.drain()
+        response = await asyncio.wait_for(reader.read(), 5)
+        writer.close()
+        return response
+    finally:
+        server._watcher.cancel()
+        server._server.close()
+        await server._server.wait_closed()
+
+
+def _status_and_payload(response: bytes):
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(body.decode("utf-8"))
+
+
+@pytest.fixture
+def holidays_file(tmp_path):
+    path = tmp_path / "holidays.txt"
+    path.write_text("01.01|Y\n", encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize("length", ["abc", "-5", "+5", "1_0", "²"])
+def test_invalid_content_length_is_bad_request(holidays_file, length):
+    request = (f"POST /holiday HTTP/1.1\r\nContent-Length: {length}\r\n\r\n"
+               '{"dates": []}').encode("utf-8")
+    status, payload = _status_and_payload(asyncio.run(_exchange(holidays_file, request)))
+    assert status == 400
+    assert "error" in payload
+
+
+def test_post_holiday(holidays_file):
+    body = b'{"dates": ["2025-01-01"]}'
+    request = (b"POST /holiday HTTP/1.1\r\nConnection: close\r\nContent-Length: "
+               + str(len(body)).encode() + b"\r\n\r\n" + body)
+    status, payload = _status_and_payload(asyncio.run(_exchange(holidays_file, request)))
+    assert status == 200
+    assert payload["results"][0]["holiday"] is True
+
+
+def test_large_batch_is_answered_off_the_loop(holidays_file, monkeypatch):
+    import server
+    monkeypatch.setattr(server, "INLINE_BODY_BYTES", 16)
+    body = b'{"dates": ["2025-01-01", "2025-01-02"]}'
+    request = (b"POST /holiday HTTP/1.1\r\nConnection: close\r\nContent-Length: "
+               + str(len(body)).encode() + b"\r\n\r\n" + body)
+    status, payload = _status_and_payload(asyncio.run(_exchange(holidays_file, request)))
+    assert status == 200
+    assert [result["holiday"] for result in payload["results"]] == [True, False]
@@ -0,0 +1,106 @@
+import datetime
+import os
+
+from core.holiday_store import HolidayIndex, HolidayStore
+from core.snapshot import BitmapIndex, snapshot_path
+
+HOLIDAYS = """01.01|Y
+29.02|Y
+EASTER+1|Y
+L.PON.05|Y
+24.12-02.01|Y
+27.10.2025-31.10.2025|N
+15.06.2031|N
+30.12.2024-03.01.2025|N
+"""
+
+
+def _write(tmp_path, text=HOLIDAYS):
+    path = tmp_path / "holidays.txt"
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def _days(first_year, last_year):
+    day = datetime.date(first_year, 1, 1)
+    while day.year <= last_year:
+        yield day
+        day += datetime.timedelta(days=1)
+
+
+def _assert_same(store, reference):
+    for day in _days(2023, 2032):
+        assert (store.is_holiday(day.day, day.month, day.year)
+                == reference.is_holiday(day.day, day.month, day.year)), day
+    for year in range(2023, 2033):
+        for month in range(1, 13):
+            assert (store.holidays_in_month(year, month)
+                    == reference.holidays_in_month(year, month)), (year, month)
+
+
+def test_snapshot_round_trip(tmp_path):
+    path = _write(tmp_path)
+    text_store = HolidayStore(path, use_snapshot=True)  # Parses and writes the snapshot
+    assert isinstance(text_store.state.index, HolidayIndex)
+    assert os.path.exists(snapshot_path(path))
+
+    mapped = HolidayStore(path, use_snapshot=True)
+    assert isinstance(mapped.state.index, BitmapIndex)
+    assert mapped.rules == text_store.rules
+    assert mapped.ranges == text_store.ranges
+    _assert_same(mapped, HolidayStore(path))
+
+
+def test_stale_snapshot_falls_back_to_the_text(tmp_path):
+    path = _write(tmp_path)
+    HolidayStore(path, use_snapshot=True)
+    stat = os.stat(path)
+
+    # Same size and modification time, different content: only the digest differs
+    changed = HOLIDAYS.replace("15.06.2031|N", "16.06.2031|N")
+    _write(tmp_path, changed)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    store = HolidayStore(path, use_snapshot=True)
+    assert isinstance(store.state.index, HolidayIndex)
+    assert store.is_holiday(16, 6, 2031) and not store.is_holiday(15, 6, 2031)
+    # The fallback rewrote the snapshot for the new content
+    assert isinstance(HolidayStore(path, use_snapshot=True).state.index, BitmapIndex)
+
+
+def test_corrupt_snapshot_falls_back_to_the_text(tmp_path):
+    path = _write(tmp_path)
+    HolidayStore(path, use_snapshot=True)
+    with open(snapshot_path(path), "r+b") as f:
+        f.truncate(20)
+
+    store = HolidayStore(path, use_snapshot=True)
+    assert isinstance(store.state.index, HolidayIndex)
+    _assert_same(store, HolidayStore(path))
+
+
+def test_snapshot_is_not_written_for_a_file_with_errors(tmp_path):
+    path = _write(tmp_path, HOLIDAYS + "32.01|Y\n")
+    store = HolidayStore(path, use_snapshot=True)
+    assert store.report.error_count == 1
+    assert not os.path.exists(snapshot_path(path))
+
+
+def test_text_and_calendar_files_get_separate_snapshots(tmp_path):
+    path = _write(tmp_path)
+    ics_path = tmp_path / "holidays.ics"
+    ics_path.write_text("BEGIN:VCALENDAR\nVERSION:2.0\nBEGIN:VEVENT\n"
+                        "DTSTART;VALUE=DATE:20250511\nSUMMARY:Materinski dan\n"
+                        "END:VEVENT\nEND:VCALENDAR\n", encoding="utf-8")
+    ics_path = str(ics_path)
+    assert snapshot_path(path) == path + ".snap"
+    assert snapshot_path(path) != snapshot_path(ics_path)
+
+    HolidayStore(path, use_snapshot=True)
+    HolidayStore(ics_path, use_snapshot=True)
+    text_store = HolidayStore(path, use_snapshot=True)
+    ics_store = HolidayStore(ics_path, use_snapshot=True)
+    assert isinstance(text_store.state.index, BitmapIndex)
+    assert isinstance(ics_store.state.index, BitmapIndex)
+    assert text_store.is_holiday(15, 6, 2031) and not ics_store.is_holiday(15, 6, 2031)
+    assert ics_store.is_holiday(11, 5, 2025) and not text_store.is_holiday(11, 5, 2025)
@@ -0,0 +1,12 @@
+import pytest
+
+from benchmarks.stress_reload import run_stress
+
+
+@pytest.mark.parametrize("use_snapshot", [False, True])
+def test_readers_never_see_a_mixed_state(tmp_path, use_snapshot):
+    result = run_stress(str(tmp_path), readers=4, duration=1.0, full_every=5,
+                        use_snapshot=use_snapshot)
+    assert not result.failures, "\n".join(result.failures[:10])
+    assert result.reloads > 5
+    assert result.reads > 0
@@ -0,0 +1,93 @@
+import datetime
+
+from core.holiday_store import HolidayStore
+
+HOLIDAYS = """01.01|Y
+02.01|Y
+25.12|Y
+26.12|Y
+29.02|Y
+EASTER+1|Y
+24.12-31.12|Y
+31.12.2024|N
+30.12.2026-03.01.2027|N
+"""
+
+
+def _store(tmp_path, text=HOLIDAYS):
+    path = tmp_path / "holidays.txt"
+    path.write_text(text, encoding="utf-8")
+    return HolidayStore(str(path))
+
+
+def _days(start, end):
+    day = start
+    while day < end:
+        yield day
+        day += datetime.timedelta(days=1)
+
+
+def _naive_holidays(store, start, end):
+    return [day for day in _days(start, end) if store.is_holiday(day.day, day.month, day.year)]
+
+
+def test_holidays_between_matches_a_day_loop(tmp_path):
+    store = _store(tmp_path)
+    for start, end in [(datetime.date(2023, 12, 20), datetime.date(2024, 1, 10)),
+                       (datetime.date(2024, 2, 27), datetime.date(2024, 3, 2)),
+                       (datetime.date(2025, 2, 27), datetime.date(2025, 3, 2)),
+                       (datetime.date(2026, 12, 1), datetime.date(2027, 2, 1)),
+                       (datetime.date(2020, 1, 1), datetime.date(2030, 1, 1))]:
+        assert list(store.holidays_between(start, end)) == _naive_holidays(store, start, end)
+
+
+def test_holidays_between_is_end_exclusive(tmp_path):
+    store = _store(tmp_path)
+    day = datetime.date(2025, 1, 1)
+    assert list(store.holidays_between(day, day)) == []
+    assert list(store.holidays_between(day, day + datetime.timedelta(days=1))) == [day]
+    assert list(store.holidays_between(day, datetime.date(2024, 1, 1))) == []
+
+
+def test_next_and_previous_match_a_day_loop(tmp_path):
+    store = _store(tmp_path)
+    for day in _days(datetime.date(2023, 12, 1), datetime.date(2027, 3, 1)):
+        expected_next = next(later for later in _days(day + datetime.timedelta(days=1),
+                                                      day + datetime.timedelta(days=400))
+                             if store.is_holiday(later.day, later.month, later.year))
+        assert store.next_holiday(day) == expected_next, day
+
+        earlier = day - datetime.timedelta(days=1)
+        while not store.is_holiday(earlier.day, earlier.month, earlier.year):
+            earlier -= datetime.timedelta(days=1)
+        assert store.previous_holiday(day) == earlier, day
+
+
+def test_next_and_previous_cross_the_year_end(tmp_path):
+    store = _store(tmp_path)
+    assert store.next_holiday(datetime.date(2025, 12, 31)) == datetime.date(2026, 1, 1)
+    assert store.previous_holiday(datetime.date(2026, 1, 1)) == datetime.date(2025, 12, 31)
+    assert store.next_holiday(datetime.date(2026, 1, 2)) == datetime.date(2026, 4, 6)  # Easter Monday
+    assert store.previous_holiday(datetime.date(2027, 1, 4)) == datetime.date(2027, 1, 3)
+
+
+def test_one_time_holidays_only(tmp_path):
+    store = _store(tmp_path, "31.12.2024|N\n30.12.2026-03.01.2027|N\n")
+    assert store.next_holiday(datetime.date(2020, 6, 1)) == datetime.date(2024, 12, 31)
+    assert store.next_holiday(datetime.date(2024, 12, 31)) == datetime.date(2026, 12, 30)
+    assert store.next_holiday(datetime.date(2027, 1, 1)) == datetime.date(2027, 1, 2)
+    assert store.next_holiday(datetime.date(2027, 1, 3)) is None
+    assert store.previous_holiday(datetime.date(2027, 6, 1)) == datetime.date(2027, 1, 3)
+    assert store.previous_holiday(datetime.date(2026, 12, 30)) == datetime.date(2024, 12, 31)
+    assert store.previous_holiday(datetime.date(2024, 12, 31)) is None
+    assert (list(store.holidays_between(datetime.date(2024, 1, 1), datetime.date(2028, 1, 1)))
+            == [datetime.date(2024, 12, 31)] + list(_days(datetime.date(2026, 12, 30),
+                                                          datetime.date(2027, 1, 4))))
+
+
+def test_empty_file_has_no_holidays(tmp_path):
+    store = _store(tmp_path, "")
+    day = datetime.date(2025, 6, 1)
+    assert store.next_holiday(day) is None
+    assert store.previous_holiday(day) is None
+    assert list(store.holidays_between(day, datetime.date(2026, 6, 1))) == []